@@ -0,0 +1,57 @@
+"""
+Times cross-site duplicate detection on synthetic processed jobs.
+
+Usage: python benchmarks/bench_dedupe.py [n_jobs ...]
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+
+from jobspy2.dedupe import dedupe_jobs
+
+SITES = ["linkedin", "indeed", "zip_recruiter", "glassdoor", "google"]
+VOCABULARY = [f"word{i}" for i in range(5_000)]
+
+
+def synthetic_jobs(n: int, duplicate_rate: float = 0.3, seed: int = 0) -> list[dict]:
+    """
+    Builds n jobs where duplicate_rate of them copy an earlier job on another site, with small edits
+    """
+    rng = random.Random(seed)
+    jobs: list[dict] = []
+    for i in range(n):
+        if jobs and rng.random() < duplicate_rate:
+            original = rng.choice(jobs)
+            words = original["description"].split()
+            words[rng.randrange(len(words))] = "edited"
+            jobs.append({
+                **original,
+                "site": rng.choice([site for site in SITES if site != original["site"]]),
+                "title": original["title"] + (" (Remote)" if rng.random() < 0.5 else ""),
+                "description": " ".join(words),
+            })
+            continue
+        jobs.append({
+            "site": rng.choice(SITES),
+            "title": f"Engineer {i}",
+            "company": f"Company {i % 500} Inc.",
+            "location": "Nairobi, Kenya",
+            "description": " ".join(rng.choices(VOCABULARY, k=rng.randint(150, 600))),
+        })
+    return jobs
+
+
+def main(sizes: list[int]) -> None:
+    print(f"{'jobs':>8} {'seconds':>8} {'kept':>8}")
+    for n in sizes:
+        jobs = synthetic_jobs(n)
+        start = time.perf_counter()
+        kept = dedupe_jobs(jobs)
+        print(f"{n:>8} {time.perf_counter() - start:>8.3f} {len(kept):>8}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1_000, 10_000])
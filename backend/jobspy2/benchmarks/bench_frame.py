@@ -0,0 +1,91 @@
+"""
+Compares the columnar JobFrameBuilder with the previous one-DataFrame-per-job assembly.
+
+Usage: python benchmarks/bench_frame.py [n_jobs ...]
+
+The legacy path is quadratic-ish in practice and is skipped above LEGACY_MAX jobs.
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+import pandas as pd
+
+from jobspy2 import _process_job_data
+from jobspy2.frame import JobFrameBuilder, job_columns
+from jobspy2.jobs import Compensation, CompensationInterval, Country, JobPost, JobType, Location
+
+LEGACY_MAX = 20_000
+SITES = ["linkedin", "indeed", "zip_recruiter", "glassdoor", "google"]
+
+
+def synthetic_jobs(n: int, seed: int = 0) -> list[dict]:
+    rng = random.Random(seed)
+    jobs = []
+    for i in range(n):
+        has_pay = rng.random() < 0.5
+        job = JobPost(
+            id=f"in-{i}",
+            title=f"Software Engineer {i % 97}",
+            company_name=f"Company {i % 311}",
+            job_url=f"https://example.com/jobs/{i}",
+            location=Location(city="Nairobi", state=None, country=Country.from_string("usa")),
+            description="Build things. " * rng.randint(5, 50),
+            job_type=[JobType.FULL_TIME] if rng.random() < 0.7 else None,
+            compensation=Compensation(
+                interval=CompensationInterval.YEARLY, min_amount=90000, max_amount=120000, currency="USD"
+            )
+            if has_pay
+            else None,
+            date_posted=date(2024, 1, 1) + timedelta(days=rng.randint(0, 60)),
+            emails=["jobs@example.com"] if rng.random() < 0.1 else None,
+            is_remote=rng.random() < 0.3,
+        )
+        job_data = job.model_dump()
+        job_data["site"] = SITES[i % len(SITES)]
+        jobs.append(_process_job_data(job_data, False, Country.USA))
+    return jobs
+
+
+def legacy_frame(jobs: list[dict]) -> pd.DataFrame:
+    jobs_dfs = [pd.DataFrame([job]) for job in jobs]
+    filtered_dfs = [df.dropna(axis=1, how="all") for df in jobs_dfs]
+    jobs_df = pd.concat(filtered_dfs, ignore_index=True)
+    desired_order = job_columns()
+    for column in desired_order:
+        if column not in jobs_df.columns:
+            jobs_df[column] = None
+    jobs_df = jobs_df[desired_order]
+    return jobs_df.sort_values(by=["site", "date_posted"], ascending=[True, False]).reset_index(drop=True)
+
+
+def columnar_frame(jobs: list[dict]) -> pd.DataFrame:
+    builder = JobFrameBuilder()
+    builder.extend(jobs)
+    return builder.build()
+
+
+def timed(fn, jobs: list[dict]) -> float:
+    start = time.perf_counter()
+    fn(jobs)
+    return time.perf_counter() - start
+
+
+def main(sizes: list[int]) -> None:
+    print(f"{'jobs':>8} {'legacy (s)':>12} {'columnar (s)':>13} {'speedup':>8}")
+    for n in sizes:
+        jobs = synthetic_jobs(n)
+        columnar = timed(columnar_frame, jobs)
+        if n > LEGACY_MAX:
+            print(f"{n:>8} {'skipped':>12} {columnar:>13.4f} {'-':>8}")
+            continue
+        legacy = timed(legacy_frame, jobs)
+        print(f"{n:>8} {legacy:>12.3f} {columnar:>13.4f} {legacy / columnar:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1_000, 10_000, 100_000])
@@ -0,0 +1,55 @@
+"""
+Measures the cold import cost of jobspy2 with `python -X importtime`, per usage scenario, and lists
+which heavy dependencies each scenario loads.
+
+Usage: python benchmarks/bench_import.py [runs]
+"""
+
+from __future__ import annotations
+
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = ["pandas", "numpy", "bs4", "tls_client", "markdownify", "regex", "asyncio"]
+
+SCENARIOS = {
+    "interpreter": "pass",
+    "import jobspy2": "import jobspy2",
+    "indeed scraper": "import jobspy2; jobspy2.SCRAPER_MAPPING[jobspy2.Site.INDEED]",
+    "all scrapers": "import jobspy2; [jobspy2.SCRAPER_MAPPING[site] for site in jobspy2.Site]",
+    "server": "import jobspy2.server",
+}
+
+
+def import_time(code: str) -> tuple[float, list[str]]:
+    """
+    Runs code in a fresh interpreter
+    :return: summed cumulative time of all top-level imports in seconds, heavy modules loaded by the code
+    """
+    probe = f"{code}\nimport sys\nprint(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", probe], capture_output=True, text=True, check=True
+    )
+    total_us = 0
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package, top-level imports are not indented
+        parts = line.split("|")
+        if len(parts) == 3 and not parts[2].startswith("  ") and parts[1].strip().isdigit():
+            total_us += int(parts[1])
+    loaded = [module for module in result.stdout.strip().split(",") if module]
+    return total_us / 1e6, loaded
+
+
+def main(runs: int) -> None:
+    print(f"{'scenario':<16} {'median s':>9} {'min s':>7}  heavy modules loaded")
+    for name, code in SCENARIOS.items():
+        timings = []
+        for _ in range(runs):
+            seconds, loaded = import_time(code)
+            timings.append(seconds)
+        print(f"{name:<16} {statistics.median(timings):>9.3f} {min(timings):>7.3f}  {', '.join(loaded) or '-'}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
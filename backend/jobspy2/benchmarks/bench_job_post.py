@@ -0,0 +1,111 @@
+"""
+Microbenchmark of building and post-processing JobPost objects, per 10k jobs.
+
+Usage: python benchmarks/bench_job_post.py [--jobs N] [--repeat N]
+
+Compares validated construction (JobPost(**fields)), model_construct and the trusted fast path of
+create_job_post (JobPost.from_trusted), then the batch validation of the trusted jobs, and the
+post-processing of scrape_jobs before (job.dict() and a Location rebuilt per job) and after
+(_job_data). For every case it reports the best time of the repeats, the time per 10k jobs and the
+memory blocks allocated and the peak traced memory of one run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+import tracemalloc
+import warnings
+from collections.abc import Callable
+from datetime import date
+from typing import Any
+
+from jobspy2 import _job_data, _process_job_data
+from jobspy2.jobs import Compensation, CompensationInterval, Country, JobPost, JobType, Location, validate_jobs
+
+
+def job_fields(i: int) -> dict[str, Any]:
+    """
+    Fields like those a scraper passes to create_job_post
+    """
+    return {
+        "id": f"in-{i}",
+        "title": f"Senior Software Engineer {i}",
+        "company_name": "Acme",
+        "company_url": "https://www.indeed.com/cmp/acme",
+        "job_url": f"https://www.indeed.com/viewjob?jk={i:016x}",
+        "location": Location(city="Austin", state="TX", country="US"),
+        "compensation": Compensation(
+            interval=CompensationInterval.YEARLY, min_amount=120000, max_amount=160000, currency="USD"
+        ),
+        "date_posted": date(2024, 1, 1),
+        "job_type": [JobType.FULL_TIME],
+        "description": "Build and run the job search platform. " * 50,
+        "emails": ["jobs@acme.example"],
+        "is_remote": False,
+        "company_industry": "Software",
+    }
+
+
+def legacy_job_data(job: JobPost) -> dict[str, Any]:
+    # post-processing before the fast path: a full dump, then a Location rebuilt for display
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        job_data = job.dict()
+    job_data["location"] = Location(**job_data["location"])
+    return job_data
+
+
+def measure(run: Callable[[], Any], repeat: int) -> tuple[float, int, int]:
+    """
+    :return: best seconds of repeat runs, blocks allocated and peak traced bytes of one run
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+    gc.collect()
+    tracemalloc.start()
+    before = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+    result = run()
+    after = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return best, after - before, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=10_000, help="jobs built per run")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per case, the best is reported")
+    args = parser.parse_args()
+
+    fields = [job_fields(i) for i in range(args.jobs)]
+    validated = [JobPost(**job) for job in fields]
+    trusted = [JobPost.from_trusted(job) for job in fields]
+    if trusted != validated:
+        raise SystemExit("from_trusted built different jobs than validation")
+
+    cases: list[tuple[str, Callable[[], Any]]] = [
+        ("JobPost(**fields)", lambda: [JobPost(**job) for job in fields]),
+        ("model_construct", lambda: [JobPost.model_construct(**job) for job in fields]),
+        ("from_trusted", lambda: [JobPost.from_trusted(job) for job in fields]),
+        ("validate_jobs", lambda: validate_jobs(trusted)),
+        (
+            "process dict()",
+            lambda: [_process_job_data(legacy_job_data(job), False, Country.USA) for job in validated],
+        ),
+        ("process _job_data", lambda: [_process_job_data(_job_data(job), False, Country.USA) for job in trusted]),
+    ]
+    print(f"{'case':>18} {'best s':>8} {'s/10k':>8} {'blocks':>9} {'peak MB':>8}")
+    for name, run in cases:
+        seconds, blocks, peak = measure(run, args.repeat)
+        print(f"{name:>18} {seconds:>8.3f} {seconds * 10_000 / args.jobs:>8.3f} {blocks:>9} {peak / 1024**2:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
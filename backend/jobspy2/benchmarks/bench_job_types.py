@@ -0,0 +1,84 @@
+"""
+Microbenchmark of extract_job_type against the keyword loop it replaced, per description.
+
+Usage: python benchmarks/bench_job_types.py [--descriptions N] [--words N] [--repeat N]
+
+Times the former loop, which lowercased the description again for every keyword of every JobType,
+the matcher per description and extract_job_types over the whole column, on synthetic descriptions
+of a few thousand characters. A fifth of them name a job type in a non-ASCII language, so both the
+ASCII and the full keyword tables are exercised.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from collections.abc import Callable
+from typing import Any
+
+from jobspy2.jobs import JobType
+from jobspy2.scrapers.utils import extract_job_type, extract_job_types
+
+WORDS = (  # noqa: SIM905
+    "we are hiring a senior engineer to build our platform with python and aws remote friendly team "
+    "benefits include health dental vision 401k equity paid leave hybrid office in austin"
+).split()
+ENDINGS = (" Full-time", " fulltime, contract to hire", " Internship", " Vollzeit", " 全职")
+
+
+def loop_job_type(description: str | None) -> list[JobType]:
+    # extract_job_type before the matcher
+    if not description:
+        return []
+    job_types: list[JobType] = []
+    for job_type in JobType:
+        if any(keyword.lower() in description.lower() for keyword in job_type.value):
+            job_types.append(job_type)
+    return job_types
+
+
+def best(run: Callable[[], Any], repeat: int) -> float:
+    """
+    :return: best seconds of repeat runs
+    """
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - started)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--descriptions", type=int, default=1_000, help="descriptions per run")
+    parser.add_argument("--words", type=int, default=600, help="words per description")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per case, the best is reported")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    descriptions = [
+        " ".join(rng.choice(WORDS) for _ in range(args.words)) + rng.choice(ENDINGS) for _ in range(args.descriptions)
+    ]
+    expected = [loop_job_type(description) for description in descriptions]
+    if [extract_job_type(description) for description in descriptions] != expected:
+        raise SystemExit("extract_job_type disagrees with the keyword loop")
+    if extract_job_types(descriptions) != expected:
+        raise SystemExit("extract_job_types disagrees with the keyword loop")
+
+    cases: list[tuple[str, Callable[[], Any]]] = [
+        ("keyword loop", lambda: [loop_job_type(description) for description in descriptions]),
+        ("extract_job_type", lambda: [extract_job_type(description) for description in descriptions]),
+        ("extract_job_types", lambda: extract_job_types(descriptions)),
+    ]
+    print(f"{'case':>18} {'best s':>8} {'us/desc':>8} {'speedup':>8}")
+    baseline = None
+    for name, run in cases:
+        seconds = best(run, args.repeat)
+        baseline = baseline or seconds
+        print(f"{name:>18} {seconds:>8.3f} {seconds / args.descriptions * 1e6:>8.1f} {baseline / seconds:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
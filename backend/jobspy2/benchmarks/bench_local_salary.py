@@ -0,0 +1,95 @@
+"""
+Benchmark of the currency pattern bank of extract_local_salary, per description.
+
+Usage: python benchmarks/bench_local_salary.py [--descriptions N] [--words N] [--repeat N]
+
+Times extract_local_salary on synthetic descriptions with the usual numbers of a job ad ("5+
+years", "401(k)", "1-2 days"). Descriptions without a salary are scanned to their end; they are
+timed with the CURRENCIES table cut down to its first 1 and 5 currencies and with the full table, to
+show that adding currencies does not slow the scan. Descriptions with a salary in one of several
+currencies and formats are timed with the full table. extract_salary, the "$" range parser still
+used for jobs in the US, is timed on both for reference.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from collections.abc import Callable
+from typing import Any
+
+from jobspy2 import salary
+from jobspy2.salary import extract_local_salary
+from jobspy2.scrapers.utils import extract_salary
+
+WORDS = (  # noqa: SIM905
+    "we are hiring a senior engineer to build our platform with python and aws remote friendly team "
+    "benefits include health dental vision equity paid leave hybrid office people the of and to for"
+).split()
+NUMBERS = ("5+ years", "401(k)", "since 2012", "100% remote", "24/7 support", "1-2 days", "3 to 5 years", "Q4 2024")
+SALARIES = (
+    "Salary: KES 80,000 - 120,000 per month.",
+    "£30,000 - £40,000 per annum.",
+    "Gehalt 50.000 € - 60.000 € brutto.",
+    "CTC ₹10-15 LPA.",
+    "$25 - $40 per hour.",
+)
+
+
+def description(rng: random.Random, words: int, pay: str | None = None) -> str:
+    parts = [rng.choice(WORDS) for _ in range(words)]
+    for number in rng.sample(NUMBERS, 6):
+        parts.insert(rng.randrange(len(parts)), number)
+    if pay:
+        parts.insert(rng.randrange(len(parts)), pay)
+    return " ".join(parts)
+
+
+def per_description(run: Callable[[str], Any], descriptions: list[str], repeat: int) -> float:
+    """
+    :return: best microseconds per description of repeat runs
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for text in descriptions:
+            run(text)
+        best = min(best, time.perf_counter() - started)
+    return best / len(descriptions) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--descriptions", type=int, default=2_000, help="descriptions per run")
+    parser.add_argument("--words", type=int, default=400, help="words per description")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per case, the best is reported")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    unpaid = [description(rng, args.words) for _ in range(args.descriptions)]
+    paid = [description(rng, args.words, SALARIES[i % len(SALARIES)]) for i in range(args.descriptions)]
+    if any(extract_local_salary(text)[0] is None for text in paid):
+        raise SystemExit("a salary was not found")
+
+    def row(name: str, run: Callable[[str], Any], with_salary: bool = True) -> None:
+        salary_us = f"{per_description(run, paid, args.repeat):>10.1f}" if with_salary else f"{'-':>10}"
+        print(f"{name:>32} {per_description(run, unpaid, args.repeat):>13.1f} {salary_us}")
+
+    print(f"{'case':>32} {'no salary us':>13} {'salary us':>10}")
+    row("extract_salary", extract_salary)
+    currencies = dict(salary.CURRENCIES)
+    try:
+        for size in (1, 5):
+            salary.CURRENCIES.clear()
+            salary.CURRENCIES.update(list(currencies.items())[:size])
+            salary._salary_bank.cache_clear()
+            row(f"extract_local_salary, {size} cur.", extract_local_salary, with_salary=False)
+    finally:
+        salary.CURRENCIES.update(currencies)
+        salary._salary_bank.cache_clear()
+    row(f"extract_local_salary, {len(currencies)} cur.", extract_local_salary)
+
+
+if __name__ == "__main__":
+    main()
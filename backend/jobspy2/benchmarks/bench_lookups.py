@@ -0,0 +1,72 @@
+"""
+Microbenchmark of the Country and JobType lookups against the linear scans they replaced.
+
+Usage: python benchmarks/bench_lookups.py [--calls N]
+
+Times Country.from_string and JobType.from_alias on the first, middle and last declared name of
+their enum, next to the former scan over every member. The scan grows with the position of the
+match, while the indexed lookups take the same time for every position.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+
+from jobspy2.jobs import Country, JobType
+
+
+def scan_country(country_str: str) -> Country | None:
+    # Country.from_string before the index
+    country_str = country_str.strip().lower()
+    for country in Country:
+        if country_str in country.value[0].split(","):
+            return country
+    return None
+
+
+def scan_job_type(alias: str) -> JobType | None:
+    # get_enum_from_job_type before the index
+    res = None
+    for job_type in JobType:
+        if alias in job_type.value:
+            res = job_type
+    return res
+
+
+def per_call(lookup: Callable[[str], object], value: str, calls: int) -> float:
+    """
+    :return: nanoseconds per call
+    """
+    started = time.perf_counter()
+    for _ in range(calls):
+        lookup(value)
+    return (time.perf_counter() - started) / calls * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=100_000, help="calls per lookup and name")
+    args = parser.parse_args()
+
+    countries = [country.value[0].split(",")[0] for country in Country]
+    job_types = [alias for job_type in JobType for alias in job_type.value]
+    cases = [
+        ("Country", countries, scan_country, Country.from_string),
+        ("JobType", job_types, scan_job_type, JobType.from_alias),
+    ]
+    print(f"{'lookup':>8} {'position':>9} {'name':>14} {'scan ns':>9} {'index ns':>9} {'speedup':>8}")
+    for name, values, scan, lookup in cases:
+        for position, value in (("first", values[0]), ("middle", values[len(values) // 2]), ("last", values[-1])):
+            if scan(value) is not lookup(value):
+                raise SystemExit(f"{name} lookups disagree on {value!r}")
+            scanned = per_call(scan, value, args.calls)
+            indexed = per_call(lookup, value, args.calls)
+            print(
+                f"{name:>8} {position:>9} {value[:14]:>14} {scanned:>9.0f} {indexed:>9.0f} {scanned / indexed:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
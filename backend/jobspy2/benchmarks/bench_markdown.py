@@ -0,0 +1,82 @@
+"""
+Benchmark of markdown_converter against markdownify, per description.
+
+Usage: python benchmarks/bench_markdown.py [--descriptions N] [--paragraphs N] [--repeated F] [--repeat N]
+
+Converts the descriptions of the board stand-in of boards.py, a few KB of paragraphs, a heading, a
+list and bold and italic text each, with markdownify, as markdown_converter did, and with
+html_to_markdown with a cold cache, so every description is converted. The last case runs
+markdown_converter on a scrape where a fraction of the descriptions repeat an earlier one, like the
+boilerplate of a company's postings, with the cache cleared before each run. All must give the same
+Markdown.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from collections.abc import Callable
+from typing import Any
+
+from boards import description_html
+from markdownify import markdownify
+
+from jobspy2.scrapers import markdown
+from jobspy2.scrapers.markdown import html_to_markdown
+from jobspy2.scrapers.utils import markdown_converter
+
+
+def cold(run: Callable[[str], Any]) -> Callable[[str], Any]:
+    def convert(html: str) -> Any:
+        markdown._cache.clear()
+        return run(html)
+
+    return convert
+
+
+def per_description(run: Callable[[str], Any], descriptions: list[str], repeat: int) -> float:
+    """
+    :return: best microseconds per description of repeat runs, with the cache cleared before each
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        markdown._cache.clear()
+        started = time.perf_counter()
+        for html in descriptions:
+            run(html)
+        best = min(best, time.perf_counter() - started)
+    return best / len(descriptions) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--descriptions", type=int, default=1_000, help="descriptions per run")
+    parser.add_argument("--paragraphs", type=int, default=6, help="paragraphs per description")
+    parser.add_argument("--repeated", type=float, default=0.3, help="fraction of descriptions repeating an earlier one")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case, the best is reported")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    unique = [description_html(i, args.paragraphs) for i in range(args.descriptions)]
+    scrape = [
+        rng.choice(unique[:i]) if i and rng.random() < args.repeated else unique[i] for i in range(args.descriptions)
+    ]
+    if [cold(html_to_markdown)(html) for html in unique] != [markdownify(html) for html in unique]:
+        raise SystemExit("html_to_markdown disagrees with markdownify")
+
+    cases: list[tuple[str, Callable[[str], Any], list[str]]] = [
+        ("markdownify", markdownify, unique),
+        ("html_to_markdown, cold", cold(html_to_markdown), unique),
+        (f"markdown_converter, {args.repeated:.0%} repeated", markdown_converter, scrape),
+    ]
+    print(f"{'case':>34} {'us/desc':>8} {'speedup':>8}")
+    baseline = None
+    for name, run, descriptions in cases:
+        micros = per_description(run, descriptions, args.repeat)
+        baseline = baseline or micros
+        print(f"{name:>34} {micros:>8.1f} {baseline / micros:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Benchmark of the batch salary extraction against extract_salary applied row by row.
+
+Usage: python benchmarks/bench_salary.py [--rows N] [--words N] [--repeat N]
+
+Builds a description column of synthetic job descriptions, half of them stating an hourly, monthly
+or yearly "$min - $max" range, and times extract_salary over each row, as scrape_jobs does, next to
+extract_salaries over the whole column, with and without enforce_annual_salary. Both must find the
+same salaries.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from collections.abc import Callable
+from typing import Any
+
+import pandas as pd
+
+from jobspy2 import extract_salaries, extract_salary
+
+WORDS = (  # noqa: SIM905
+    "we are hiring a senior engineer to build our platform with python and aws remote friendly team "
+    "benefits include health dental vision 401k equity paid leave hybrid office in austin"
+).split()
+
+
+def pay_range(rng: random.Random) -> str:
+    kind = rng.randrange(4)
+    if kind == 0:
+        return f" Pay: ${rng.randint(15, 90)} - ${rng.randint(90, 200)} per hour."
+    if kind == 1:
+        return f" Salary ${rng.randint(60, 150)}k-{rng.randint(150, 250)}k."
+    if kind == 2:
+        return f" ${rng.randint(3000, 9000):,} – ${rng.randint(9000, 20000):,} monthly."  # noqa: RUF001
+    return f" Base salary ${rng.randint(60000, 150000):,}.00 - ${rng.randint(150000, 900000):,}.00."
+
+
+def description(rng: random.Random, words: int) -> str:
+    text = " ".join(rng.choice(WORDS) for _ in range(words))
+    if rng.random() < 0.5:
+        middle = len(text) // 2
+        text = text[:middle] + pay_range(rng) + text[middle:]
+    return text
+
+
+def found(salaries: list[tuple[Any, ...]]) -> list[tuple[Any, ...]]:
+    return [tuple(None if pd.isna(value) else value for value in row) for row in salaries]
+
+
+def best(run: Callable[[], Any], repeat: int) -> float:
+    """
+    :return: best seconds of repeat runs
+    """
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - started)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000, help="descriptions in the column")
+    parser.add_argument("--words", type=int, default=300, help="words per description")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case, the best is reported")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    column = pd.Series([description(rng, args.words) for _ in range(args.rows)])
+
+    print(f"{'enforce_annual':>14} {'case':>16} {'best s':>8} {'us/row':>7} {'speedup':>8}")
+    for enforce in (False, True):
+        per_row = [extract_salary(text, enforce_annual_salary=enforce) for text in column]
+        batch = extract_salaries(column, enforce_annual_salary=enforce)
+        if found(list(batch.itertuples(index=False))) != per_row:
+            raise SystemExit("extract_salaries disagrees with extract_salary")
+
+        cases: list[tuple[str, Callable[[], Any]]] = [
+            ("extract_salary", lambda: [extract_salary(text, enforce_annual_salary=enforce) for text in column]),  # noqa: B023
+            ("extract_salaries", lambda: extract_salaries(column, enforce_annual_salary=enforce)),  # noqa: B023
+        ]
+        baseline = None
+        for name, run in cases:
+            seconds = best(run, args.repeat)
+            baseline = baseline or seconds
+            print(
+                f"{enforce!s:>14} {name:>16} {seconds:>8.3f} {seconds / args.rows * 1e6:>7.2f}"
+                f" {baseline / seconds:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
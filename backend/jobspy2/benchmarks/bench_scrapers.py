@@ -0,0 +1,114 @@
+"""
+Benchmarks every scraper and scrape_jobs end to end against the local board stand-in of boards.py,
+with no network access.
+
+Usage: python benchmarks/bench_scrapers.py [--results N] [--runs N] [--latency S] [--jitter S]
+    [--scenario NAME ...] [--fields COLUMN,...]
+
+Each scenario runs in a fresh process so its peak RSS is its own. For every scenario it reports the
+jobs per second over all runs, the p50 and p99 of the time per run and per search page, the requests
+served and the peak RSS. scrape_jobs interleaves the pages of all sites, so only its runs are timed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import math
+import multiprocessing
+import resource
+import statistics
+import sys
+import time
+from typing import Any
+
+from boards import BoardServer, local_boards
+
+SCENARIOS = ["linkedin", "indeed", "glassdoor", "zip_recruiter", "google", "scrape_jobs"]
+
+
+def percentile(values: list[float], q: float) -> float:
+    if len(values) < 2:
+        return values[0] if values else math.nan
+    return statistics.quantiles(values, n=100, method="inclusive")[round(q * 100) - 1]
+
+
+def run_scenario(
+    scenario: str, results: int, runs: int, latency: float, jitter: float, fields: list[str] | None = None
+) -> dict[str, Any]:
+    """
+    Runs one scenario in the current process
+    :return: measurements, see the module docstring
+    """
+    import jobspy2
+    from jobspy2.scrapers import Site
+
+    logging.disable(logging.INFO)
+
+    search = {
+        "search_term": "engineer",
+        "results_wanted": results,
+        "linkedin_fetch_description": True,
+        "fields": fields,
+    }
+    run_seconds: list[float] = []
+    page_seconds: list[float] = []
+    jobs = 0
+    server = BoardServer(jobs_per_board=max(results * 2, 100), latency=latency, jitter=jitter)
+    with server, local_boards(server):
+        for _ in range(runs):
+            started = time.perf_counter()
+            if scenario == "scrape_jobs":
+                jobs += len(jobspy2.scrape_jobs(site_name=list(Site), **search))
+            else:
+                # iter_pages of a fresh scraper, to time every page
+                scraper_input = jobspy2._build_scraper_input(site_name=scenario, **search)
+                scraper = jobspy2.SCRAPER_MAPPING[Site(scenario)](logger=logging.getLogger("bench"))
+                page_started = time.perf_counter()
+                for page in scraper.iter_pages(scraper_input):
+                    page_seconds.append(time.perf_counter() - page_started)
+                    jobs += len(page)
+                    page_started = time.perf_counter()
+            run_seconds.append(time.perf_counter() - started)
+    return {
+        "scenario": scenario,
+        "jobs": jobs,
+        "jobs_per_second": jobs / sum(run_seconds),
+        "run_p50": percentile(run_seconds, 0.5),
+        "run_p99": percentile(run_seconds, 0.99),
+        "page_p50": percentile(page_seconds, 0.5),
+        "page_p99": percentile(page_seconds, 0.99),
+        "requests": server.requests,
+        # kilobytes on Linux, bytes on macOS
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        / (1024 if sys.platform != "darwin" else 1024**2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--results", type=int, default=100, help="results_wanted of every scrape")
+    parser.add_argument("--runs", type=int, default=3, help="scrapes per scenario")
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.02, help="latency varies by up to this many seconds")
+    parser.add_argument("--scenario", action="append", choices=SCENARIOS, help="run only these scenarios")
+    parser.add_argument("--fields", type=lambda value: value.split(","), help="comma separated columns to scrape")
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    print(
+        f"{'scenario':>13} {'jobs':>6} {'jobs/s':>8} {'run p50':>8} {'run p99':>8} "
+        f"{'page p50':>9} {'page p99':>9} {'requests':>8} {'rss MB':>7}"
+    )
+    for scenario in args.scenario or SCENARIOS:
+        with context.Pool(1) as pool:
+            row = pool.apply(run_scenario, (scenario, args.results, args.runs, args.latency, args.jitter, args.fields))
+        print(
+            f"{row['scenario']:>13} {row['jobs']:>6} {row['jobs_per_second']:>8.1f} {row['run_p50']:>8.3f} "
+            f"{row['run_p99']:>8.3f} {row['page_p50']:>9.3f} {row['page_p99']:>9.3f} {row['requests']:>8} "
+            f"{row['peak_rss_mb']:>7.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,394 @@
+"""
+Local HTTP stand-in for every job board, serving synthetic responses in the formats the scrapers
+parse: LinkedIn search cards and job pages, Indeed GraphQL JSON, Glassdoor graph responses,
+ZipRecruiter jobs-app JSON and job pages, and Google search and async payloads.
+
+local_boards(server) sends the scrapers' requests to the stand-in: request URLs are rewritten from
+https://<host>/<path> to http://127.0.0.1:<port>/<host>/<path>, tls_client sessions are swapped for
+requests sessions since the stand-in speaks plain HTTP, and the production per-host pacing is lifted
+so the injected latency is the only network cost.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import re
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, quote, urlsplit
+
+CITIES = [("Austin", "TX"), ("Denver", "CO"), ("Seattle", "WA"), ("Boston", "MA"), ("Chicago", "IL")]
+TITLES = ["Software Engineer", "Data Scientist", "Backend Developer", "Site Reliability Engineer", "QA Analyst"]
+
+
+def description_html(i: int, paragraphs: int = 6) -> str:
+    """
+    :return: a job description of a few KB with the markup boards commonly use
+    """
+    body = "".join(
+        f"<p>Job {i} paragraph {p}: build <b>reliable</b> services with <i>Python</i> and SQL, "
+        f"mentor teammates and ship every week. Remote friendly, apply at jobs{i}@example.com.</p>"
+        for p in range(paragraphs)
+    )
+    items = "".join(f"<li>Requirement {r} for job {i}</li>" for r in range(8))
+    return f"<div><h2>About the role</h2>{body}<ul>{items}</ul><p>Salary: $90,000 - $140,000 per year</p></div>"
+
+
+class Board:
+    """
+    Synthetic listings of one board, total jobs in pages of page_size.
+    """
+
+    host = ""
+    page_size = 10
+
+    def __init__(self, total: int) -> None:
+        self.total = total
+
+    def page_range(self, page: int) -> range:
+        start = page * self.page_size
+        return range(start, min(start + self.page_size, self.total))
+
+    def last_page(self, page: int) -> bool:
+        return (page + 1) * self.page_size >= self.total
+
+    def respond(self, method: str, path: str, query: dict[str, list[str]], body: bytes) -> tuple[str, str]:
+        """
+        :return: content type and body of the response to a request
+        """
+        raise NotImplementedError
+
+
+class LinkedInBoard(Board):
+    host = "www.linkedin.com"
+
+    def card(self, i: int) -> str:
+        city, state = CITIES[i % len(CITIES)]
+        posted = date(2024, 5, 1) - timedelta(days=i % 30)
+        salary = (
+            f'<span class="job-search-card__salary-info">$9{i % 10},000 - $14{i % 10},000</span>' if i % 3 == 0 else ""
+        )
+        return (
+            '<li><div class="base-card base-search-card job-search-card">'
+            f'<a class="base-card__full-link" href="https://www.linkedin.com/jobs/view/role-at-acme-{i}?refId=x"></a>'
+            f'<div class="base-search-card__info"><h3 class="base-search-card__title">'
+            f'<span class="sr-only">{TITLES[i % len(TITLES)]} {i}</span></h3>'
+            f'<h4 class="base-search-card__subtitle"><a href="https://www.linkedin.com/company/acme-{i % 50}?trk=x">'
+            f"Acme {i % 50}</a></h4>"
+            f'<div class="base-search-card__metadata"><span class="job-search-card__location">{city}, {state}</span>'
+            f'{salary}<time class="job-search-card__listdate" datetime="{posted.isoformat()}">1 week ago</time>'
+            "</div></div></div></li>"
+        )
+
+    def job_page(self, i: int) -> str:
+        criteria = "".join(
+            f'<li><h3 class="description__job-criteria-subheader">{name}</h3>'
+            f'<span class="description__job-criteria-text description__job-criteria-text--criteria">{value}</span></li>'
+            for name, value in [
+                ("Seniority level", "Mid-Senior level"),
+                ("Employment type", "Full-time"),
+                ("Job function", "Engineering"),
+                ("Industries", "Software Development"),
+            ]
+        )
+        apply_url = quote(f"https://careers.example.com/jobs/{i}", safe="")
+        return (
+            "<html><body>"
+            f'<code id="applyUrl"><!--"https://www.linkedin.com/jobs/view/externalApply/{i}?url={apply_url}"--></code>'
+            f'<img class="artdeco-entity-image" data-delayed-url="https://media.example.com/{i}.png"/>'
+            f'<div class="show-more-less-html__markup relative">{description_html(i)}</div>'
+            f'<ul class="description__job-criteria-list">{criteria}</ul>'
+            "</body></html>"
+        )
+
+    def respond(self, method: str, path: str, query: dict[str, list[str]], body: bytes) -> tuple[str, str]:
+        if path.startswith("/jobs/view/"):
+            return "text/html", self.job_page(int(path.rsplit("/", 1)[-1]))
+        start = int(query.get("start", ["0"])[0])
+        return "text/html", "".join(self.card(i) for i in range(start, min(start + self.page_size, self.total)))
+
+
+class IndeedBoard(Board):
+    host = "apis.indeed.com"
+    page_size = 100
+
+    def job(self, i: int) -> dict[str, Any]:
+        city, state = CITIES[i % len(CITIES)]
+        published = time.mktime((date(2024, 5, 1) - timedelta(days=i % 30)).timetuple())
+        return {
+            "key": f"{i:016x}",
+            "title": f"{TITLES[i % len(TITLES)]} {i}",
+            "datePublished": int(published * 1000),
+            "description": {"html": description_html(i)},
+            "location": {"city": city, "admin1Code": state, "countryCode": "US"},
+            "compensation": {"interval": "YEAR", "min": 90000 + i, "max": 140000 + i, "currency": "USD"}
+            if i % 2 == 0
+            else None,
+            "attributes": [{"key": "CF3CP", "label": "Full-time", "type": "jobtype"}],
+            "employer": {
+                "name": f"Acme {i % 50}",
+                "relativeCompanyPageUrl": f"/cmp/Acme-{i % 50}",
+                "dossier": {
+                    "employerDetails": {
+                        "addresses": [f"{i} Main St, {city}"],
+                        "industry": "INFORMATION_TECHNOLOGY",
+                        "employeesLocalizedLabel": "1,001 to 5,000",
+                        "revenueLocalizedLabel": "$100M to $500M",
+                        "briefDescription": "Acme builds things.",
+                    },
+                    "images": {"squareLogoUrl": f"https://media.example.com/{i % 50}.png"},
+                    "links": {"corporateWebsite": f"https://acme{i % 50}.example.com"},
+                },
+            },
+            "recruit": {"viewJobUrl": f"https://careers.example.com/jobs/{i}"},
+        }
+
+    def respond(self, method: str, path: str, query: dict[str, list[str]], body: bytes) -> tuple[str, str]:
+        match = re.search(r'cursor: \\?"c(\d+)', json.loads(body)["query"])
+        page = int(match.group(1)) if match else 0
+        results = [{"job": self.job(i)} for i in self.page_range(page)]
+        cursor = None if self.last_page(page) else f"c{page + 1}"
+        return "application/json", json.dumps({
+            "data": {"jobSearch": {"results": results, "pageInfo": {"nextCursor": cursor}}}
+        })
+
+
+class GlassdoorBoard(Board):
+    host = "www.glassdoor.com"
+    page_size = 30
+
+    def listing(self, i: int) -> dict[str, Any]:
+        city, state = CITIES[i % len(CITIES)]
+        salary = {"payCurrency": "USD", "payPeriod": "ANNUAL", "payMin": 90000 + i, "payMax": 140000 + i}
+        return {
+            "jobview": {
+                "job": {"listingId": 1_000_000 + i, "jobTitleText": f"{TITLES[i % len(TITLES)]} {i}"},
+                "header": {
+                    "employerNameFromSearch": f"Acme {i % 50}",
+                    "employer": {"id": i % 50},
+                    "locationName": f"{city}, {state}",
+                    "locationType": "C",
+                    "ageInDays": i % 30,
+                    "salarySource": salary if i % 2 == 0 else None,
+                    "adOrderSponsorshipLevel": "STANDARD",
+                },
+                "overview": {"squareLogoUrl": f"https://media.example.com/{i % 50}.png"},
+            }
+        }
+
+    def respond(self, method: str, path: str, query: dict[str, list[str]], body: bytes) -> tuple[str, str]:
+        if path.endswith(".htm") and "findPopularLocationAjax" in path:
+            return "application/json", json.dumps([{"locationId": 1147401, "locationType": "C"}])
+        if path.endswith(".htm"):
+            return "text/html", '<script>window.gdGlobals = {"token": "local-csrf-token"};</script>'
+        operation = json.loads(body)[0]
+        if operation["operationName"] == "JobDetailQuery":
+            i = int(operation["variables"]["jl"]) - 1_000_000
+            return "application/json", json.dumps([
+                {"data": {"jobview": {"job": {"description": description_html(i)}}}}
+            ])
+        page = operation["variables"]["pageNumber"] - 1
+        cursors = [] if self.last_page(page) else [{"pageNumber": page + 2, "cursor": f"c{page + 2}"}]
+        listings = [self.listing(i) for i in self.page_range(page)]
+        return "application/json", json.dumps([
+            {"data": {"jobListings": {"jobListings": listings, "paginationCursors": cursors}}}
+        ])
+
+
+class ZipRecruiterBoard(Board):
+    host = "api.ziprecruiter.com"
+    page_size = 20
+
+    def job(self, i: int) -> dict[str, Any]:
+        city, state = CITIES[i % len(CITIES)]
+        return {
+            "listing_key": f"zr{i:08d}",
+            "name": f"{TITLES[i % len(TITLES)]} {i}",
+            "job_description": description_html(i, paragraphs=2),
+            "buyer_type": "ORGANIC",
+            "hiring_company": {"name": f"Acme {i % 50}"},
+            "job_country": "US",
+            "job_city": city,
+            "job_state": state,
+            "employment_type": "full_time",
+            "posted_time": f"{date(2024, 5, 1) - timedelta(days=i % 30)}T10:00:00Z",
+            "compensation_interval": "annual",
+            "compensation_min": 90000 + i,
+            "compensation_max": 140000 + i,
+            "compensation_currency": "USD",
+        }
+
+    def respond(self, method: str, path: str, query: dict[str, list[str]], body: bytes) -> tuple[str, str]:
+        if path.endswith("/event"):
+            return "application/json", "{}"
+        page = int(query.get("continue_from", ["0"])[0])
+        token = None if self.last_page(page) else str(page + 1)
+        return "application/json", json.dumps({"jobs": [self.job(i) for i in self.page_range(page)], "continue": token})
+
+
+class ZipRecruiterSite(Board):
+    """
+    Job pages of www.ziprecruiter.com, fetched for the full descriptions.
+    """
+
+    host = "www.ziprecruiter.com"
+
+    def respond(self, method: str, path: str, query: dict[str, list[str]], body: bytes) -> tuple[str, str]:
+        i = int(query["lvk"][0][2:])
+        model = json.dumps({"model": {"saveJobURL": f"/save?job_url=https://careers.example.com/jobs/{i}"}})
+        return "text/html", (
+            f'<html><body><div class="job_description">{description_html(i)}</div>'
+            '<section class="company_description"><p>Acme builds things.</p></section>'
+            f'<script type="application/json">{model}</script></body></html>'
+        )
+
+
+class GoogleBoard(Board):
+    host = "www.google.com"
+
+    def job_info(self, i: int) -> list[Any]:
+        city, state = CITIES[i % len(CITIES)]
+        info: list[Any] = [None] * 30
+        info[0] = f"{TITLES[i % len(TITLES)]} {i}"
+        info[1] = f"Acme {i % 50}"
+        info[2] = f"{city}, {state}, United States"
+        info[3] = [[f"https://careers.example.com/google/{i}"]]
+        info[12] = f"{i % 30 + 1} days ago"
+        info[19] = re.sub("<[^>]+>", " ", description_html(i, paragraphs=3)).replace("[", "(").replace("]", ")")
+        info[28] = f"g{i:08d}"
+        info[29] = ["end"]
+        return info
+
+    def respond(self, method: str, path: str, query: dict[str, list[str]], body: bytes) -> tuple[str, str]:
+        page = 0 if path == "/search" else int(query["fc"][0][1:])
+        cursor = "" if self.last_page(page) else f'<div jsname="Yust4d" data-x="1" data-async-fc="c{page + 1}"></div>'
+        if page == 0:
+            infos = "".join(
+                f'<script>AF_initDataCallback({{"520084652":{json.dumps(self.job_info(i))}}}]]]);</script>'
+                for i in self.page_range(page)
+            )
+            return "text/html", f"<html><body>{cursor}{infos}</body></html>"
+        items = [["x", json.dumps([[[{"520084652": self.job_info(i)}]]])] for i in self.page_range(page)]
+        return "text/plain", f")]}}'\n{cursor}{json.dumps([items])}"
+
+
+BOARDS: list[type[Board]] = [
+    LinkedInBoard,
+    IndeedBoard,
+    GlassdoorBoard,
+    ZipRecruiterBoard,
+    ZipRecruiterSite,
+    GoogleBoard,
+]
+
+
+class BoardServer:
+    """
+    Serves every board on 127.0.0.1 from a background thread, delaying each response by latency plus
+    or minus up to jitter seconds.
+    """
+
+    def __init__(self, jobs_per_board: int = 1_000, latency: float = 0.05, jitter: float = 0.02, seed: int = 0):
+        self.boards = {board.host: board(jobs_per_board) for board in BOARDS}
+        self.latency = latency
+        self.jitter = jitter
+        self.requests = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def address(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"{host}:{port}"
+
+    def __enter__(self) -> BoardServer:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def delay(self) -> float:
+        with self._lock:
+            self.requests += 1
+            return max(self.latency + self._random.uniform(-self.jitter, self.jitter), 0.0)
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                self.handle_board("GET")
+
+            def do_POST(self) -> None:
+                self.handle_board("POST")
+
+            def handle_board(self, method: str) -> None:
+                body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                parts = urlsplit(self.path)
+                host, _, path = parts.path.lstrip("/").partition("/")
+                board = server.boards.get(host)
+                time.sleep(server.delay())
+                if board is None:
+                    self.send_error(404)
+                    return
+                content_type, text = board.respond(method, "/" + path.lstrip("/"), parse_qs(parts.query), body)
+                payload = text.encode()
+                self.send_response(200)
+                self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        return Handler
+
+
+@contextmanager
+def local_boards(server: BoardServer) -> Iterator[None]:
+    """
+    Sends the requests of every scraper to server for the duration of the block
+    """
+    import requests.adapters
+
+    from jobspy2.scrapers import glassdoor, utils, ziprecruiter
+
+    original_send = requests.adapters.HTTPAdapter.send
+    original_limiter = utils.host_rate_limiter
+
+    def send(adapter: requests.adapters.HTTPAdapter, request: requests.PreparedRequest, **kwargs: Any) -> Any:
+        parts = urlsplit(request.url)
+        if parts.hostname in server.boards:
+            query = f"?{parts.query}" if parts.query else ""
+            request.url = f"http://{server.address}/{parts.hostname}{parts.path}{query}"
+        return original_send(adapter, request, **kwargs)
+
+    def plain_session(create_session: Callable[..., Any]) -> Callable[..., Any]:
+        return lambda **kwargs: create_session(**{**kwargs, "is_tls": False})
+
+    patched = [(module, module.create_session) for module in (glassdoor, ziprecruiter)]
+    requests.adapters.HTTPAdapter.send = send
+    utils.host_rate_limiter = utils.HostRateLimiter()
+    for module, create_session in patched:
+        module.create_session = plain_session(create_session)
+    try:
+        yield
+    finally:
+        requests.adapters.HTTPAdapter.send = original_send
+        utils.host_rate_limiter = original_limiter
+        for module, create_session in patched:
+            module.create_session = create_session
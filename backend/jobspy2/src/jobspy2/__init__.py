@@ -1,12 +1,26 @@
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import contextvars
+import importlib
+import inspect
 import logging
-
-import pandas as pd
-
-from .jobs import JobType, Location
-from .scrapers import Country, JobResponse, LinkedInExperienceLevel, SalarySource, ScraperInput, Site
+import os
+import queue
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from concurrent.futures import Executor, ThreadPoolExecutor, wait
+from contextlib import closing, contextmanager, nullcontext, suppress
+from typing import TYPE_CHECKING, Any
+
+from .dedupe import DuplicateDetector, DuplicateIndex
+from .frame import JobFrameBuilder, job_columns
+from .incremental import all_known, new_jobs
+from .jobs import CompensationInterval, JobPost, JobType, Location, validate_jobs
+from .metrics import ScrapeMetrics, SiteMetrics, use_metrics
+from .salary import extract_local_salary, salary_country
+from .salary import extract_salaries as extract_salaries
+from .scrapers import Country, LinkedInExperienceLevel, SalarySource, Scraper, ScraperInput, Site, SiteStatus
 from .scrapers.exceptions import (
     GlassdoorException as GlassdoorException,
 )
@@ -22,12 +36,24 @@ from .scrapers.exceptions import (
 from .scrapers.exceptions import (
     ZipRecruiterException as ZipRecruiterException,
 )
-from .scrapers.glassdoor import GlassdoorScraper
-from .scrapers.google import GoogleJobsScraper
-from .scrapers.indeed import IndeedScraper
-from .scrapers.linkedin import LinkedInScraper
 from .scrapers.utils import create_logger, extract_salary
-from .scrapers.ziprecruiter import ZipRecruiterScraper
+from .tracing import Tracer, span, use_tracer
+
+if TYPE_CHECKING:
+    import asyncio
+
+    import pandas as pd
+
+    from .cache import ResultCache
+    from .incremental import WatermarkStore
+    from .scrapers.glassdoor import GlassdoorScraper as GlassdoorScraper
+    from .scrapers.google import GoogleJobsScraper as GoogleJobsScraper
+    from .scrapers.indeed import IndeedScraper as IndeedScraper
+    from .scrapers.linkedin import LinkedInScraper as LinkedInScraper
+    from .scrapers.ziprecruiter import ZipRecruiterScraper as ZipRecruiterScraper
+
+    # a page of a site, or None and the error it failed with, if any, once the site is done
+    _SitePage = tuple[Site, list[JobPost] | None, BaseException | None]
 
 
 class JobTypeError(Exception):
@@ -38,13 +64,29 @@ class JobTypeError(Exception):
         super().__init__(self.message)
 
 
+class FieldsError(ValueError):
+    """Raised when requested fields are not output columns."""
+
+    def __init__(self, unknown: Iterable[str]):
+        self.message = f"Unknown fields: {', '.join(sorted(unknown))}"
+        super().__init__(self.message)
+
+
+class QueryError(ValueError):
+    """Raised when a batch query has keys that are not search arguments."""
+
+    def __init__(self, query_id: Any, keys: Iterable[str]):
+        self.message = f"Unknown keys in query {query_id!r}: {', '.join(sorted(keys))}"
+        super().__init__(self.message)
+
+
 def _get_enum_from_value(value_str: str | None) -> JobType | None:
     if not value_str:
         return None
-    for job_type in JobType:
-        if value_str in job_type.value:
-            return job_type
-    raise JobTypeError(value_str)
+    job_type = JobType.from_alias(value_str)
+    if job_type is None:
+        raise JobTypeError(value_str)
+    return job_type
 
 
 def _get_site_type(site_name: str | list[str] | Site | list[Site] | None) -> list[Site]:
@@ -58,6 +100,20 @@ def _get_site_type(site_name: str | list[str] | Site | list[Site] | None) -> lis
     return site_types
 
 
+def _get_fields(fields: Iterable[str] | None) -> frozenset[str] | None:
+    if fields is None:
+        return None
+    fields = frozenset(fields)
+    unknown = fields - {*job_columns(), "job_url_hyper"}
+    if unknown:
+        raise FieldsError(unknown)
+    return fields
+
+
+# output columns parsed from the description when a job has no compensation data
+SALARY_FIELDS = ("salary_source", "interval", "min_amount", "max_amount", "currency")
+
+
 def _convert_to_annual(job_data: dict) -> None:
     multipliers = {"hourly": 2080, "monthly": 12, "weekly": 52, "daily": 260}
     interval = job_data["interval"]
@@ -68,7 +124,9 @@ def _convert_to_annual(job_data: dict) -> None:
         job_data["interval"] = "yearly"
 
 
-def _process_job_data(job_data: dict, enforce_annual_salary: bool, country_enum: Country) -> dict:
+def _process_job_data(
+    job_data: dict, enforce_annual_salary: bool, country_enum: Country, fields: frozenset[str] | None = None
+) -> dict:
     job_url = job_data["job_url"]
     job_data["job_url_hyper"] = f'<a href="{job_url}">{job_url}</a>'
     job_data["company"] = job_data["company_name"]
@@ -79,8 +137,12 @@ def _process_job_data(job_data: dict, enforce_annual_salary: bool, country_enum:
     if job_data["emails"]:
         job_data["emails"] = ", ".join(job_data["emails"])
 
-    if job_data["location"]:
-        job_data["location"] = Location(**job_data["location"]).display_location()
+    location = job_data["location"]
+    job_country = None
+    if location:
+        location = location if isinstance(location, Location) else Location(**location)
+        job_country = location.country
+        job_data["location"] = location.display_location()
 
     compensation_obj = job_data.get("compensation")
     if compensation_obj and isinstance(compensation_obj, dict):
@@ -98,17 +160,558 @@ def _process_job_data(job_data: dict, enforce_annual_salary: bool, country_enum:
             and job_data["max_amount"]
         ):
             _convert_to_annual(job_data)
-    elif country_enum == Country.USA:
-        job_data["interval"], job_data["min_amount"], job_data["max_amount"], job_data["currency"] = extract_salary(
-            job_data["description"],
-            enforce_annual_salary=enforce_annual_salary,
-        )
+    elif fields is None or not fields.isdisjoint(SALARY_FIELDS):
+        # "$" ranges for jobs in the US, the currency pattern bank for the others
+        country = salary_country(country_enum, job_country)
+        salary: tuple[CompensationInterval | str | None, float | None, float | None, str | None]
+        if country is Country.USA:
+            salary = extract_salary(job_data["description"], enforce_annual_salary=enforce_annual_salary)
+        else:
+            salary = extract_local_salary(job_data["description"], country, enforce_annual_salary=enforce_annual_salary)
+        job_data["interval"], job_data["min_amount"], job_data["max_amount"], job_data["currency"] = salary
         job_data["salary_source"] = SalarySource.DESCRIPTION.value
 
     job_data["salary_source"] = job_data["salary_source"] if job_data.get("min_amount") else None
     return job_data
 
 
+# scraper modules import their own heavy dependencies (bs4, regex, tls_client), so each is imported
+# the first time its site is scraped
+_SCRAPER_CLASSES: dict[Site, tuple[str, str]] = {
+    Site.LINKEDIN: (".scrapers.linkedin", "LinkedInScraper"),
+    Site.INDEED: (".scrapers.indeed", "IndeedScraper"),
+    Site.ZIP_RECRUITER: (".scrapers.ziprecruiter", "ZipRecruiterScraper"),
+    Site.GLASSDOOR: (".scrapers.glassdoor", "GlassdoorScraper"),
+    Site.GOOGLE: (".scrapers.google", "GoogleJobsScraper"),
+}
+_LAZY_SCRAPERS = {class_name: site for site, (_, class_name) in _SCRAPER_CLASSES.items()}
+
+
+class ScraperMapping(dict):
+    """
+    Maps every site to its scraper class, importing the scraper's module on first lookup.
+    Entries can be overridden like in a plain dict.
+    """
+
+    def __missing__(self, site: Site) -> type[Scraper]:
+        module_name, class_name = _SCRAPER_CLASSES[site]
+        scraper_class: type[Scraper] = getattr(importlib.import_module(module_name, __name__), class_name)
+        self[site] = scraper_class
+        return scraper_class
+
+
+SCRAPER_MAPPING: dict[Site, type[Scraper]] = ScraperMapping()
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_SCRAPERS:
+        return SCRAPER_MAPPING[_LAZY_SCRAPERS[name]]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")  # noqa: TRY003
+
+
+def _build_scraper_input(
+    site_name: str | list[str] | Site | list[Site] | None = None,
+    search_term: str | None = None,
+    google_search_term: str | None = None,
+    location: str | None = None,
+    distance: int | None = 50,
+    is_remote: bool = False,
+    job_type: str | None = None,
+    easy_apply: bool | None = None,
+    results_wanted: int = 15,
+    country_indeed: str = "usa",
+    description_format: str = "markdown",
+    linkedin_fetch_description: bool | None = False,
+    linkedin_company_ids: list[int] | None = None,
+    linkedin_experience_levels: list[LinkedInExperienceLevel] | None = None,
+    offset: int | None = 0,
+    hours_old: int | None = None,
+    time_budget_seconds: float | None = None,
+    dedupe: bool = False,
+    prefetch_depth: int = 1,
+    fields: Iterable[str] | None = None,
+    logger: logging.Logger | None = None,
+    **kwargs: Any,
+) -> ScraperInput:
+    return ScraperInput(
+        site_type=_get_site_type(site_name),
+        country=Country.from_string(country_indeed),
+        search_term=search_term,
+        google_search_term=google_search_term,
+        location=location,
+        distance=distance,
+        is_remote=is_remote,
+        job_type=_get_enum_from_value(job_type),
+        easy_apply=easy_apply,
+        description_format=description_format,
+        linkedin_fetch_description=linkedin_fetch_description,
+        results_wanted=results_wanted,
+        linkedin_company_ids=linkedin_company_ids,
+        linkedin_experience_levels=linkedin_experience_levels,
+        offset=offset,
+        hours_old=hours_old,
+        deadline=time.monotonic() + time_budget_seconds if time_budget_seconds is not None else None,
+        duplicate_index=DuplicateIndex() if dedupe else None,
+        prefetch_depth=prefetch_depth,
+        fields=_get_fields(fields),
+        logger=logger,
+    )
+
+
+# keys of a batch query dict besides its "query_id"; enforce_annual_salary applies to the whole batch
+_QUERY_KEYS = frozenset(inspect.signature(_build_scraper_input).parameters) - {"kwargs"}
+
+
+def _create_scraper(
+    site: Site, scraper_input: ScraperInput, proxies: list[str] | str | None, ca_cert: str | None
+) -> Scraper:
+    site_logger = scraper_input.logger if scraper_input.logger else create_logger(site.value)
+    return SCRAPER_MAPPING[site](logger=site_logger, proxies=proxies, ca_cert=ca_cert)
+
+
+class ScraperPool:
+    """
+    Keeps idle scrapers per site so consecutive scrapes reuse their warm sessions, cookies and tokens.
+    A scraper is leased by one scrape at a time.
+    """
+
+    def __init__(self, proxies: list[str] | str | None = None, ca_cert: str | None = None) -> None:
+        self.proxies = proxies
+        self.ca_cert = ca_cert
+        self._idle: dict[Site, list[Scraper]] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def lease(self, site: Site, scraper_input: ScraperInput) -> Iterator[Scraper]:
+        """
+        Borrows an idle scraper for site, creating one if none is available
+        :param site:
+        :param scraper_input: input of the scrape, provides the logger
+        :return: scraper, returned to the pool when the block exits
+        """
+        with self._lock:
+            idle = self._idle.setdefault(site, [])
+            scraper = idle.pop() if idle else None
+        if scraper is None:
+            scraper = _create_scraper(site, scraper_input, self.proxies, self.ca_cert)
+        else:
+            scraper.logger = scraper_input.logger if scraper_input.logger else create_logger(site.value)
+        try:
+            yield scraper
+        finally:
+            with self._lock:
+                self._idle[site].append(scraper)
+
+    def idle_counts(self) -> dict[str, int]:
+        with self._lock:
+            return {site.value: len(idle) for site, idle in self._idle.items()}
+
+
+def _time_left(scraper_input: ScraperInput) -> float | None:
+    if scraper_input.deadline is None:
+        return None
+    return max(scraper_input.deadline - time.monotonic(), 0)
+
+
+def _site_status(site: Site, truncated: set[Site]) -> str:
+    return SiteStatus.TRUNCATED.value if site in truncated else SiteStatus.COMPLETED.value
+
+
+def _log_site_completed(site: Site, scraper: Scraper) -> None:
+    site_name_display = site.value.capitalize().replace("_", "")  # e.g. ZipRecruiter
+    scraper.logger.info(f"{site_name_display} scrape processing completed by scrape_site wrapper.")
+
+
+def _duplicate_detector(scraper_input: ScraperInput) -> DuplicateDetector | None:
+    if scraper_input.duplicate_index is None:
+        return None
+    return DuplicateDetector(index=scraper_input.duplicate_index)
+
+
+# set to validate every scraped page in one batch, to check the scrapers' output
+VALIDATE_JOBS_ENV = "JOBSPY2_VALIDATE_JOBS"
+
+
+def _job_data(job: JobPost) -> dict[str, Any]:
+    """
+    Field dict of a job like job.model_dump(), but keeping its location model for display and
+    copying only its compensation instead of dumping every value
+    """
+    job_data = dict(job.__dict__)
+    if job.compensation is not None:
+        job_data["compensation"] = dict(job.compensation.__dict__)
+    return job_data
+
+
+def _process_page(
+    site: Site,
+    page: list[JobPost],
+    enforce_annual_salary: bool,
+    country_enum: Country,
+    detector: DuplicateDetector | None = None,
+    site_metrics: SiteMetrics | None = None,
+    fields: frozenset[str] | None = None,
+) -> Iterator[dict[str, Any]]:
+    if os.environ.get(VALIDATE_JOBS_ENV):
+        page = validate_jobs(page)
+    for job in page:
+        with site_metrics.stage("postprocess") if site_metrics is not None else nullcontext():
+            job_data = _job_data(job)
+            job_data["site"] = site.value
+            job_data = _process_job_data(job_data, enforce_annual_salary, country_enum, fields)
+            duplicate = detector is not None and detector.is_duplicate(job_data)
+        if not duplicate:
+            yield job_data
+
+
+def _site_metrics(metrics: ScrapeMetrics | None, site: Site) -> SiteMetrics | None:
+    return metrics.site(site.value) if metrics is not None else None
+
+
+def _site_runner(metrics: ScrapeMetrics | None, tracer: Tracer | None, site: Site) -> Callable[..., Any]:
+    """
+    :return: calls a function with its arguments in the site's context, a copy of the caller's, so the
+        executor threads see its cassette, which binds the site's metrics and the tracer; calls must
+        not overlap
+    """
+    context = contextvars.copy_context()
+    if metrics is not None:
+        context.run(use_metrics, _site_metrics(metrics, site))
+    if tracer is not None:
+        context.run(use_tracer, tracer)
+    return context.run
+
+
+def _next_page(site_pages: Iterator[list[JobPost]], site: Site) -> list[JobPost] | None:
+    with span("page", site=site.value):
+        return next(site_pages, None)
+
+
+@contextmanager
+def _tracing(trace: str | os.PathLike[str] | None, name: str) -> Iterator[Tracer | None]:
+    """
+    Records the block as the root span of a new tracer, written to the trace file when the block exits
+    :return: tracer, None if trace is None
+    """
+    if trace is None:
+        yield None
+        return
+    tracer = Tracer()
+    try:
+        with tracer.span(name):
+            yield tracer
+    finally:
+        tracer.write(trace)
+
+
+def _record_run(
+    watermarks: WatermarkStore, key: str, new_ids: list[str], run_started: float, statuses: dict[str, str]
+) -> None:
+    # the last run only advances when every site completed, so truncated sites are covered next time
+    completed = SiteStatus.TRUNCATED.value not in statuses.values()
+    watermarks.record(key, new_ids, run_started if completed else None)
+
+
+def _stream_site(
+    site: Site,
+    scraper_input: ScraperInput,
+    proxies: list[str] | str | None,
+    ca_cert: str | None,
+    metrics: ScrapeMetrics | None,
+    pages: queue.Queue[_SitePage],
+    stop: threading.Event,
+    truncated: set[Site],
+) -> None:
+    """
+    Scrapes a site for iter_jobs, putting its pages on pages until it is done or stop is set
+    """
+    with span("site", site=site.value):
+        try:
+            scraper = _create_scraper(site, scraper_input, proxies, ca_cert)
+            with closing(scraper.iter_pages(scraper_input)) as site_pages:
+                while (page := _next_page(site_pages, site)) is not None:
+                    if metrics is not None:
+                        metrics.site(site.value).count("pages")
+                    pages.put((site, page, None))
+                    if stop.is_set() or all_known(page, scraper_input.known_ids):
+                        break
+        except Exception as e:
+            pages.put((site, None, e))
+            return
+        if scraper.truncated:
+            truncated.add(site)
+        _log_site_completed(site, scraper)
+    pages.put((site, None, None))
+
+
+async def _astream_site(
+    site: Site,
+    scraper_input: ScraperInput,
+    proxies: list[str] | str | None,
+    ca_cert: str | None,
+    metrics: ScrapeMetrics | None,
+    tracer: Tracer | None,
+    pages: asyncio.Queue[_SitePage],
+    truncated: set[Site],
+) -> None:
+    """
+    Scrapes a site for aiter_jobs one page at a time on the event loop's executor, putting its pages on
+    pages until it is done
+    """
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    run = _site_runner(metrics, tracer, site)
+    started = time.perf_counter()
+    try:
+        scraper = await loop.run_in_executor(None, run, _create_scraper, site, scraper_input, proxies, ca_cert)
+        site_pages = scraper.iter_pages(scraper_input)
+        try:
+            while (page := await loop.run_in_executor(None, run, _next_page, site_pages, site)) is not None:
+                if metrics is not None:
+                    metrics.site(site.value).count("pages")
+                await pages.put((site, page, None))
+                if all_known(page, scraper_input.known_ids):
+                    break
+        finally:
+            with suppress(ValueError):  # still running in the executor after a cancellation
+                site_pages.close()
+    except Exception as e:
+        await pages.put((site, None, e))
+        return
+    if scraper.truncated:
+        truncated.add(site)
+    _log_site_completed(site, scraper)
+    if tracer is not None:
+        # the site's requests run on executor threads, its span is on the event loop's
+        tracer.add("site", started, time.perf_counter(), {"site": site.value})
+    await pages.put((site, None, None))
+
+
+def _site_finished(site: Site, error: BaseException | None, statuses: dict[str, str], truncated: set[Site]) -> None:
+    """
+    Records the status of a site that is done, re-raising the error its scrape failed with
+    """
+    if error is not None:
+        raise error
+    statuses[site.value] = _site_status(site, truncated)
+
+
+def _page_jobs(
+    site: Site,
+    page: list[JobPost],
+    scraper_input: ScraperInput,
+    enforce_annual_salary: bool,
+    detector: DuplicateDetector | None,
+    metrics: ScrapeMetrics | None,
+    new_ids: list[str] | None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Processes the jobs of a page not known from earlier runs
+    :param new_ids: collects the ids of the jobs, None when not needed
+    """
+    for job_data in _process_page(
+        site,
+        new_jobs(page, scraper_input.known_ids),
+        enforce_annual_salary,
+        scraper_input.country,
+        detector,
+        _site_metrics(metrics, site),
+        scraper_input.fields,
+    ):
+        if new_ids is not None and job_data["id"]:
+            new_ids.append(job_data["id"])
+        yield job_data
+
+
+def iter_jobs(
+    site_name: str | list[str] | Site | list[Site] | None = None,
+    search_term: str | None = None,
+    google_search_term: str | None = None,
+    location: str | None = None,
+    distance: int | None = 50,
+    is_remote: bool = False,
+    job_type: str | None = None,
+    easy_apply: bool | None = None,
+    results_wanted: int = 15,
+    country_indeed: str = "usa",
+    proxies: list[str] | str | None = None,
+    ca_cert: str | None = None,
+    description_format: str = "markdown",
+    linkedin_fetch_description: bool | None = False,
+    linkedin_company_ids: list[int] | None = None,
+    linkedin_experience_levels: list[LinkedInExperienceLevel] | None = None,
+    offset: int | None = 0,
+    hours_old: int | None = None,
+    enforce_annual_salary: bool = False,
+    time_budget_seconds: float | None = None,
+    dedupe: bool = False,
+    site_status: dict[str, str] | None = None,
+    metrics: ScrapeMetrics | None = None,
+    tracer: Tracer | None = None,
+    watermarks: WatermarkStore | None = None,
+    prefetch_depth: int = 1,
+    fields: Iterable[str] | None = None,
+    logger: logging.Logger | None = None,
+    **kwargs: Any,
+) -> Iterator[dict[str, Any]]:
+    """
+    Simultaneously scrapes job data from multiple job sites, yielding every processed job as soon as
+    its search page has been parsed. Jobs of different sites are interleaved in arrival order.
+    Closing the iterator early stops the remaining scrapers after their current page.
+    :param time_budget_seconds: stop paginating and fetching details once the budget is spent, and stop
+        waiting for sites that are still busy
+    :param dedupe: drop jobs already yielded from another site, matched on normalized title, company
+        and city or on near-identical descriptions, and skip their detail fetches
+    :param site_status: filled with "completed" or "truncated" per site
+    :param metrics: filled per site with pages, requests, retries, bytes, HTTP latencies and the time
+        spent parsing, converting, validating and post-processing, see jobspy2.metrics
+    :param tracer: records site, page, job, request, markdown and construct spans, see jobspy2.tracing
+    :param watermarks: incremental mode, yield only jobs not returned by earlier runs of the same search,
+        with hours_old derived from its last complete run, see jobspy2.incremental
+    :param prefetch_depth: search pages requested ahead of the page being parsed and enriched, 0 to
+        request each page only once the previous one is processed
+    :param fields: output columns needed, None for all; the detail page fetches, markdown conversion,
+        email extraction and description salary parsing that only fill other columns are skipped, so
+        their keys may be None
+    :return: iterator of processed job dicts, including the "site" key
+    """
+    scraper_input = _build_scraper_input(
+        site_name=site_name,
+        search_term=search_term,
+        google_search_term=google_search_term,
+        location=location,
+        distance=distance,
+        is_remote=is_remote,
+        job_type=job_type,
+        easy_apply=easy_apply,
+        results_wanted=results_wanted,
+        country_indeed=country_indeed,
+        description_format=description_format,
+        linkedin_fetch_description=linkedin_fetch_description,
+        linkedin_company_ids=linkedin_company_ids,
+        linkedin_experience_levels=linkedin_experience_levels,
+        offset=offset,
+        hours_old=hours_old,
+        time_budget_seconds=time_budget_seconds,
+        dedupe=dedupe,
+        prefetch_depth=prefetch_depth,
+        fields=fields,
+        logger=logger,
+    )
+    run_started = time.time()
+    if watermarks is not None:
+        scraper_input, watermark_key = watermarks.prepare(scraper_input)
+    detector = _duplicate_detector(scraper_input)
+    statuses = site_status if site_status is not None else {}
+    statuses.update({site.value: SiteStatus.TRUNCATED.value for site in scraper_input.site_type})
+    truncated: set[Site] = set()
+    new_ids: list[str] = []
+
+    pages: queue.Queue[_SitePage] = queue.Queue()
+    stop = threading.Event()
+
+    executor = ThreadPoolExecutor()
+    try:
+        for site in scraper_input.site_type:
+            run = _site_runner(metrics, tracer, site)
+            executor.submit(run, _stream_site, site, scraper_input, proxies, ca_cert, metrics, pages, stop, truncated)
+        pending = len(scraper_input.site_type)
+        while pending:
+            try:
+                site, page, error = pages.get(timeout=_time_left(scraper_input))
+            except queue.Empty:  # time budget spent, unfinished sites stay truncated
+                break
+            if page is None:
+                pending -= 1
+                _site_finished(site, error, statuses, truncated)
+                continue
+            ids = new_ids if watermarks is not None else None
+            yield from _page_jobs(site, page, scraper_input, enforce_annual_salary, detector, metrics, ids)
+    finally:
+        stop.set()
+        executor.shutdown(wait=False)
+        if watermarks is not None:
+            _record_run(watermarks, watermark_key, new_ids, run_started, statuses)
+
+
+async def aiter_jobs(
+    proxies: list[str] | str | None = None,
+    ca_cert: str | None = None,
+    enforce_annual_salary: bool = False,
+    site_status: dict[str, str] | None = None,
+    metrics: ScrapeMetrics | None = None,
+    tracer: Tracer | None = None,
+    watermarks: WatermarkStore | None = None,
+    **kwargs: Any,
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Asyncio counterpart of iter_jobs, accepting the same arguments.
+    Every site advances one page at a time from the running event loop, so a worker thread of the
+    loop's executor is only held while a page is being fetched, and the per-host concurrency limits
+    of the shared sessions bound the requests of all concurrent scrapes.
+    :return: async iterator of processed job dicts, including the "site" key
+    """
+    import asyncio
+
+    scraper_input = _build_scraper_input(**kwargs)
+    run_started = time.time()
+    if watermarks is not None:
+        scraper_input, watermark_key = watermarks.prepare(scraper_input)
+    detector = _duplicate_detector(scraper_input)
+    statuses = site_status if site_status is not None else {}
+    statuses.update({site.value: SiteStatus.TRUNCATED.value for site in scraper_input.site_type})
+    truncated: set[Site] = set()
+    new_ids: list[str] = []
+    pages: asyncio.Queue[_SitePage] = asyncio.Queue()
+    tasks = [
+        asyncio.ensure_future(_astream_site(site, scraper_input, proxies, ca_cert, metrics, tracer, pages, truncated))
+        for site in scraper_input.site_type
+    ]
+    try:
+        pending = len(tasks)
+        while pending:
+            try:
+                site, page, error = pages.get_nowait()
+            except asyncio.QueueEmpty:
+                try:
+                    site, page, error = await asyncio.wait_for(pages.get(), _time_left(scraper_input))
+                except asyncio.TimeoutError:  # time budget spent, unfinished sites stay truncated
+                    break
+            if page is None:
+                pending -= 1
+                _site_finished(site, error, statuses, truncated)
+                continue
+            ids = new_ids if watermarks is not None else None
+            for job_data in _page_jobs(site, page, scraper_input, enforce_annual_salary, detector, metrics, ids):
+                yield job_data
+    finally:
+        for task in tasks:
+            task.cancel()
+        if watermarks is not None:
+            _record_run(watermarks, watermark_key, new_ids, run_started, statuses)
+
+
+async def ascrape_jobs(
+    hyperlinks: bool = False, metrics: bool = False, trace: str | os.PathLike[str] | None = None, **kwargs: Any
+) -> pd.DataFrame:
+    """
+    Asyncio counterpart of scrape_jobs, accepting the same arguments.
+    :return: pandas dataframe containing job data
+    """
+    site_status: dict[str, str] = {}
+    scrape_metrics = ScrapeMetrics() if metrics else None
+    builder = JobFrameBuilder(hyperlinks=hyperlinks, fields=kwargs.get("fields"))
+    with _tracing(trace, "ascrape_jobs") as tracer:
+        async for job_data in aiter_jobs(site_status=site_status, metrics=scrape_metrics, tracer=tracer, **kwargs):
+            builder.append(job_data)
+        jobs_df = builder.build()
+    jobs_df.attrs["site_status"] = site_status
+    if scrape_metrics is not None:
+        jobs_df.attrs["metrics"] = scrape_metrics.as_dict()
+    return jobs_df
+
+
 def scrape_jobs(
     site_name: str | list[str] | Site | list[Site] | None = None,
     search_term: str | None = None,
@@ -130,113 +733,239 @@ def scrape_jobs(
     offset: int | None = 0,
     hours_old: int | None = None,
     enforce_annual_salary: bool = False,
+    time_budget_seconds: float | None = None,
+    dedupe: bool = False,
+    metrics: bool = False,
+    trace: str | os.PathLike[str] | None = None,
+    cache: ResultCache | None = None,
+    watermarks: WatermarkStore | None = None,
+    prefetch_depth: int = 1,
+    fields: list[str] | None = None,
     logger: logging.Logger | None = None,
     **kwargs,
 ) -> pd.DataFrame:
     """
     Simultaneously scrapes job data from multiple job sites.
-    :return: pandas dataframe containing job data
+    :param time_budget_seconds: overall deadline; when it runs out the jobs collected so far are returned
+    :param dedupe: keep one row per job listed on several sites, see iter_jobs
+    :param prefetch_depth: search pages requested ahead of the page being processed, see iter_jobs
+    :param fields: columns to return, in the usual order; enrichment that only fills other columns is
+        skipped, see iter_jobs
+    :param metrics: collect per-site performance metrics into attrs["metrics"], see iter_jobs; empty
+        when the result comes from the cache
+    :param trace: write a Chrome trace-event JSON file of the scrape's spans to this path, to open in
+        Perfetto, see jobspy2.tracing
+    :param cache: answer repeated searches from this result cache; results with a truncated site are
+        not cached
+    :param watermarks: incremental mode, return only jobs not returned by earlier runs, see iter_jobs;
+        incremental searches bypass the cache
+    :return: pandas dataframe containing job data, with the per-site "completed"/"truncated" status in
+        attrs["site_status"], with a cache "fresh", "stale" or "miss" in attrs["cache"], and the metrics
+        in attrs["metrics"] if enabled
     """
-    SCRAPER_MAPPING = {
-        Site.LINKEDIN: LinkedInScraper,
-        Site.INDEED: IndeedScraper,
-        Site.ZIP_RECRUITER: ZipRecruiterScraper,
-        Site.GLASSDOOR: GlassdoorScraper,
-        Site.GOOGLE: GoogleJobsScraper,
-    }
-
-    job_type_enum = _get_enum_from_value(job_type)
-    country_enum = Country.from_string(country_indeed)
-    site_types = _get_site_type(site_name)
-
-    scraper_input = ScraperInput(
-        site_type=site_types,
-        country=country_enum,
+    search = dict(
+        site_name=site_name,
         search_term=search_term,
         google_search_term=google_search_term,
         location=location,
         distance=distance,
         is_remote=is_remote,
-        job_type=job_type_enum,
+        job_type=job_type,
         easy_apply=easy_apply,
+        results_wanted=results_wanted,
+        country_indeed=country_indeed,
         description_format=description_format,
         linkedin_fetch_description=linkedin_fetch_description,
-        results_wanted=results_wanted,
         linkedin_company_ids=linkedin_company_ids,
         linkedin_experience_levels=linkedin_experience_levels,
         offset=offset,
         hours_old=hours_old,
+        time_budget_seconds=time_budget_seconds,
+        dedupe=dedupe,
+        prefetch_depth=prefetch_depth,
+        fields=fields,
         logger=logger,
+        **kwargs,
     )
+    with _tracing(trace, "scrape_jobs") as tracer:
+        builder = JobFrameBuilder(hyperlinks=hyperlinks, fields=fields)
+        scrape_metrics = ScrapeMetrics() if metrics else None
+        if cache is None or watermarks is not None:
+            site_status: dict[str, str] = {}
+            builder.extend(
+                iter_jobs(
+                    proxies=proxies,
+                    ca_cert=ca_cert,
+                    enforce_annual_salary=enforce_annual_salary,
+                    site_status=site_status,
+                    metrics=scrape_metrics,
+                    tracer=tracer,
+                    watermarks=watermarks,
+                    **search,
+                )
+            )
+            jobs_df = builder.build()
+            jobs_df.attrs["site_status"] = site_status
+            if scrape_metrics is not None:
+                jobs_df.attrs["metrics"] = scrape_metrics.as_dict()
+            return jobs_df
+
+        from .cache import cache_key
+
+        columns = [*job_columns(), "job_url_hyper"]
+
+        def collect() -> dict[str, Any]:
+            statuses: dict[str, str] = {}
+            jobs = [
+                {column: job_data.get(column) for column in columns}
+                for job_data in iter_jobs(
+                    proxies=proxies,
+                    ca_cert=ca_cert,
+                    enforce_annual_salary=enforce_annual_salary,
+                    site_status=statuses,
+                    metrics=scrape_metrics,
+                    tracer=tracer,
+                    **search,
+                )
+            ]
+            return {"jobs": jobs, "site_status": statuses}
+
+        def complete(result: dict[str, Any]) -> bool:
+            return SiteStatus.TRUNCATED.value not in result["site_status"].values()
+
+        key = cache_key(_build_scraper_input(**search), enforce_annual_salary=enforce_annual_salary)
+        result, state = cache.fetch(key, collect, store=complete)
+        builder.extend(result["jobs"])
+        jobs_df = builder.build()
+        jobs_df.attrs["site_status"] = result["site_status"]
+        jobs_df.attrs["cache"] = state.value
+        if scrape_metrics is not None:
+            jobs_df.attrs["metrics"] = scrape_metrics.as_dict()
+        return jobs_df
+
+
+def _build_queries(queries: list[dict[str, Any] | ScraperInput], **kwargs: Any) -> tuple[list[Any], list[ScraperInput]]:
+    query_ids: list[Any] = []
+    scraper_inputs: list[ScraperInput] = []
+    for index, query in enumerate(queries):
+        if isinstance(query, ScraperInput):
+            query_ids.append(index)
+            scraper_inputs.append(query)
+        else:
+            query_args = {**kwargs, **query}
+            query_id = query_args.pop("query_id", index)
+            unknown = query_args.keys() - _QUERY_KEYS
+            if unknown:
+                raise QueryError(query_id, unknown)
+            query_ids.append(query_id)
+            scraper_inputs.append(_build_scraper_input(**query_args))
+    return query_ids, scraper_inputs
+
+
+def _batch_fields(scraper_inputs: list[ScraperInput]) -> frozenset[str] | None:
+    """
+    :return: the union of the queries' fields, None when there are no queries or one wants every column
+    """
+    if not scraper_inputs or any(scraper_input.fields is None for scraper_input in scraper_inputs):
+        return None
+    return frozenset().union(*(scraper_input.fields or () for scraper_input in scraper_inputs))
+
 
-    def scrape_site(site: Site) -> tuple[str, JobResponse]:
-        scraper_class = SCRAPER_MAPPING[site]
-        site_logger = logger if logger else create_logger(site.value)
-        scraper = scraper_class(logger=site_logger, proxies=proxies, ca_cert=ca_cert)
-        scraped_data: JobResponse = scraper.scrape(scraper_input)
-        site_name_display = site.value.capitalize().replace("_", "") # e.g. ZipRecruiter
-        site_logger.info(f"{site_name_display} scrape processing completed by scrape_site wrapper.")
-        return site.value, scraped_data
-
-    site_to_jobs_dict = {}
-    with ThreadPoolExecutor() as executor:
-        future_to_site = {executor.submit(scrape_site, site): site for site in scraper_input.site_type}
-        for future in as_completed(future_to_site):
-            site_value, scraped_data = future.result()
-            site_to_jobs_dict[site_value] = scraped_data
-
-    jobs_dfs = []
-    for site, job_response in site_to_jobs_dict.items():
-        for job in job_response.jobs:
-            job_data = job.dict()
-            job_data["site"] = site
-            processed_job = _process_job_data(job_data, enforce_annual_salary, country_enum)
-            jobs_dfs.append(pd.DataFrame([processed_job]))
-
-    if not jobs_dfs:
-        return pd.DataFrame()
-
-    # Filter out all-NA columns from each DataFrame before concatenation
-    filtered_dfs = [df.dropna(axis=1, how="all") for df in jobs_dfs]
-    jobs_df = pd.concat(filtered_dfs, ignore_index=True)
-
-    # Desired column order
-    desired_order = [
-        "id",
-        "site",
-        "job_url_hyper" if hyperlinks else "job_url",
-        "job_url_direct",
-        "title",
-        "company",
-        "location",
-        "date_posted",
-        "job_type",
-        "salary_source",
-        "interval",
-        "min_amount",
-        "max_amount",
-        "currency",
-        "is_remote",
-        "job_level",
-        "job_function",
-        "listing_type",
-        "emails",
-        "description",
-        "company_industry",
-        "company_url",
-        "company_logo",
-        "company_url_direct",
-        "company_addresses",
-        "company_num_employees",
-        "company_revenue",
-        "company_description",
+def run_queries(
+    query_ids: list[Any],
+    scraper_inputs: list[ScraperInput],
+    pool: ScraperPool,
+    executor: Executor,
+    dedupe: bool = True,
+    enforce_annual_salary: bool = False,
+) -> tuple[list[dict[str, Any]], dict[Any, dict[str, str]]]:
+    """
+    Runs every (query, site) scrape on executor with scrapers leased from pool, waiting at most until
+    the earliest deadline of the queries. Scrapes that have not started by then are cancelled; scrapes
+    that raise are logged and marked "failed" without affecting the others.
+    :param dedupe: keep only the first query's copy of a job id found by several queries
+    :return: processed job dicts with their "query_id", and the status of every query's sites as
+        {query_id: {site: status}}
+    """
+
+    def scrape_site(scraper_input: ScraperInput, site: Site) -> tuple[list[JobPost], bool]:
+        with pool.lease(site, scraper_input) as scraper:
+            scraper.truncated = False
+            jobs = scraper.scrape(scraper_input).jobs
+            _log_site_completed(site, scraper)
+            return jobs, scraper.truncated
+
+    futures = [
+        (query_id, scraper_input, site, executor.submit(scrape_site, scraper_input, site))
+        for query_id, scraper_input in zip(query_ids, scraper_inputs)
+        for site in scraper_input.site_type
     ]
+    deadline = min((si.deadline for si in scraper_inputs if si.deadline is not None), default=None)
+    wait([future for *_, future in futures], timeout=None if deadline is None else max(deadline - time.monotonic(), 0))
+
+    jobs: list[dict[str, Any]] = []
+    site_status: dict[Any, dict[str, str]] = {}
+    seen_ids: set[str] = set()
+    detectors = {id(scraper_input): _duplicate_detector(scraper_input) for scraper_input in scraper_inputs}
+    for query_id, scraper_input, site, future in futures:
+        statuses = site_status.setdefault(query_id, {})
+        if not future.done() or future.cancelled():
+            future.cancel()
+            statuses[site.value] = SiteStatus.TRUNCATED.value
+            continue
+        try:
+            page, was_truncated = future.result()
+        except Exception:
+            site_logger = scraper_input.logger if scraper_input.logger else create_logger(site.value)
+            site_logger.exception(f"query {query_id!r} failed")
+            statuses[site.value] = SiteStatus.FAILED.value
+            continue
+        statuses[site.value] = (SiteStatus.TRUNCATED if was_truncated else SiteStatus.COMPLETED).value
+        if dedupe:
+            page = [job for job in page if not job.id or job.id not in seen_ids]
+            seen_ids.update(job.id for job in page if job.id)
+        detector = detectors[id(scraper_input)]
+        for job_data in _process_page(
+            site, page, enforce_annual_salary, scraper_input.country, detector, fields=scraper_input.fields
+        ):
+            job_data["query_id"] = query_id
+            jobs.append(job_data)
+    return jobs, site_status
 
-    # Ensure all desired columns are present, adding missing ones as empty
-    for column in desired_order:
-        if column not in jobs_df.columns:
-            jobs_df[column] = None
 
-    # Reorder and sort the DataFrame
-    jobs_df = jobs_df[desired_order]
-    return jobs_df.sort_values(by=["site", "date_posted"], ascending=[True, False]).reset_index(drop=True)
+def scrape_jobs_batch(
+    queries: list[dict[str, Any] | ScraperInput],
+    max_workers: int = 8,
+    dedupe: bool = True,
+    hyperlinks: bool = False,
+    proxies: list[str] | str | None = None,
+    ca_cert: str | None = None,
+    enforce_annual_salary: bool = False,
+    **kwargs: Any,
+) -> pd.DataFrame:
+    """
+    Scrapes many searches in one call. Each query is a dict of scrape_jobs search arguments (merged
+    over kwargs, with an optional "query_id") or a ScraperInput; other keys raise QueryError. All (query, site) scrapes run on one pool of
+    max_workers threads and reuse warm scrapers through a ScraperPool.
+    :param queries: searches to run
+    :param max_workers: global cap on concurrent site scrapes
+    :param dedupe: keep only the first query's copy of a job id found by several queries
+    :return: pandas dataframe containing job data with a "query_id" column, and the status of every
+        query's sites in attrs["site_status"] as {query_id: {site: status}}, "failed" for the sites
+        of a query whose scrape raised
+    """
+    query_ids, scraper_inputs = _build_queries(queries, **kwargs)
+    pool = ScraperPool(proxies=proxies, ca_cert=ca_cert)
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        jobs, site_status = run_queries(
+            query_ids, scraper_inputs, pool, executor, dedupe=dedupe, enforce_annual_salary=enforce_annual_salary
+        )
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    builder = JobFrameBuilder(hyperlinks=hyperlinks, extra_columns=["query_id"], fields=_batch_fields(scraper_inputs))
+    builder.extend(jobs)
+    jobs_df = builder.build()
+    jobs_df.attrs["site_status"] = site_status
+    return jobs_df
@@ -0,0 +1,229 @@
+"""
+jobspy2.cache
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the on-disk result cache used by scrape_jobs(cache=...).
+
+Results are stored in SQLite under a hash of the normalized search, so identical searches made
+within the TTL are answered without scraping. Entries older than the TTL but within the stale TTL
+are still served immediately while a background thread refreshes them (stale-while-revalidate).
+The least recently used entries are evicted once the payloads exceed max_bytes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections.abc import Callable, Iterator
+from contextlib import closing, contextmanager
+from datetime import date
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+from .scrapers import ScraperInput
+from .scrapers.utils import create_logger
+
+logger = create_logger("cache")
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "jobspy2" / "results.sqlite"
+
+
+class UncacheableValueError(TypeError):
+    """Raised when a result holds a value the cache cannot serialize."""
+
+    def __init__(self, value: object) -> None:
+        self.message = f"Cannot cache {type(value).__name__} values"
+        super().__init__(self.message)
+
+
+class CacheState(Enum):
+    FRESH = "fresh"
+    STALE = "stale"
+    MISS = "miss"
+
+
+def _normalize(value: str | None) -> str | None:
+    return " ".join(value.lower().split()) if value else None
+
+
+def cache_key(scraper_input: ScraperInput, **options: Any) -> str:
+    """
+    Hashes the fields of a search that change its results. Case and whitespace of the search terms
+    and location are ignored, as are the deadline and the logger.
+    :param options: result options applied outside the scrapers, e.g. enforce_annual_salary
+    :return: hex digest
+    """
+    fields = {
+        "sites": sorted(site.value for site in scraper_input.site_type),
+        "search_term": _normalize(scraper_input.search_term),
+        "google_search_term": _normalize(scraper_input.google_search_term),
+        "location": _normalize(scraper_input.location),
+        "country": scraper_input.country.name,
+        "distance": scraper_input.distance,
+        "is_remote": scraper_input.is_remote,
+        "job_type": scraper_input.job_type.name if scraper_input.job_type else None,
+        "easy_apply": scraper_input.easy_apply,
+        "offset": scraper_input.offset,
+        "linkedin_fetch_description": scraper_input.linkedin_fetch_description,
+        "linkedin_company_ids": sorted(scraper_input.linkedin_company_ids or []),
+        "linkedin_experience_levels": sorted(level.name for level in scraper_input.linkedin_experience_levels or []),
+        "description_format": scraper_input.description_format.name if scraper_input.description_format else None,
+        "results_wanted": scraper_input.results_wanted,
+        "hours_old": scraper_input.hours_old,
+        "dedupe": scraper_input.duplicate_index is not None,
+        "options": options,
+    }
+    if scraper_input.fields is not None:
+        # keys of unprojected searches stay those of earlier versions
+        fields["fields"] = sorted(scraper_input.fields)
+    return hashlib.sha256(json.dumps(fields, sort_keys=True).encode()).hexdigest()
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, date):
+        return {"$date": value.isoformat()}
+    if isinstance(value, Enum):
+        return value.value
+    raise UncacheableValueError(value)
+
+
+def _decode_value(obj: dict[str, Any]) -> Any:
+    if obj.keys() == {"$date"}:
+        return date.fromisoformat(obj["$date"])
+    return obj
+
+
+def _dumps(value: Any) -> bytes:
+    return zlib.compress(json.dumps(value, default=_encode_value).encode())
+
+
+def _loads(payload: bytes) -> Any:
+    return json.loads(zlib.decompress(payload), object_hook=_decode_value)
+
+
+class ResultCache:
+    """
+    SQLite-backed cache of JSON-serializable scrape results, shared by threads and processes that
+    use the same file.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] = DEFAULT_CACHE_PATH,
+        ttl: float = 15 * 60,
+        stale_ttl: float = 60 * 60,
+        max_bytes: int = 256 * 1024 * 1024,
+    ) -> None:
+        """
+        :param path: SQLite file, created with its directory if missing
+        :param ttl: seconds an entry is served without refreshing it
+        :param stale_ttl: seconds an entry is served at all; past ttl it is refreshed in the background
+        :param max_bytes: total size of the compressed payloads kept
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self.stale_ttl = max(stale_ttl, ttl)
+        self.max_bytes = max_bytes
+        self._refreshing: set[str] = set()
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, created REAL NOT NULL, accessed REAL NOT NULL, "
+                "size INTEGER NOT NULL, payload BLOB NOT NULL)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # one short-lived connection per operation, so the cache can be used from any thread
+        with closing(sqlite3.connect(self.path, timeout=30)) as db, db:
+            yield db
+
+    def get(self, key: str) -> tuple[Any, float] | None:
+        """
+        Looks up an entry that is not older than stale_ttl
+        :return: (value, age in seconds), None if missing or expired
+        """
+        now = time.time()
+        with self._connect() as db:
+            row = db.execute(
+                "SELECT created, payload FROM results WHERE key = ? AND created >= ?", (key, now - self.stale_ttl)
+            ).fetchone()
+            if row is None:
+                return None
+            db.execute("UPDATE results SET accessed = ? WHERE key = ?", (now, key))
+        created, payload = row
+        return _loads(payload), now - created
+
+    def put(self, key: str, value: Any) -> None:
+        """
+        Stores value under key, then evicts expired entries and least recently used ones over max_bytes
+        """
+        payload = _dumps(value)
+        now = time.time()
+        with self._connect() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO results (key, created, accessed, size, payload) VALUES (?, ?, ?, ?, ?)",
+                (key, now, now, len(payload), payload),
+            )
+            db.execute("DELETE FROM results WHERE created < ?", (now - self.stale_ttl,))
+            total = db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+            if total > self.max_bytes:
+                evicted = []
+                for old_key, size in db.execute("SELECT key, size FROM results ORDER BY accessed"):
+                    if total <= self.max_bytes:
+                        break
+                    evicted.append((old_key,))
+                    total -= size
+                db.executemany("DELETE FROM results WHERE key = ?", evicted)
+
+    def clear(self) -> None:
+        with self._connect() as db:
+            db.execute("DELETE FROM results")
+
+    def fetch(
+        self, key: str, compute: Callable[[], Any], store: Callable[[Any], bool] | None = None
+    ) -> tuple[Any, CacheState]:
+        """
+        Returns the cached value of key, computing it on a miss. A stale value is returned as is while
+        a background thread recomputes it, one refresh per key at a time.
+        :param compute: produces the value
+        :param store: decides whether a computed value is cached, every value is if None
+        :return: value and whether it was fresh, stale or computed
+        """
+        cached = self.get(key)
+        if cached is None:
+            value = compute()
+            if store is None or store(value):
+                self.put(key, value)
+            return value, CacheState.MISS
+        value, age = cached
+        if age <= self.ttl:
+            return value, CacheState.FRESH
+        with self._lock:
+            refreshing = key in self._refreshing
+            self._refreshing.add(key)
+        if not refreshing:
+            threading.Thread(
+                target=self._refresh, args=(key, compute, store), name="jobspy-cache-refresh", daemon=True
+            ).start()
+        return value, CacheState.STALE
+
+    def _refresh(self, key: str, compute: Callable[[], Any], store: Callable[[Any], bool] | None) -> None:
+        try:
+            value = compute()
+            if store is None or store(value):
+                self.put(key, value)
+        except Exception:
+            logger.exception("Background refresh of a cached result failed")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
@@ -0,0 +1,168 @@
+"""
+jobspy2.dedupe
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the cross-site duplicate detection used by scrape_jobs(dedupe=True).
+
+Jobs are first matched on a normalized title + company + city key. Jobs that pass that check are then
+compared on their descriptions with a one-permutation MinHash of word shingles (jobspy2.minhash),
+bucketed by LSH bands, so near-identical copies of one posting are found without comparing every pair.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from typing import TYPE_CHECKING, Any
+
+from .jobs import Location
+
+if TYPE_CHECKING:
+    import numpy as np
+
+_WORD_RE = re.compile(r"\w+")
+_COMPANY_SUFFIX_RE = re.compile(r"\b(inc|llc|ltd|limited|corp|corporation|co|company|gmbh|plc|pvt|pty|sa|ag)\b")
+
+# near-duplicates must also share this fraction of their title words
+MIN_TITLE_OVERLAP = 0.5
+SIGNATURE_BATCH_SIZE = 1_000
+
+
+def normalize_text(text: str | None) -> str:
+    """
+    Lowercases text and keeps only its words, separated by single spaces
+    """
+    if not text:
+        return ""
+    return " ".join(_WORD_RE.findall(text.lower()))
+
+
+def normalize_company(company: str | None) -> str:
+    return " ".join(_COMPANY_SUFFIX_RE.sub(" ", normalize_text(company)).split())
+
+
+def normalize_city(location: Location | str | None) -> str:
+    """
+    Reduces a Location or a displayed location string to its normalized first component
+    """
+    if isinstance(location, Location):
+        location = location.display_location()
+    if not location:
+        return ""
+    return normalize_text(location.split(",")[0])
+
+
+def job_key(title: str | None, company: str | None, location: Location | str | None) -> str:
+    return f"{normalize_text(title)}|{normalize_company(company)}|{normalize_city(location)}"
+
+
+class DuplicateIndex:
+    """
+    Thread-safe registry of the site that first reported each job key during a scrape.
+    Scrapers claim a key before fetching a job's details and skip the fetch if another site owns it.
+    """
+
+    def __init__(self) -> None:
+        self._owners: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def claim(self, key: str, site: str) -> bool:
+        """
+        Registers site as the owner of key unless another site already owns it
+        :return: True if site owns the key
+        """
+        with self._lock:
+            return self._owners.setdefault(key, site) == site
+
+    def release(self, key: str, site: str) -> None:
+        """
+        Gives up site's claim on key, for a job the site fetched but did not report
+        """
+        with self._lock:
+            if self._owners.get(key) == site:
+                del self._owners[key]
+
+    def owner(self, key: str) -> str | None:
+        with self._lock:
+            return self._owners.get(key)
+
+
+def title_overlap(first: set[str], second: set[str]) -> float:
+    if not first or not second:
+        return 0.0
+    return len(first & second) / len(first | second)
+
+
+class DuplicateDetector:
+    """
+    Incrementally flags processed job dicts that duplicate a job already accepted from another site.
+    Copies from the same site are never flagged, since one board can list distinct jobs with the same key.
+    """
+
+    def __init__(self, index: DuplicateIndex | None = None, threshold: float = 0.8) -> None:
+        self.index = index if index is not None else DuplicateIndex()
+        self.threshold = threshold
+        self._signatures: list[np.ndarray] = []
+        self._owners: list[tuple[str, str, set[str]]] = []  # (site, normalized company, title words)
+        self._buckets: dict[bytes, list[int]] = {}
+
+    def is_duplicate(self, job_data: dict[str, Any]) -> bool:
+        """
+        Checks a processed job against the jobs accepted so far, accepting it if it is new
+        :param job_data: dict with site, title, company, location and description
+        :return: True if the job duplicates a job of another site
+        """
+        from .minhash import band_keys, description_signatures
+
+        signatures = description_signatures([job_data.get("description")])
+        return self._check(job_data, signatures[0], band_keys(signatures)[0])
+
+    def _check(self, job_data: dict[str, Any], signature: np.ndarray, keys: list[bytes]) -> bool:
+        site = job_data["site"]
+        title = normalize_text(job_data.get("title"))
+        company = normalize_company(job_data.get("company"))
+        if not self.index.claim(f"{title}|{company}|{normalize_city(job_data.get('location'))}", site):
+            return True
+        if not keys:
+            return False
+        from .minhash import signature_similarity
+
+        buckets = self._buckets
+        candidates = {candidate for key in keys if key in buckets for candidate in buckets[key]}
+        title_words = set(title.split())
+        for candidate in candidates:
+            candidate_site, candidate_company, candidate_title_words = self._owners[candidate]
+            if (
+                candidate_site != site
+                and candidate_company == company
+                and title_overlap(title_words, candidate_title_words) >= MIN_TITLE_OVERLAP
+                and signature_similarity(signature, self._signatures[candidate]) >= self.threshold
+            ):
+                return True
+
+        position = len(self._signatures)
+        self._signatures.append(signature)
+        self._owners.append((site, company, title_words))
+        for key in keys:
+            buckets.setdefault(key, []).append(position)
+        return False
+
+
+def dedupe_jobs(jobs: list[dict[str, Any]], threshold: float = 0.8) -> list[dict[str, Any]]:
+    """
+    Drops cross-site duplicates from processed job dicts, keeping the first copy of each job
+    :param jobs: processed job dicts
+    :param threshold: minimum estimated description similarity of near-duplicates
+    :return: jobs without duplicates, in their original order
+    """
+    from .minhash import band_keys, description_signatures
+
+    detector = DuplicateDetector(threshold=threshold)
+    kept = []
+    for start in range(0, len(jobs), SIGNATURE_BATCH_SIZE):
+        batch = jobs[start : start + SIGNATURE_BATCH_SIZE]
+        signatures = description_signatures([job.get("description") for job in batch])
+        for job, signature, keys in zip(batch, signatures, band_keys(signatures)):
+            if not detector._check(job, signature, keys):
+                kept.append(job)
+    return kept
@@ -0,0 +1,116 @@
+"""
+jobspy2.frame
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the columnar builder used to assemble scraped jobs into a DataFrame.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def job_columns(hyperlinks: bool = False) -> list[str]:
+    """
+    Returns the output column order of scrape_jobs.
+    :param hyperlinks: use the html anchor column instead of the plain job url
+    :return: list of column names
+    """
+    return [
+        "id",
+        "site",
+        "job_url_hyper" if hyperlinks else "job_url",
+        "job_url_direct",
+        "title",
+        "company",
+        "location",
+        "date_posted",
+        "job_type",
+        "salary_source",
+        "interval",
+        "min_amount",
+        "max_amount",
+        "currency",
+        "is_remote",
+        "job_level",
+        "job_function",
+        "listing_type",
+        "emails",
+        "description",
+        "company_industry",
+        "company_url",
+        "company_logo",
+        "company_url_direct",
+        "company_addresses",
+        "company_num_employees",
+        "company_revenue",
+        "company_description",
+    ]
+
+
+def project_columns(columns: list[str], fields: Iterable[str] | None) -> list[str]:
+    """
+    Keeps the columns of a field projection, in output order; the html anchor column stands for job_url
+    :param fields: requested columns, None for all
+    """
+    if fields is None:
+        return columns
+    wanted = set(fields)
+    if "job_url" in wanted:
+        wanted.add("job_url_hyper")
+    return [column for column in columns if column in wanted]
+
+
+class JobFrameBuilder:
+    """
+    Accumulates processed job dicts into per-column lists and builds the DataFrame once.
+    Extra columns are appended after the standard ones and lead the sort order.
+    """
+
+    def __init__(
+        self, hyperlinks: bool = False, extra_columns: list[str] | None = None, fields: Iterable[str] | None = None
+    ) -> None:
+        """
+        :param fields: standard columns to keep, None for all
+        """
+        self.extra_columns = list(extra_columns or [])
+        self.columns = project_columns(job_columns(hyperlinks), fields) + self.extra_columns
+        self._data: dict[str, list[Any]] = {column: [] for column in self.columns}
+        self._rows = 0
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def append(self, job_data: dict[str, Any]) -> None:
+        """
+        Appends the output columns of a processed job dict, missing keys become None
+        :param job_data: dict returned by _process_job_data
+        """
+        for column, values in self._data.items():
+            values.append(job_data.get(column))
+        self._rows += 1
+
+    def extend(self, jobs_data: Iterable[dict[str, Any]]) -> None:
+        for job_data in jobs_data:
+            self.append(job_data)
+
+    def build(self) -> pd.DataFrame:
+        """
+        Builds the DataFrame sorted by the extra columns, site and newest posting first, as far as
+        they are among its columns
+        :return: jobs DataFrame, empty if no job was appended
+        """
+        import pandas as pd
+
+        if not self._rows:
+            return pd.DataFrame()
+        jobs_df = pd.DataFrame(self._data, columns=self.columns)
+        sort_by = [*self.extra_columns, *(column for column in ("site", "date_posted") if column in self.columns)]
+        if not sort_by:
+            return jobs_df
+        ascending = [column != "date_posted" for column in sort_by]
+        return jobs_df.sort_values(by=sort_by, ascending=ascending).reset_index(drop=True)
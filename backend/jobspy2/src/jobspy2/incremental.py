@@ -0,0 +1,135 @@
+"""
+jobspy2.incremental
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the watermark store used by iter_jobs(watermarks=...) to return only the jobs
+posted since the previous run of a saved search.
+
+For every search the store keeps the ids of the jobs already returned and the start time of the last
+complete run. A new run derives hours_old from that time, stops paginating a site at the first page
+made only of known jobs, and yields only unseen ids.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .jobs import JobPost
+from .scrapers import ScraperInput
+
+if TYPE_CHECKING:
+    import sqlite3
+
+DEFAULT_WATERMARK_PATH = Path.home() / ".cache" / "jobspy2" / "watermarks.sqlite"
+
+# extra hours added to the derived hours_old, as boards round posting times
+HOURS_OLD_MARGIN = 1
+
+
+class WatermarkStore:
+    """
+    SQLite-backed record of the jobs returned by previous runs of each search.
+    """
+
+    def __init__(self, path: str | os.PathLike[str] = DEFAULT_WATERMARK_PATH, retention_days: float = 30) -> None:
+        """
+        :param path: SQLite file, created with its directory if missing
+        :param retention_days: job ids first returned longer ago than this are forgotten
+        """
+        self.path = Path(path)
+        self.retention = retention_days * 24 * 60 * 60
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("CREATE TABLE IF NOT EXISTS runs (query TEXT PRIMARY KEY, last_run REAL NOT NULL)")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS seen ("
+                "query TEXT NOT NULL, job_id TEXT NOT NULL, seen_at REAL NOT NULL, PRIMARY KEY (query, job_id))"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # iter_jobs imports the page helpers of this module, sqlite3 is only loaded with a store
+        import sqlite3
+
+        with closing(sqlite3.connect(self.path, timeout=30)) as db, db:
+            yield db
+
+    @staticmethod
+    def query_key(scraper_input: ScraperInput) -> str:
+        """
+        Identifies a saved search regardless of its hours_old, result count, offset and field projection
+        :return: hex digest
+        """
+        from .cache import cache_key
+
+        return cache_key(
+            scraper_input.model_copy(update={"hours_old": None, "results_wanted": 0, "offset": 0, "fields": None})
+        )
+
+    def last_run(self, key: str) -> float | None:
+        """
+        :return: time.time() at the start of the last complete run, None if the search never completed
+        """
+        with self._connect() as db:
+            row = db.execute("SELECT last_run FROM runs WHERE query = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def known_ids(self, key: str) -> frozenset[str]:
+        with self._connect() as db:
+            return frozenset(job_id for (job_id,) in db.execute("SELECT job_id FROM seen WHERE query = ?", (key,)))
+
+    def prepare(self, scraper_input: ScraperInput) -> tuple[ScraperInput, str]:
+        """
+        Limits a search to what is new since its last complete run. An explicit hours_old is kept
+        when it is the narrower window.
+        :return: scraper input with hours_old and known_ids set, and the search's key for record()
+        """
+        key = self.query_key(scraper_input)
+        update: dict[str, object] = {"known_ids": self.known_ids(key)}
+        last_run = self.last_run(key)
+        if last_run is not None:
+            hours_old = max(math.ceil((time.time() - last_run) / 3600), 0) + HOURS_OLD_MARGIN
+            if scraper_input.hours_old is None or hours_old < scraper_input.hours_old:
+                update["hours_old"] = hours_old
+        return scraper_input.model_copy(update=update), key
+
+    def record(self, key: str, job_ids: Iterable[str], run_started: float | None = None) -> None:
+        """
+        Stores the ids returned by a run and forgets ids past the retention period
+        :param run_started: time.time() at the start of the run, advances the last run only if given,
+            so a truncated run is covered again by the next one
+        """
+        now = time.time()
+        with self._connect() as db:
+            db.executemany(
+                "INSERT OR REPLACE INTO seen (query, job_id, seen_at) VALUES (?, ?, ?)",
+                [(key, job_id, now) for job_id in job_ids],
+            )
+            db.execute("DELETE FROM seen WHERE query = ? AND seen_at < ?", (key, now - self.retention))
+            if run_started is not None:
+                db.execute("INSERT OR REPLACE INTO runs (query, last_run) VALUES (?, ?)", (key, run_started))
+
+
+def new_jobs(page: list[JobPost], known_ids: frozenset[str] | None) -> list[JobPost]:
+    """
+    :return: jobs of the page whose id is not known
+    """
+    if not known_ids:
+        return page
+    return [job for job in page if not job.id or job.id not in known_ids]
+
+
+def all_known(page: list[JobPost], known_ids: frozenset[str] | None) -> bool:
+    """
+    :return: True if every job of a non-empty page is known, so later pages need not be fetched
+    """
+    if not known_ids:
+        return False
+    return bool(page) and all(job.id in known_ids for job in page)
@@ -1,11 +1,26 @@
 from __future__ import annotations
 
+import functools
+import re
+from collections.abc import Iterable
 from datetime import date
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from pydantic import BaseModel as PydanticBaseModel
 
+if TYPE_CHECKING:
+    from pydantic import TypeAdapter
+
+M = TypeVar("M", bound="BaseModel")
+
+# per model class: default of every field in declaration order, required and declared field names
+_trusted_layouts: dict[type, tuple[dict[str, Any], frozenset[str], frozenset[str]]] = {}
+
+# dropped from aliases before the normalized lookups, e.g. "Full-Time" matches "fulltime"
+_ALIAS_SEPARATORS = re.compile(r"[\s_-]+")
+_job_list_adapter: TypeAdapter[list[JobPost]] | None = None
+
 
 # Define our BaseModel inheriting from Pydantic's, with custom config
 class BaseModel(PydanticBaseModel):
@@ -14,6 +29,53 @@ class BaseModel(PydanticBaseModel):
         # You might want to add other useful Pydantic configs here if needed globally,
         # e.g., validate_assignment = True, extra = 'forbid', etc.
 
+    @classmethod
+    def from_trusted(cls: type[M], fields: dict[str, Any]) -> M:
+        """
+        Builds a model from values that already have the declared types, such as scraper output,
+        without validating them; faster than validation and several times faster than model_construct.
+        Falls back to validation when a required field is missing or an undeclared one is given.
+        validate_jobs checks jobs built this way in one batch.
+        :param fields: field values, copied
+        """
+        layout = _trusted_layouts.get(cls)
+        if layout is None:
+            layout = _trusted_layouts[cls] = _trusted_layout(cls)
+        defaults, required, declared = layout
+        if not (required <= fields.keys() <= declared):
+            return cls(**fields)
+        values = defaults.copy()
+        values.update(fields)
+        model = object.__new__(cls)
+        object.__setattr__(model, "__dict__", values)
+        object.__setattr__(model, "__pydantic_fields_set__", set(fields))
+        object.__setattr__(model, "__pydantic_extra__", None)
+        object.__setattr__(model, "__pydantic_private__", None)
+        return model
+
+
+def _trusted_layout(cls: type[BaseModel]) -> tuple[dict[str, Any], frozenset[str], frozenset[str]]:
+    defaults = {
+        name: None if field.is_required() else field.get_default(call_default_factory=True)
+        for name, field in cls.model_fields.items()
+    }
+    required = frozenset(name for name, field in cls.model_fields.items() if field.is_required())
+    return defaults, required, frozenset(defaults)
+
+
+def validate_jobs(jobs: Iterable[JobPost]) -> list[JobPost]:
+    """
+    Validates jobs, e.g. built with JobPost.from_trusted, in one call
+    :return: validated copies of the jobs
+    :raises pydantic.ValidationError: with the index and field of every invalid value
+    """
+    global _job_list_adapter
+    if _job_list_adapter is None:
+        from pydantic import TypeAdapter
+
+        _job_list_adapter = TypeAdapter(list[JobPost])
+    return _job_list_adapter.validate_python([job.__dict__ for job in jobs])
+
 
 class JobType(Enum):
     FULL_TIME = (
@@ -64,6 +126,20 @@ class JobType(Enum):
     SUMMER = ("summer",)
     VOLUNTEER = ("volunteer",)
 
+    @classmethod
+    def from_alias(cls, alias: str | None) -> JobType | None:
+        """
+        Looks up the job type having alias among its values, e.g. "fulltime" or "vollzeit". Aliases
+        spelled differently, like "Full-Time", are matched once lowercased without whitespace, hyphens
+        and underscores.
+        :return: job type, None if no job type has the alias
+        """
+        if not alias:
+            return None
+        exact, normalized = _job_type_aliases()
+        job_type = exact.get(alias)
+        return job_type if job_type is not None else normalized.get(normalize_alias(alias))
+
 
 class Country(Enum):
     """
@@ -167,14 +243,36 @@ class Country(Enum):
     def from_string(cls, country_str: str) -> Country:
         """Convert a string to the corresponding Country enum."""
         country_str = country_str.strip().lower()
-        for country in cls:
-            country_names = country.value[0].split(",")
-            if country_str in country_names:
-                return country
+        exact, normalized = _country_aliases()
+        country = exact.get(country_str) or normalized.get(normalize_alias(country_str))
+        if country is not None:
+            return country
         valid_countries = [country.value for country in cls]
         raise CountryError(country_str, valid_countries)
 
 
+def normalize_alias(alias: str) -> str:
+    return _ALIAS_SEPARATORS.sub("", alias.casefold())
+
+
+@functools.cache
+def _job_type_aliases() -> tuple[dict[str, JobType], dict[str, JobType]]:
+    """
+    :return: job type per value of its tuple, and per normalized value
+    """
+    exact = {alias: job_type for job_type in JobType for alias in job_type.value}
+    return exact, {normalize_alias(alias): job_type for alias, job_type in exact.items()}
+
+
+@functools.cache
+def _country_aliases() -> tuple[dict[str, Country], dict[str, Country]]:
+    """
+    :return: country per name of its comma separated names, and per normalized name
+    """
+    exact = {name: country for country in Country for name in country.value[0].split(",")}
+    return exact, {normalize_alias(name): country for name, country in exact.items()}
+
+
 class Location(BaseModel):
     country: Country | str | None = None
     city: str | None = None
@@ -0,0 +1,200 @@
+"""
+jobspy2.metrics
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the opt-in performance metrics of a scrape, collected per site.
+
+iter_jobs(metrics=...) runs every site in a context where current_metrics() returns the site's
+SiteMetrics; the shared thread pools copy that context into the threads fetching pages and details.
+Sessions, converters and scrapers record into it through count(), stage() and timed(), which do
+nothing when metrics are not enabled. Stages are also recorded as spans when tracing, see
+jobspy2.tracing.
+"""
+
+from __future__ import annotations
+
+import bisect
+import contextvars
+import functools
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from typing import Any, TypeVar
+
+from .tracing import Tracer, current_tracer
+
+# upper bounds in seconds of the HTTP latency histogram buckets, the last bucket is unbounded
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# time spent per stage, exclusive of the stages nested in it: "request" covers rate limiting, sending
+# and retry backoff, "parse" the decoding of responses into job fields
+STAGES = ("request", "parse", "markdown", "construct", "postprocess")
+
+# "markdown_cache_hits" counts the descriptions converted by an earlier job, see jobspy2.scrapers.markdown
+COUNTERS = ("pages", "detail_requests", "requests", "retries", "bytes", "markdown_cache_hits")
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_current: contextvars.ContextVar[SiteMetrics | None] = contextvars.ContextVar("jobspy2_metrics", default=None)
+_untimed = nullcontext()
+
+
+class LatencyHistogram:
+    """
+    Counts of observed latencies per LATENCY_BUCKETS bucket. Not thread safe, SiteMetrics locks it.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        :return: {"buckets": {upper bound: count}, "count": ..., "sum": ...}, "+Inf" for the last bucket
+        """
+        bounds = [str(bound) for bound in self.buckets] + ["+Inf"]
+        return {"buckets": dict(zip(bounds, self.counts)), "count": self.count, "sum": self.sum}
+
+
+class SiteMetrics:
+    """
+    Counters, HTTP latencies and stage timings of one site's scrape.
+    """
+
+    def __init__(self) -> None:
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.latency = LatencyHistogram()
+        self.seconds = dict.fromkeys(STAGES, 0.0)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def count(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self.counters[name] += n
+
+    def observe_response(self, seconds: float, size: int) -> None:
+        """
+        Records an HTTP response
+        :param seconds: time from sending the request to receiving the response
+        :param size: bytes of the response body
+        """
+        with self._lock:
+            self.counters["requests"] += 1
+            self.counters["bytes"] += size
+            self.latency.observe(seconds)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Adds the time spent in the block to a stage, minus the time of the stages nested in it on the
+        same thread
+        """
+        nested = self._local.__dict__.setdefault("nested", [])
+        nested.append(0.0)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            exclusive = elapsed - nested.pop()
+            if nested:
+                nested[-1] += elapsed
+            with self._lock:
+                self.seconds[name] += exclusive
+
+    def as_dict(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                **self.counters,
+                "latency": self.latency.as_dict(),
+                "seconds": dict(self.seconds),
+            }
+
+
+class ScrapeMetrics:
+    """
+    Metrics of a scrape, one SiteMetrics per site.
+    """
+
+    def __init__(self) -> None:
+        self.sites: dict[str, SiteMetrics] = {}
+        self._lock = threading.Lock()
+
+    def site(self, name: str) -> SiteMetrics:
+        with self._lock:
+            return self.sites.setdefault(name, SiteMetrics())
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        """
+        :return: plain data per site name, as put in scrape_jobs(...).attrs["metrics"]
+        """
+        with self._lock:
+            sites = dict(self.sites)
+        return {name: site_metrics.as_dict() for name, site_metrics in sites.items()}
+
+
+def current_metrics() -> SiteMetrics | None:
+    """
+    :return: metrics of the site being scraped in the current context, None if not enabled
+    """
+    return _current.get()
+
+
+def use_metrics(site_metrics: SiteMetrics | None) -> contextvars.Token:
+    """
+    Binds a site's metrics to the current context
+    :return: token to reset the binding with
+    """
+    return _current.set(site_metrics)
+
+
+def count(name: str, n: int = 1) -> None:
+    site_metrics = _current.get()
+    if site_metrics is not None:
+        site_metrics.count(name, n)
+
+
+def stage(name: str, **args: Any) -> AbstractContextManager[None]:
+    """
+    Times a block as one of STAGES in the current site's metrics and traces it as a span
+    :param args: shown with the span in the trace viewer
+    """
+    site_metrics = _current.get()
+    tracer = current_tracer()
+    if tracer is None:
+        return _untimed if site_metrics is None else site_metrics.stage(name)
+    if site_metrics is None:
+        return tracer.span(name, **args)
+    return _traced_stage(site_metrics, tracer, name, args)
+
+
+@contextmanager
+def _traced_stage(site_metrics: SiteMetrics, tracer: Tracer, name: str, args: dict[str, Any]) -> Iterator[None]:
+    with site_metrics.stage(name), tracer.span(name, **args):
+        yield
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """
+    Decorator timing every call of a function as one of STAGES
+    """
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _current.get() is None and current_tracer() is None:
+                return func(*args, **kwargs)
+            with stage(name):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
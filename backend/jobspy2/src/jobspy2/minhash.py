@@ -0,0 +1,107 @@
+"""
+jobspy2.minhash
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the MinHash signatures of job descriptions used by jobspy2.dedupe to find
+near-identical copies of a posting. It is imported on first use, so NumPy is only loaded by scrapes
+that deduplicate.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+
+SHINGLE_SIZE = 3
+MIN_WORDS = SHINGLE_SIZE * 4
+# copies of one posting agree from the start, so only the head of a description is compared
+MAX_DESCRIPTION_CHARS = 1500
+NUM_BINS = 64
+BAND_SIZE = 4
+_BIN_SHIFT = np.uint64(64 - 6)  # top 6 bits of a shingle hash pick one of the 64 bins
+_EMPTY_BIN = np.iinfo(np.uint64).max
+_BAND_BYTES = BAND_SIZE * 8
+_EMPTY_BAND = b"\xff" * _BAND_BYTES
+_MULTIPLIERS = (np.uint64(0x9E3779B97F4A7C15), np.uint64(0xC2B2AE3D27D4EB4F), np.uint64(0x165667B19E3779F9))
+_BYTE_MASKS = np.array([(1 << (8 * size)) - 1 for size in range(9)], dtype=np.uint64)
+
+
+def description_signatures(descriptions: Sequence[str | None]) -> np.ndarray:
+    """
+    Computes the one-permutation MinHash of the word shingles of many descriptions in one vectorized pass.
+    Words are hashed from their utf-8 bytes: length and first and last 8 bytes, so no per-word objects are made.
+    :param descriptions: job descriptions, None for jobs without one
+    :return: (len(descriptions), NUM_BINS) uint64 minimums, _EMPTY_BIN for bins without shingles;
+        rows of descriptions too short to compare are entirely _EMPTY_BIN
+    """
+    signatures = np.full((len(descriptions), NUM_BINS), _EMPTY_BIN, dtype=np.uint64)
+    encoded = [
+        description[:MAX_DESCRIPTION_CHARS].lower().encode() if description else b"" for description in descriptions
+    ]
+    # NUL separates the descriptions; 8 trailing NULs keep every 8-byte window inside the buffer
+    raw = b"\0".join(encoded) + b"\0" * 9
+    text = np.frombuffer(raw, dtype=np.uint8)
+    windows: np.ndarray = np.ndarray(shape=(len(raw) - 7,), dtype="<u8", buffer=raw, strides=(1,))
+
+    # words are runs of lowercase ascii letters, digits and any non-ascii utf-8 bytes
+    is_word = ((text >= ord("a")) & (text <= ord("z")) | (text >= ord("0")) & (text <= ord("9")) | (text >= 0x80)).view(
+        np.int8
+    )
+    edges = np.flatnonzero(is_word[1:] != is_word[:-1]) + 1
+    if is_word[0]:
+        edges = np.concatenate(([0], edges))
+    starts, ends = edges[0::2], edges[1::2]
+    lengths = ends - starts
+    masks = _BYTE_MASKS[np.minimum(lengths, 8)]
+    word_hashes = (
+        (windows[starts] & masks) * _MULTIPLIERS[0]
+        ^ (windows[np.maximum(ends - 8, starts)] & masks) * _MULTIPLIERS[1]
+        ^ lengths.view(np.uint64) * _MULTIPLIERS[2]
+    )
+
+    sizes = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+    offsets = np.cumsum(sizes + 1) - sizes - 1
+    owners = np.searchsorted(offsets, starts, side="right") - 1
+    word_counts = np.bincount(owners, minlength=len(descriptions))
+    shingles = word_hashes[: 1 - SHINGLE_SIZE] * _MULTIPLIERS[0]
+    for offset in range(1, SHINGLE_SIZE):
+        stop = offset + 1 - SHINGLE_SIZE
+        shingles = shingles ^ (word_hashes[offset : stop or None] * _MULTIPLIERS[offset])
+    shingles = shingles * _MULTIPLIERS[2]
+    shingle_owners = owners[: 1 - SHINGLE_SIZE]
+    # drop shingles spanning two descriptions and those of descriptions too short to compare
+    keep = (shingle_owners == owners[SHINGLE_SIZE - 1 :]) & (word_counts[shingle_owners] >= MIN_WORDS)
+    shingles, shingle_owners = shingles[keep], shingle_owners[keep]
+    np.minimum.at(signatures, (shingle_owners, (shingles >> _BIN_SHIFT).astype(np.intp)), shingles)
+    return signatures
+
+
+def description_signature(description: str | None) -> np.ndarray | None:
+    """
+    Computes the signature of a single description
+    :return: NUM_BINS uint64 minimums, None if the description is too short to compare
+    """
+    signature = description_signatures([description])[0]
+    return signature if (signature != _EMPTY_BIN).any() else None
+
+
+def band_keys(signatures: np.ndarray) -> list[list[bytes]]:
+    """
+    Splits signatures into the LSH band keys used to find candidate near-duplicates
+    :param signatures: rows returned by description_signatures
+    :return: per row, the bytes of its non-empty bands
+    """
+    # a shingle's top bits are its bin, so equal band bytes imply the same band position
+    bands = np.ascontiguousarray(signatures).view(f"V{_BAND_BYTES}").tolist()
+    return [[band for band in row if band != _EMPTY_BAND] for row in bands]
+
+
+def signature_similarity(first: np.ndarray, second: np.ndarray) -> float:
+    """
+    Estimates the Jaccard similarity of two descriptions from their signatures
+    """
+    filled = (first != _EMPTY_BIN) | (second != _EMPTY_BIN)
+    if not filled.any():
+        return 0.0
+    return float(np.count_nonzero((first == second) & filled) / np.count_nonzero(filled))
@@ -0,0 +1,419 @@
+"""
+jobspy2.salary
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the salary parsing of job descriptions: the batch extraction, which parses the
+"$" ranges of a whole description column at once with the same rules as scrapers.utils.extract_salary,
+and the currency pattern bank of extract_local_salary for the jobs outside the US.
+
+The batch extraction searches each description from its first "$" only, and computes the interval
+detection, the limit checks on the annualized amounts and the output columns on NumPy arrays of the
+matches rather than row by row. Building the arrays and the frame has a fixed cost of about half a millisecond, so
+scrapes keep the per-job extract_salary for their pages of a few dozen jobs; extract_salaries is for
+columns of thousands of rows, like a stored scrape re-parsed with other limits.
+
+The pattern bank is compiled once from the CURRENCIES, PERIOD_UNITS and PERIOD_ADVERBS tables, so a
+currency or a way of stating the period is added by extending a table; the scan costs the same with
+any number of them, see _salary_bank.
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from .jobs import CompensationInterval, Country, CountryError
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+MIN_MAX_PATTERN = re.compile(
+    r"\$(\d+(?:,\d+)?(?:\.\d+)?)([kK]?)\s*[-—–]\s*(?:\$)?(\d+(?:,\d+)?(?:\.\d+)?)([kK]?)"  # noqa: RUF001
+)
+
+SALARY_COLUMNS = ["interval", "min_amount", "max_amount", "currency"]
+
+# yearly multiplier of the amounts below the hourly and monthly thresholds
+HOURS_PER_YEAR = 2080  # 40 hours/week * 52 weeks
+MONTHS_PER_YEAR = 12
+
+
+def extract_salaries(
+    descriptions: pd.Series | Iterable[str | None],
+    lower_limit: int = 1000,
+    upper_limit: int = 700000,
+    hourly_threshold: int = 350,
+    monthly_threshold: int = 30000,
+    enforce_annual_salary: bool = False,
+) -> pd.DataFrame:
+    """
+    Extracts the salary of every description, like extract_salary on each of them: the first "$min -
+    $max" range, amounts below hourly_threshold are hourly and below monthly_threshold monthly, and
+    ranges whose annualized amounts fall outside the limits are dropped.
+    :param descriptions: description column, None for a job without one
+    :return: DataFrame aligned with descriptions with the interval, min_amount, max_amount and
+        currency of each description, missing where none was found
+    """
+    import numpy as np
+    import pandas as pd
+
+    index = descriptions.index if isinstance(descriptions, pd.Series) else None
+    # iterating a list is several times faster than iterating the Series
+    texts = descriptions.tolist() if isinstance(descriptions, pd.Series) else list(descriptions)
+    rows, groups = _first_matches(texts)
+
+    thousands = np.array([bool(min_k or max_k) for _, min_k, _, max_k in groups], dtype=bool)
+    scale = np.where(thousands, 1000.0, 1.0)
+    min_amount = np.trunc(_amounts([group[0] for group in groups])) * scale
+    max_amount = np.trunc(_amounts([group[2] for group in groups])) * scale
+
+    hourly = min_amount < hourly_threshold
+    monthly = ~hourly & (min_amount < monthly_threshold)
+    multiplier = np.select([hourly, monthly], [HOURS_PER_YEAR, MONTHS_PER_YEAR], 1)
+    annual_min = min_amount * multiplier
+    # a zero max is validated as the min
+    annual_max = np.where(max_amount != 0, max_amount * multiplier, annual_min)
+    valid = (
+        (lower_limit <= annual_min)
+        & (annual_min <= upper_limit)
+        & (lower_limit <= annual_max)
+        & (annual_max <= upper_limit)
+    )
+    if enforce_annual_salary:
+        valid &= ~hourly & ~monthly
+    rows = rows[valid]
+
+    # select the index of each interval, as np.select takes no enum members
+    intervals = np.array(
+        [CompensationInterval.YEARLY, CompensationInterval.HOURLY, CompensationInterval.MONTHLY], dtype=object
+    )
+    interval = np.full(len(texts), None, dtype=object)
+    interval[rows] = intervals[np.select([hourly[valid], monthly[valid]], [1, 2], 0)]
+    columns = {"interval": interval}
+    for column, amount in (("min_amount", min_amount), ("max_amount", max_amount)):
+        columns[column] = np.full(len(texts), np.nan)
+        columns[column][rows] = amount[valid]
+    columns["currency"] = np.full(len(texts), None, dtype=object)
+    columns["currency"][rows] = "USD"
+    return pd.DataFrame(columns, index=index, columns=SALARY_COLUMNS)
+
+
+def _first_matches(texts: list[str | None]) -> tuple[np.ndarray, list[tuple[str, ...]]]:
+    """
+    Searches each text from its first "$", found by the much faster str.find, so texts without one
+    never reach the regex
+    :return: rows having a match, and the groups of their first match
+    """
+    import numpy as np
+
+    search = MIN_MAX_PATTERN.search
+    matches = [
+        search(text, start) if isinstance(text, str) and (start := text.find("$")) >= 0 else None for text in texts
+    ]
+    rows = [row for row, match in enumerate(matches) if match is not None]
+    return np.array(rows, dtype=np.intp), [matches[row].groups() for row in rows]  # type: ignore[union-attr]
+
+
+def _amounts(numbers: list[str]) -> np.ndarray:
+    import numpy as np
+
+    return np.array([float(number.replace(",", "")) for number in numbers])
+
+
+# ISO code: (how the currency is written next to amounts, rough units per US dollar). The rate only
+# scales the limits and interval thresholds of extract_salary to the currency, it converts nothing.
+CURRENCIES: dict[str, tuple[tuple[str, ...], float]] = {
+    "USD": (("US$", "USD"), 1),
+    "CAD": (("C$", "CA$", "CAD"), 1.35),
+    "AUD": (("A$", "AU$", "AUD"), 1.5),
+    "NZD": (("NZ$", "NZD"), 1.65),
+    "SGD": (("S$", "SGD"), 1.35),
+    "HKD": (("HK$", "HKD"), 7.8),
+    "TWD": (("NT$", "TWD"), 32),
+    "MXN": (("MX$", "MXN"), 17),
+    "ARS": (("ARS",), 900),
+    "CLP": (("CLP",), 950),
+    "COP": (("COL$", "COP"), 4000),
+    "BRL": (("R$", "BRL"), 5),
+    "GBP": (("£", "GBP"), 0.8),
+    "EUR": (("€", "EUR", "Euro", "euros"), 0.92),
+    "CHF": (("CHF", "Fr."), 0.9),
+    "PLN": (("zł", "PLN"), 4),
+    "CZK": (("Kč", "CZK"), 23),
+    "HUF": (("Ft", "HUF"), 360),
+    "RON": (("lei", "RON"), 4.6),
+    "SEK": (("SEK",), 10.5),
+    "NOK": (("NOK",), 10.5),
+    "DKK": (("DKK",), 6.9),
+    "TRY": (("₺", "TRY"), 32),
+    "UAH": (("₴", "UAH"), 40),
+    "ILS": (("₪", "ILS"), 3.7),
+    "AED": (("AED",), 3.67),
+    "SAR": (("SAR",), 3.75),
+    "QAR": (("QAR",), 3.64),
+    "KWD": (("KWD",), 0.31),
+    "EGP": (("EGP", "E£"), 48),
+    "MAD": (("MAD",), 10),
+    "KES": (("KES", "KSh", "Ksh", "Kshs", "KShs"), 130),
+    "NGN": (("₦", "NGN"), 1500),
+    "ZAR": (("ZAR",), 18),
+    "INR": (("₹", "INR", "Rs.", "Rs"), 83),
+    "PKR": (("PKR",), 280),
+    "JPY": (("JPY", "円"), 150),
+    "CNY": (("CNY", "RMB"), 7.2),
+    "KRW": (("₩", "KRW"), 1350),
+    "THB": (("฿", "THB"), 36),
+    "VND": (("₫", "VND"), 25000),
+    "IDR": (("Rp", "IDR"), 16000),
+    "MYR": (("RM", "MYR"), 4.7),
+    "PHP": (("₱", "PHP"), 56),
+}
+
+# currency tokens that are also common abbreviations, as in "10 - 20 RM engineers" or "3-5 PHP
+# developers": their amounts are a salary only with a period or one of SALARY_WORDS shortly before
+AMBIGUOUS_CURRENCIES = frozenset({"RM", "Rs", "Rs.", "Ft", "lei", "Fr.", "Rp", "PHP", "MAD"})
+
+# words introducing pay, matched as word prefixes in any case, so "salar" is also "salaries"
+SALARY_WORDS = (
+    "salar",
+    "salaire",
+    "pay",
+    "wage",
+    "compensation",
+    "remuneration",
+    "rémunération",
+    "stipend",
+    "ctc",
+    "earn",
+    "gaji",
+    "gehalt",
+    "lohn",
+    "vergütung",
+    "sueldo",
+    "wynagrodzenie",
+    "fizetés",
+    "maaş",
+)
+
+# currency of a plain "$" by country, USD elsewhere
+DOLLAR_CURRENCIES: dict[Country, str] = {
+    Country.ARGENTINA: "ARS",
+    Country.AUSTRALIA: "AUD",
+    Country.CANADA: "CAD",
+    Country.CHILE: "CLP",
+    Country.COLOMBIA: "COP",
+    Country.HONGKONG: "HKD",
+    Country.MEXICO: "MXN",
+    Country.NEWZEALAND: "NZD",
+    Country.SINGAPORE: "SGD",
+    Country.TAIWAN: "TWD",
+}
+
+# words naming the period of an amount after "per", "a", "/" and the like, and the adverbs
+PERIOD_UNITS: dict[CompensationInterval, tuple[str, ...]] = {
+    CompensationInterval.HOURLY: ("hour", "hr", "h", "stunde", "std", "heure", "hora"),
+    CompensationInterval.DAILY: ("day", "tag", "jour", "día", "dia"),
+    CompensationInterval.WEEKLY: ("week", "wk", "woche", "semaine", "semana"),
+    CompensationInterval.MONTHLY: ("month", "mth", "mo", "monat", "mois", "mes"),
+    CompensationInterval.YEARLY: ("year", "yr", "annum", "jahr", "an", "año", "ano"),
+}
+PERIOD_ADVERBS: dict[CompensationInterval, tuple[str, ...]] = {
+    CompensationInterval.HOURLY: ("hourly", "stündlich"),
+    CompensationInterval.DAILY: ("daily",),
+    CompensationInterval.WEEKLY: ("weekly", "wöchentlich"),
+    CompensationInterval.MONTHLY: ("monthly", "monatlich", "mensuel", "mensual", "p.m."),
+    CompensationInterval.YEARLY: ("yearly", "annually", "annual", "jährlich", "annuel", "anual", "p.a.", "pa"),
+}
+
+ANNUAL_MULTIPLIERS: dict[CompensationInterval, int] = {
+    CompensationInterval.HOURLY: HOURS_PER_YEAR,
+    CompensationInterval.DAILY: 260,
+    CompensationInterval.WEEKLY: 52,
+    CompensationInterval.MONTHLY: MONTHS_PER_YEAR,
+    CompensationInterval.YEARLY: 1,
+}
+
+# the digits after the first of an amount: thousands separated by ",", ".", spaces or "'", the
+# Indian lakh grouping, or plain digits, with up to two decimals
+_NUMBER_TAIL = (
+    r"(?:\d{0,2}(?:[,.\u00a0\u202f ']\d{3})+(?:[.,]\d{1,2})?|\d?(?:,\d{2})+,\d{3}(?:\.\d{1,2})?|\d*(?:[.,]\d{1,2})?)"
+)
+_UNIT = r"[kKL](?![^\W\d_])|\s?(?:lakhs?|lacs?|LPA)(?![^\W\d_])"
+# a word between the amounts of a range needs spaces around it, so "10a20" is no range
+_RANGE = r"(?P<range>\s*(?:-|–|—)\s*|\s+(?:to|bis|à|a)\s+)"  # noqa: RUF001
+_UNIT_MULTIPLIERS = {"k": 1000, "l": 100_000, "lakh": 100_000, "lakhs": 100_000, "lac": 100_000, "lacs": 100_000}
+# longest currency token and a space
+_CURRENCY_BEFORE_WIDTH = 8
+# characters before an amount searched for SALARY_WORDS
+_CONTEXT_WIDTH = 60
+
+
+def _alternation(words: Iterable[str], ignore_case: bool = False) -> str:
+    """
+    Alternation of words, longest first so that "Kshs" is not read as "Ksh", behind a lookahead on
+    their first characters that fails most positions with a single character test
+    """
+    words = sorted(set(words), key=len, reverse=True)
+    first = {word[0] for word in words}
+    if ignore_case:
+        first |= {char.swapcase() for char in first}
+    return rf"(?=[{re.escape(''.join(sorted(first)))}])(?:{'|'.join(re.escape(word) for word in words)})"
+
+
+@functools.cache
+def _salary_bank() -> tuple[
+    re.Pattern[str], re.Pattern[str], re.Pattern[str], dict[str, str], dict[str, CompensationInterval]
+]:
+    """
+    Compiles the currency and period tables into the pattern of a salary, on first use.
+
+    Every match starts at the first ASCII digit of an amount, which lets the regex engine skip
+    ahead with a plain character test and keeps the scan as fast with every currency of the table
+    as with one. A match is an amount followed by a range, a currency or a period; a currency
+    written before the amount is read from the few characters preceding the match.
+    :return: salary pattern, pattern of a currency ending a text, pattern of SALARY_WORDS, currency
+        code per currency token and interval per lowercased period word
+    """
+    currencies = {token: code for code, (tokens, _) in CURRENCIES.items() for token in tokens}
+    # a plain "$" depends on the country, see DOLLAR_CURRENCIES
+    currency = rf"(?<![^\W\d_])(?:{_alternation([*currencies, '$'])})(?![^\W\d_])"
+    periods = {word: interval for interval, words in PERIOD_UNITS.items() for word in words}
+    adverbs = {word: interval for interval, words in PERIOD_ADVERBS.items() for word in words}
+
+    def period(named: bool) -> str:
+        unit, adverb = ("?P<period>", "?P<adverb>") if named else ("?:", "?:")
+        # period words in any case, currency codes only as written in the table
+        return (
+            rf"(?i:\s*(?:/|per|an?|pro|par|al|por|im)\s*({unit}{_alternation(periods)})(?![^\W\d_])"
+            rf"|,?\s+({adverb}{_alternation(adverbs)})(?![^\W\d_]))"
+        )
+
+    pattern = re.compile(
+        rf"(?P<min>[0-9](?<![0-9.,][0-9]){_NUMBER_TAIL})(?P<min_unit>{_UNIT})?"
+        # a range: "30,000 - £40,000", "50.000 € - 60.000 €", "50 000 - 60 000 EUR", "10-15 LPA"
+        rf"(?:(?:\s?(?P<currency_min>{currency}))?{_RANGE}(?:{currency}\s?)?"
+        rf"(?P<max>[0-9]{_NUMBER_TAIL})(?P<max_unit>{_UNIT})?(?:\s?(?P<currency_max>{currency}))?"
+        # a single amount: "4.000 € pro Monat", "35,000 per annum"
+        rf"|\s?(?P<currency_single>{currency})|(?={period(named=False)}))"
+        rf"{period(named=True)}?"
+    )
+    currency_before = re.compile(rf"(?:{currency})\s?\Z")
+    context = re.compile(rf"(?i:(?<![^\W\d_]){_alternation(SALARY_WORDS, ignore_case=True)})")
+    return pattern, currency_before, context, currencies, {**periods, **adverbs}
+
+
+def salary_country(search_country: Country, job_country: Country | str | None) -> Country | str:
+    """
+    The country whose currency a job's pay is likely stated in: the country of its location, as
+    far as the site gives one, else the country searched
+    :param job_country: Location.country of the job, a Country or the name or code given by the site
+    """
+    if isinstance(job_country, Country):
+        return search_country if job_country in (Country.US_CANADA, Country.WORLDWIDE) else job_country
+    if not job_country:
+        return search_country
+    try:
+        return Country.from_string(job_country)
+    except CountryError:
+        return _country_codes().get(job_country.strip().lower(), job_country)
+
+
+@functools.cache
+def _country_codes() -> dict[str, Country]:
+    # the indeed subdomains and api codes, e.g. "ca" and "gb"
+    return {code: country for country in Country for code in country.value[1].split(":") if code != "www"}
+
+
+def extract_local_salary(
+    description: str | None,
+    country: Country | str | None = None,
+    lower_limit: int = 1000,
+    upper_limit: int = 700000,
+    hourly_threshold: int = 350,
+    monthly_threshold: int = 30000,
+    enforce_annual_salary: bool = False,
+) -> tuple[CompensationInterval | None, float | None, float | None, str | None]:
+    """
+    Extracts the first salary stated in a known currency, see CURRENCIES, from a description in
+    one scan: a range, or a single amount with its period like "£35,000 per annum". Amounts are
+    read like currency_parser reads them, so "50.000", "50,000" and "50 000" are fifty thousand,
+    and may end in "k", or "L", "lakh" or "LPA" (lakh per annum). Without a stated period the
+    interval is guessed as in extract_salary, with the thresholds and limits, given in US dollars,
+    scaled by the currency's rate. Amounts in one of AMBIGUOUS_CURRENCIES or joined by a word like
+    "to" are a salary only with their period or one of SALARY_WORDS shortly before them.
+    :param country: country of the job, resolves the currency of a plain "$"
+    :return: interval, min and max amount and currency code, all None if no salary was found
+    """
+    if not description:
+        return None, None, None, None
+    from .scrapers.utils import currency_parser
+
+    pattern, currency_before, context, currencies, periods = _salary_bank()
+    for match in pattern.finditer(description):
+        interval = periods.get((match["period"] or match["adverb"] or "").lower())
+        if match["max"] is None and interval is None:
+            # a lone amount is a salary only with its period
+            continue
+        symbol = _currency_symbol(match, currency_before)
+        if symbol is None:
+            continue
+        if interval is None and not _clearly_pay(match, symbol, context):
+            continue
+        currency = _dollar_currency(country) if symbol == "$" else currencies[symbol]
+
+        unit = (match["min_unit"] or match["max_unit"] or "").strip().lower()
+        if unit == "lpa":
+            unit, interval = "lakh", interval or CompensationInterval.YEARLY
+        multiplier = _UNIT_MULTIPLIERS.get(unit, 1)
+        min_amount = float(currency_parser(match["min"])) * multiplier
+        max_amount = float(currency_parser(match["max"])) * multiplier if match["max"] else min_amount
+        if not 0 < min_amount <= max_amount:
+            continue
+
+        rate = CURRENCIES[currency][1]
+        interval = interval or _guess_interval(min_amount, hourly_threshold * rate, monthly_threshold * rate)
+        annual = ANNUAL_MULTIPLIERS[interval]
+        if not lower_limit * rate <= min_amount * annual <= max_amount * annual <= upper_limit * rate:
+            continue
+        if enforce_annual_salary and interval != CompensationInterval.YEARLY:
+            return None, None, None, None
+        return interval, min_amount, max_amount, currency
+    return None, None, None, None
+
+
+def _currency_symbol(match: re.Match[str], currency_before: re.Pattern[str]) -> str | None:
+    """
+    :return: currency token written with the amounts or just before them, None without one
+    """
+    symbol = match["currency_min"] or match["currency_max"] or match["currency_single"]
+    if symbol is None:
+        start = match.start()
+        before = currency_before.search(match.string, max(0, start - _CURRENCY_BEFORE_WIDTH), start)
+        symbol = before.group().rstrip() if before is not None else None
+    return symbol
+
+
+def _clearly_pay(match: re.Match[str], symbol: str, context: re.Pattern[str]) -> bool:
+    """
+    :return: False for amounts in an ambiguous currency or joined by a word, unless one of
+        SALARY_WORDS comes shortly before them
+    """
+    if symbol not in AMBIGUOUS_CURRENCIES and not (match["range"] or "-").strip().isalpha():
+        return True
+    start = match.start()
+    return context.search(match.string, max(0, start - _CONTEXT_WIDTH), start) is not None
+
+
+def _guess_interval(amount: float, hourly_threshold: float, monthly_threshold: float) -> CompensationInterval:
+    if amount < hourly_threshold:
+        return CompensationInterval.HOURLY
+    if amount < monthly_threshold:
+        return CompensationInterval.MONTHLY
+    return CompensationInterval.YEARLY
+
+
+def _dollar_currency(country: Country | str | None) -> str:
+    return DOLLAR_CURRENCIES.get(country, "USD") if isinstance(country, Country) else "USD"
@@ -1,16 +1,26 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future
 import logging
-from .utils import create_logger 
+import threading
+import time
+from typing import Any
+from .exceptions import CircuitOpenError
+from .utils import create_logger, prefetch_executor
 
+from ..dedupe import DuplicateIndex, job_key
 from ..jobs import (
     BaseModel,
     Country,
     DescriptionFormat,
     Enum,
+    JobPost,
     JobResponse,
     JobType,
+    Location,
 )
 
 
@@ -27,6 +37,12 @@ class SalarySource(Enum):
     DESCRIPTION = "description"
 
 
+class SiteStatus(Enum):
+    COMPLETED = "completed"
+    TRUNCATED = "truncated"
+    FAILED = "failed"
+
+
 class LinkedInExperienceLevel(Enum):
     INTERNSHIP = "internship"
     ENTRY_LEVEL = "entry_level"
@@ -55,16 +71,279 @@ class ScraperInput(BaseModel):
 
     results_wanted: int = 15
     hours_old: int | None = None
+    # time.monotonic() value after which pagination and detail fetches stop
+    deadline: float | None = None
+    # shared by the sites of one scrape so only the first site to report a job fetches its details
+    duplicate_index: DuplicateIndex | None = None
+    # ids returned by earlier runs of an incremental search, never yielded again
+    known_ids: frozenset[str] | None = None
+    # search pages requested ahead of the page being processed, 0 to request each page on demand
+    prefetch_depth: int = 1
+    # output columns of the scrape, None for all; detail fetches and conversions that only fill other
+    # columns are skipped
+    fields: frozenset[str] | None = None
 
     logger: logging.Logger | None = None
 
 
+# shortest timeout given to a request started just before the deadline
+MIN_REQUEST_TIMEOUT = 1.0
+
+
 class Scraper(ABC):
     def __init__(self, site: Site, logger: logging.Logger, proxies: list[str] | str | None = None, ca_cert: str | None = None):
         self.site = site
         self.proxies = proxies
         self.ca_cert = ca_cert
         self.logger = logger
+        self.scraper_input: ScraperInput | None = None
+        # set when the scrape stopped early because its time budget ran out or its host's circuit opened
+        self.truncated = False
+
+    def scrape(self, scraper_input: ScraperInput) -> JobResponse:
+        """
+        Scrapes all pages for jobs with scraper_input criteria
+        :param scraper_input:
+        :return: job_response
+        """
+        return JobResponse(jobs=[job for page in self.iter_pages(scraper_input) for job in page])
+
+    def time_left(self) -> float | None:
+        """
+        Seconds left before the scrape's deadline
+        :return: seconds, None if the scrape has no time budget
+        """
+        if not self.scraper_input or self.scraper_input.deadline is None:
+            return None
+        return self.scraper_input.deadline - time.monotonic()
+
+    def out_of_time(self) -> bool:
+        """
+        Checks the deadline, marking the scrape as truncated once it has passed
+        :return: True if no more requests should be made, as after an open circuit
+        """
+        if self.truncated:
+            return True
+        time_left = self.time_left()
+        if time_left is not None and time_left <= 0:
+            self.truncated = True
+            return True
+        return False
+
+    def circuit_open(self, error: CircuitOpenError) -> None:
+        """
+        Gives up on a host whose circuit breaker is open, marking the scrape as truncated
+        :param error: raised by the session for the request
+        """
+        self.logger.warning(error.message)
+        self.truncated = True
+
+    def request_timeout(self, timeout: float | None = None) -> float | None:
+        """
+        Clamps a request timeout to the time left before the deadline
+        :param timeout: the request's own timeout, None for no timeout
+        :return: timeout to pass to the session
+        """
+        time_left = self.time_left()
+        if time_left is None:
+            return timeout
+        time_left = max(time_left, MIN_REQUEST_TIMEOUT)
+        return time_left if timeout is None else min(timeout, time_left)
+
+    def wants(self, *columns: str) -> bool:
+        """
+        Checks the scrape's field projection
+        :return: True if any of the output columns was requested
+        """
+        fields = self.scraper_input.fields if self.scraper_input else None
+        return fields is None or not fields.isdisjoint(columns)
+
+    def known_elsewhere(self, title: str | None, company: str | None, location: Location | None) -> bool:
+        """
+        Claims a job for this site in the scrape's duplicate index
+        :return: True if another site already reported the job, so its details need not be fetched
+        """
+        index = self.scraper_input.duplicate_index if self.scraper_input else None
+        if index is None:
+            return False
+        return not index.claim(job_key(title, company, location), self.site.value)
+
+    def take_page(self, window: PageWindow, jobs: list[JobPost]) -> list[JobPost]:
+        """
+        Takes the part of a page that falls inside the window, releasing the duplicate index claims of
+        the jobs left out, so another site's copies of them are kept
+        :param jobs: jobs of the next page, claimed by known_elsewhere
+        :return: jobs to keep
+        """
+        page_jobs = window.take(jobs)
+        index = self.scraper_input.duplicate_index if self.scraper_input else None
+        if index is None:
+            return page_jobs
+        window.kept_keys.update(job_key(job.title, job.company_name, job.location) for job in page_jobs)
+        if len(page_jobs) < len(jobs):
+            for job in jobs:
+                key = job_key(job.title, job.company_name, job.location)
+                if key not in window.kept_keys:
+                    index.release(key, self.site.value)
+        return page_jobs
+
+    def paginate(
+        self, fetch: Callable[[Any], tuple[list[Any], Any]], cursor: Any = None, wanted: int | None = None
+    ) -> PagePrefetcher:
+        """
+        Creates the page pipeline of a scrape, prefetching scraper_input.prefetch_depth pages
+        :param fetch: requests a page, see PagePrefetcher
+        :param cursor: cursor of the first page
+        :param wanted: raw items after which no page is prefetched
+        :return: prefetcher to iterate and close
+        """
+
+        def more(fetched: int) -> bool:
+            time_left = self.time_left()
+            return (wanted is None or fetched < wanted) and (time_left is None or time_left > 0)
+
+        depth = self.scraper_input.prefetch_depth if self.scraper_input else 1
+        return PagePrefetcher(fetch, cursor, depth=depth, more=more)
+
+    def sleep(self, seconds: float) -> None:
+        """
+        Sleeps between requests, never past the deadline
+        """
+        time_left = self.time_left()
+        time.sleep(seconds if time_left is None else max(min(seconds, time_left), 0))
 
     @abstractmethod
-    def scrape(self, scraper_input: ScraperInput) -> JobResponse: ...
+    def iter_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobPost]]:
+        """
+        Yields the jobs of every search page as soon as the page has been parsed
+        :param scraper_input:
+        :return: iterator of job lists, one per page
+        """
+
+
+class PageWindow:
+    """
+    Tracks which jobs of consecutive pages fall inside the [offset, offset + limit) result window.
+    """
+
+    def __init__(self, limit: int, offset: int = 0) -> None:
+        self.start = offset
+        self.stop = offset + limit
+        self.seen = 0
+        # duplicate index keys of the jobs taken, see Scraper.take_page
+        self.kept_keys: set[str] = set()
+
+    @property
+    def full(self) -> bool:
+        return self.seen >= self.stop
+
+    def take(self, jobs: list[JobPost]) -> list[JobPost]:
+        """
+        Returns the part of a page that falls inside the window
+        :param jobs: jobs of the next page
+        :return: jobs to keep
+        """
+        low = max(self.start - self.seen, 0)
+        high = max(self.stop - self.seen, 0)
+        self.seen += len(jobs)
+        return jobs[low:high]
+
+
+class PagePrefetcher:
+    """
+    Pipelines cursor-based pagination: the request for the next page starts on a background thread as
+    soon as the current page's cursor is known, while the scraper parses and enriches the current page.
+    Requests stay sequential, since each needs the previous cursor; up to depth pages are fetched ahead
+    of the one being processed.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[Any], tuple[list[Any], Any]],
+        cursor: Any = None,
+        depth: int = 1,
+        more: Callable[[int], bool] | None = None,
+    ) -> None:
+        """
+        :param fetch: requests the page at a cursor, returning its raw items and the next cursor, or a
+            falsy cursor on the last page
+        :param cursor: cursor of the first page
+        :param depth: pages fetched ahead of the one being processed
+        :param more: given the number of raw items fetched so far, whether later pages may be needed;
+            prefetching stops when it returns False, pages are still fetched when asked for
+        """
+        self.fetch = fetch
+        self.depth = depth
+        self.more = more
+        self._cursor = cursor
+        self._fetched = 0
+        self._pages: deque[Future] = deque()
+        self._busy = False
+        self._done = False
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def __iter__(self) -> Iterator[list[Any]]:
+        """
+        Yields the raw items of every page in order, fetching on demand whatever was not prefetched
+        """
+        try:
+            while True:
+                with self._lock:
+                    if not self._pages:
+                        if self._done:
+                            return
+                        self._schedule()
+                    future = self._pages[0]
+                items = future.result()
+                with self._lock:
+                    self._pages.popleft()
+                    self._prefetch()
+                yield items
+        finally:
+            self.close()
+
+    def start(self) -> None:
+        """
+        Starts fetching the first page before it is asked for
+        """
+        with self._lock:
+            self._prefetch()
+
+    def close(self) -> None:
+        """
+        Stops prefetching, a request already in flight completes and is discarded
+        """
+        with self._lock:
+            self._closed = True
+
+    def _prefetch(self) -> None:
+        if len(self._pages) < self.depth and (self.more is None or self.more(self._fetched)):
+            self._schedule()
+
+    def _schedule(self) -> None:
+        if self._busy or self._done or self._closed:
+            return
+        self._busy = True
+        future: Future = Future()
+        self._pages.append(future)
+        prefetch_executor().submit(self._run, future, self._cursor)
+
+    def _run(self, future: Future, cursor: Any) -> None:
+        try:
+            items, next_cursor = self.fetch(cursor)
+        except BaseException as e:
+            with self._lock:
+                self._busy = False
+                self._done = True
+            future.set_exception(e)
+            return
+        with self._lock:
+            self._busy = False
+            self._fetched += len(items)
+            self._cursor = next_cursor
+            if not items or not next_cursor:
+                self._done = True
+            # the page itself is still queued, so it counts towards depth
+            self._prefetch()
+        future.set_result(items)
@@ -0,0 +1,201 @@
+"""
+jobspy2.scrapers.cassette
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the record/replay transport of the scraper sessions, to profile the parsing
+and processing of a scrape without the network.
+
+A Cassette in "record" mode lets the requests of every session created with it through and writes
+each exchange to a gzip compressed JSON-lines file; in "replay" mode the sessions answer from that
+file without sending anything, bypassing rate limits, retries and circuit breakers. Requests are
+matched on their method, URL with query and body, and answered in recorded order; once the recorded
+responses of a request are used up, the last one is repeated. Replay is instant unless a speed is
+given: 1 waits the recorded latency of every response, 10 a tenth of it.
+
+    with Cassette("linkedin.jsonl.gz", "record"):
+        scrape_jobs(site_name="linkedin", search_term="engineer")
+    with Cassette("linkedin.jsonl.gz", "replay"):
+        scrape_jobs(site_name="linkedin", search_term="engineer")
+
+Entering a cassette binds it to the current context, so create_session uses it for every session
+the scrape creates; create_session(cassette=...) sets it for one session.
+"""
+
+from __future__ import annotations
+
+import base64
+import contextvars
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import IO, Any, Literal
+
+import requests
+
+from ..metrics import current_metrics, stage
+from .exceptions import CassetteMissError, CassetteOptionError, CassetteVersionError
+
+FORMAT_VERSION = 1
+
+_current: contextvars.ContextVar[Cassette | None] = contextvars.ContextVar("jobspy2_cassette", default=None)
+
+
+def request_key(method: str, url: str, params: Any = None, data: Any = None, json_body: Any = None) -> str:
+    """
+    Identifies a request by its method, URL with encoded query and a hash of its encoded body
+    """
+    prepared = requests.Request(method.upper(), url, params=params, data=data, json=json_body).prepare()
+    body = prepared.body or b""
+    if not isinstance(body, bytes):
+        body = str(body).encode()
+    return f"{prepared.method} {prepared.url} {hashlib.sha1(body).hexdigest() if body else '-'}"  # noqa: S324
+
+
+class Cassette:
+    """
+    A file of recorded HTTP exchanges that sessions record to or replay from, see the module docstring.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        mode: Literal["record", "replay"] = "replay",
+        speed: float | None = None,
+    ) -> None:
+        """
+        :param mode: "record" overwrites path, "replay" loads it
+        :param speed: replay timing as a multiple of the recorded one, None replays instantly
+        """
+        if mode not in ("record", "replay"):
+            raise CassetteOptionError("mode", mode, "'record' or 'replay'")
+        if speed is not None and speed <= 0:
+            raise CassetteOptionError("speed", speed, "a positive number")
+        self.path = os.fspath(path)
+        self.mode = mode
+        self.speed = speed
+        self._lock = threading.Lock()
+        self._file: IO[str] | None = None
+        self._token: contextvars.Token | None = None
+        self._entries: dict[str, deque[dict[str, Any]]] = {}
+        self._last: dict[str, dict[str, Any]] = {}
+        if mode == "replay":
+            self._load()
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == "record"
+
+    def _load(self) -> None:
+        with gzip.open(self.path, "rt", encoding="utf-8") as file:
+            header = json.loads(file.readline())
+            if header.get("version") != FORMAT_VERSION:
+                raise CassetteVersionError(header.get("version"), self.path)
+            for line in file:
+                entry = json.loads(line)
+                self._entries.setdefault(entry["key"], deque()).append(entry)
+
+    def exchange(self, key: str, url: str, send: Callable[[], Any], build: Callable[[dict[str, Any]], Any]) -> Any:
+        """
+        Records the response of send, or replays the recorded one
+        :param key: request_key() of the request
+        :param send: sends the request, only called when recording
+        :param build: turns a recorded entry into a response of the session's type
+        :return: response
+        """
+        if self.recording:
+            started = time.perf_counter()
+            response = send()
+            self.record(key, response, time.perf_counter() - started)
+            return response
+        with stage("request", url=url):
+            entry = self._next(key)
+            if self.speed is not None:
+                time.sleep(entry["elapsed"] / self.speed)
+            response = build(entry)
+        site_metrics = current_metrics()
+        if site_metrics is not None:
+            site_metrics.observe_response(entry["elapsed"], len(response.content))
+        return response
+
+    def record(self, key: str, response: Any, elapsed: float) -> None:
+        """
+        Appends an exchange to the cassette file
+        :param response: requests or tls_client response
+        :param elapsed: seconds taken to get the response, retries included
+        """
+        entry = {
+            "key": key,
+            "url": response.url,
+            "status_code": response.status_code,
+            "headers": dict(response.headers),
+            "encoding": response.encoding,
+            "content": base64.b64encode(response.content or b"").decode("ascii"),
+            "elapsed": elapsed,
+        }
+        line = json.dumps(entry) + "\n"
+        with self._lock:
+            if self._file is None:
+                # stays open across records, close() closes it
+                self._file = gzip.open(self.path, "wt", encoding="utf-8")  # noqa: SIM115
+                self._file.write(json.dumps({"version": FORMAT_VERSION}) + "\n")
+            self._file.write(line)
+
+    def _next(self, key: str) -> dict[str, Any]:
+        with self._lock:
+            recorded = self._entries.get(key)
+            if recorded:
+                self._last[key] = recorded.popleft()
+            entry = self._last.get(key)
+        if entry is None:
+            raise CassetteMissError(key, self.path)
+        return entry
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self) -> Cassette:
+        self._token = _current.set(self)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._token is not None:
+            _current.reset(self._token)
+            self._token = None
+        self.close()
+
+
+def current_cassette() -> Cassette | None:
+    """
+    :return: the cassette entered in the current context, None if there is none
+    """
+    return _current.get()
+
+
+def entry_content(entry: dict[str, Any]) -> bytes:
+    return base64.b64decode(entry["content"])
+
+
+def requests_response(entry: dict[str, Any]) -> requests.Response:
+    """
+    Builds a requests response from a recorded entry
+    """
+    from datetime import timedelta
+
+    from requests.structures import CaseInsensitiveDict
+
+    response = requests.Response()
+    response.url = entry["url"]
+    response.status_code = entry["status_code"]
+    response.headers = CaseInsensitiveDict(entry["headers"])
+    response.encoding = entry["encoding"]
+    response._content = entry_content(entry)
+    response.elapsed = timedelta(seconds=entry["elapsed"])
+    return response
@@ -0,0 +1,195 @@
+"""
+jobspy2.scrapers.coordination
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the request pacing and proxy cooldown state shared by every jobspy2 process
+of a host, so parallel scraper processes stay within one site rate instead of each using it fully.
+
+State lives in small files under state_dir(), a directory private to the user, updated under an
+exclusive flock. Proxies are stored as hashes, so no proxy credentials are written to disk. Platforms
+without fcntl keep the state per process.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import stat
+import struct
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+
+STATE_DIR_ENV = "JOBSPY2_STATE_DIR"
+
+# tokens and wall clock time of the last update
+_BUCKET_STATE = struct.Struct("dd")
+
+
+def state_dir() -> Path | None:
+    """
+    Directory of the shared state: $JOBSPY2_STATE_DIR, or jobspy2 in $XDG_RUNTIME_DIR or ~/.cache when
+    unset, created accessible to the user only
+    :return: path, None if sharing is disabled by an empty $JOBSPY2_STATE_DIR, not supported, or unsafe
+        because the directory is not the user's own or others can write to it
+    """
+    if fcntl is None:
+        return None
+    configured = os.environ.get(STATE_DIR_ENV)
+    if configured == "":
+        return None
+    if configured is None:
+        base = os.environ.get("XDG_RUNTIME_DIR") or os.path.join(os.path.expanduser("~"), ".cache")
+        configured = os.path.join(base, "jobspy2")
+    path = Path(configured)
+    try:
+        path.mkdir(mode=0o700, parents=True, exist_ok=True)
+        info = os.lstat(path)
+    except OSError:
+        return None
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o022:
+        from .utils import create_logger
+
+        create_logger("coordination").warning(f"not sharing state through {path}: not a private directory")
+        return None
+    return path
+
+
+def proxy_key(proxy: str) -> str:
+    """
+    :return: hash identifying a proxy in the shared state without its url and credentials
+    """
+    return hashlib.sha256(proxy.encode()).hexdigest()
+
+
+class SharedFile:
+    """
+    A state file locked against other processes with flock and against other threads with a lock.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = Path(path)
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o600)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def locked(self) -> Iterator[int]:
+        """
+        Holds the exclusive lock of the file for the duration of the block
+        :return: file descriptor to read and write
+        """
+        with self._lock:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                yield self._fd
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def read(self) -> bytes:
+        os.lseek(self._fd, 0, os.SEEK_SET)
+        return os.read(self._fd, max(os.fstat(self._fd).st_size, 1))
+
+    def write(self, data: bytes) -> None:
+        os.lseek(self._fd, 0, os.SEEK_SET)
+        os.write(self._fd, data)
+        os.ftruncate(self._fd, len(data))
+
+
+class FileTokenBucket:
+    """
+    Token bucket whose tokens are shared by every process using the same file. Same interface as
+    utils.TokenBucket.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], rate: float, burst: int = 1) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._file = SharedFile(path)
+
+    def reserve(self) -> float:
+        """
+        Takes a token, possibly one that is only available in the future
+        :return: seconds to wait before using it
+        """
+        with self._file.locked():
+            data = self._file.read()
+            now = time.time()
+            tokens, updated = _BUCKET_STATE.unpack(data) if len(data) == _BUCKET_STATE.size else (self.burst, now)
+            tokens = min(self.burst, tokens + max(now - updated, 0) * self.rate) - 1
+            self._file.write(_BUCKET_STATE.pack(tokens, now))
+        return -tokens / self.rate if tokens < 0 else 0.0
+
+    def acquire(self) -> None:
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+
+class ProxyCooldowns:
+    """
+    Proxies that were rate limited or failed, and until when they should not be used, by proxy_key.
+    Shared through a file when a path is given, else per process.
+    """
+
+    def __init__(self, path: str | os.PathLike[str] | None = None) -> None:
+        self._file = SharedFile(path) if path is not None else None
+        self._until: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _state(self) -> Iterator[dict[str, float]]:
+        if self._file is None:
+            with self._lock:
+                yield self._until
+            return
+        with self._file.locked():
+            data = self._file.read()
+            try:
+                until = json.loads(data) if data.strip() else {}
+            except ValueError:
+                until = {}
+            now = time.time()
+            until = {key: expiry for key, expiry in until.items() if expiry > now}
+            yield until
+            self._file.write(json.dumps(until).encode())
+
+    def cool_down(self, proxy: str, seconds: float) -> None:
+        """
+        Keeps a proxy out of rotation for seconds, or longer if it is already cooling down
+        """
+        key = proxy_key(proxy)
+        expiry = time.time() + seconds
+        with self._state() as until:
+            until[key] = max(until.get(key, 0.0), expiry)
+
+    def cooling(self) -> dict[str, float]:
+        """
+        :return: wall clock expiry of every proxy still cooling down, by proxy_key
+        """
+        now = time.time()
+        with self._state() as until:
+            return {key: expiry for key, expiry in until.items() if expiry > now}
+
+
+_proxy_cooldowns: ProxyCooldowns | None = None
+_proxy_cooldowns_lock = threading.Lock()
+
+
+def proxy_cooldowns() -> ProxyCooldowns:
+    """
+    Returns the proxy cooldowns of the process, shared with other processes through state_dir()
+    """
+    global _proxy_cooldowns
+    with _proxy_cooldowns_lock:
+        if _proxy_cooldowns is None:
+            directory = state_dir()
+            _proxy_cooldowns = ProxyCooldowns(directory / "proxy_cooldowns.json" if directory is not None else None)
+        return _proxy_cooldowns
@@ -5,6 +5,8 @@ jobspy2.scrapers.exceptions
 This module contains the set of Scrapers' exceptions.
 """
 
+import requests
+
 
 class LinkedInException(Exception):
     """Raised when there's an error processing LinkedIn job data."""
@@ -42,3 +44,35 @@ class GlassdoorLocationError(Exception):
     def __init__(self, location: str) -> None:
         self.message = f"Location {location!r} not found on Glassdoor"
         super().__init__(self.message)
+
+
+class CircuitOpenError(requests.RequestException):
+    """Raised instead of sending a request to a host whose circuit breaker is open."""
+
+    def __init__(self, host: str, retry_in: float) -> None:
+        self.message = f"Circuit open for {host!r} after repeated failures, retrying in {retry_in:.0f}s"
+        super().__init__(self.message)
+
+
+class CassetteMissError(requests.RequestException):
+    """Raised when a replayed cassette has no recorded response for a request."""
+
+    def __init__(self, key: str, path: str) -> None:
+        self.message = f"No recorded response for {key!r} in cassette {path!r}"
+        super().__init__(self.message)
+
+
+class CassetteOptionError(ValueError):
+    """Raised when a cassette is opened with an invalid mode or speed."""
+
+    def __init__(self, option: str, value: object, expected: str) -> None:
+        self.message = f"Invalid cassette {option} {value!r}, expected {expected}"
+        super().__init__(self.message)
+
+
+class CassetteVersionError(ValueError):
+    """Raised when a replayed cassette was written in an unsupported format version."""
+
+    def __init__(self, version: object, path: str) -> None:
+        self.message = f"Unsupported cassette version {version!r} in {path}"
+        super().__init__(self.message)
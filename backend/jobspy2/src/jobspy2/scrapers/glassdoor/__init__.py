@@ -10,10 +10,11 @@ from __future__ import annotations
 import json
 import logging
 import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Iterator
+from concurrent.futures import as_completed
 from datetime import datetime, timedelta
 from typing import Any
-from urllib.parse import urlencode
+from urllib.parse import urlencode, urlsplit
 
 import requests
 
@@ -22,16 +23,19 @@ from ...jobs import (
     CompensationInterval,
     DescriptionFormat,
     JobPost,
-    JobResponse,
     JobType,
     Location,
 )
-from .. import Scraper, ScraperInput, Site
-from ..exceptions import GlassdoorException, GlassdoorLocationError
+from ...metrics import count, timed
+from .. import PageWindow, Scraper, ScraperInput, Site
+from ..exceptions import CircuitOpenError, GlassdoorException, GlassdoorLocationError
 from ..utils import (
+    create_job_post,
     create_logger,
     create_session,
+    detail_executor,
     extract_emails_from_text,
+    host_rate_limiter,
     markdown_converter,
 )
 from .constants import fallback_token, headers, query_template
@@ -60,48 +64,59 @@ class GlassdoorScraper(Scraper):
         self.base_url: str | None = None
         self.country: str | None = None
         self.session: requests.Session | None = None
+        self.detail_session: requests.Session | None = None
         self.scraper_input: ScraperInput | None = None
         self.jobs_per_page: int = 30
         self.max_pages: int = 30
         self.seen_urls: set[str] = set()
 
-    def scrape(self, scraper_input: ScraperInput) -> JobResponse:
+    def iter_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobPost]]:
         """
-        Scrapes Glassdoor for jobs with scraper_input criteria.
+        Scrapes Glassdoor for jobs with scraper_input criteria, one search page at a time.
         :param scraper_input: Information about job search criteria.
-        :return: JobResponse containing a list of jobs.
+        :return: Iterator of job lists, one per page.
         """
         self.scraper_input = scraper_input
         self.scraper_input.results_wanted = min(900, scraper_input.results_wanted)
-        self.base_url = self.scraper_input.country.get_glassdoor_url()
-
-        self.session = create_session(proxies=self.proxies, ca_cert=self.ca_cert, is_tls=True, has_retry=True)
-        token = self._get_csrf_token()
-        headers["gd-csrf-token"] = token if token else fallback_token
-        self.session.headers.update(headers)
+        self.seen_urls = set()
+        base_url = self.scraper_input.country.get_glassdoor_url()
+
+        if self.session is None or base_url != self.base_url:
+            self.base_url = base_url
+            # every Glassdoor domain, searched or fetched for descriptions, is paced like www.glassdoor.com
+            host_rate_limiter.share_rate(urlsplit(base_url).hostname or "", "www.glassdoor.com")
+            self.session = create_session(proxies=self.proxies, ca_cert=self.ca_cert, is_tls=True, has_retry=True)
+            # descriptions are fetched without proxies or the search session's headers
+            self.detail_session = create_session(ca_cert=self.ca_cert, is_tls=False)
+            token = self._get_csrf_token()
+            headers["gd-csrf-token"] = token if token else fallback_token
+            self.session.headers.update(headers)
 
         location_id, location_type = self._get_location(scraper_input.location, scraper_input.is_remote)
         if location_type is None:
-            self.logger.error("Glassdoor: location not parsed")
-            return JobResponse(jobs=[])
-        job_list: list[JobPost] = []
+            if not self.truncated:
+                self.logger.error("Glassdoor: location not parsed")
+            return
+        window = PageWindow(scraper_input.results_wanted)
         cursor = None
 
         range_start = 1 + (scraper_input.offset // self.jobs_per_page)
         tot_pages = (scraper_input.results_wanted // self.jobs_per_page) + 2
         range_end = min(tot_pages, self.max_pages + 1)
         for page in range(range_start, range_end):
+            if self.out_of_time():
+                break
             self.logger.info(f"search page: {page} / {range_end - 1}")
             try:
                 jobs, cursor = self._fetch_jobs_page(scraper_input, location_id, location_type, page, cursor)
-                job_list.extend(jobs)
-                if not jobs or len(job_list) >= scraper_input.results_wanted:
-                    job_list = job_list[: scraper_input.results_wanted]
-                    break
             except Exception:
                 self.logger.exception("Glassdoor error")
                 break
-        return JobResponse(jobs=job_list)
+            page_jobs = self.take_page(window, jobs)
+            if page_jobs:
+                yield page_jobs
+            if not jobs or window.full:
+                break
 
     def _raise_for_status(self, response: requests.Response) -> dict[str, Any]:
         """Handle error responses from Glassdoor API."""
@@ -129,25 +144,28 @@ class GlassdoorScraper(Scraper):
             payload = self._add_payload(location_id, location_type, page_num, cursor)
             response = self.session.post(
                 f"{self.base_url}/graph",
-                timeout=15,
+                timeout=self.request_timeout(15),
                 data=payload,
             )
             res_json = self._raise_for_status(response)
+        except CircuitOpenError as e:
+            self.circuit_open(e)
+            return jobs, None
         except Exception:
             self.logger.exception("Glassdoor error")
             return jobs, None
 
         jobs_data = res_json["data"]["jobListings"]["jobListings"]
 
-        with ThreadPoolExecutor(max_workers=self.jobs_per_page) as executor:
-            future_to_job_data = {executor.submit(self._process_job, job): job for job in jobs_data}
-            for future in as_completed(future_to_job_data):
-                try:
-                    job_post = future.result()
-                    if job_post:
-                        jobs.append(job_post)
-                except Exception as exc:
-                    raise GlassdoorException(GlassdoorException.JOB_PROCESSING_FAILED) from exc
+        executor = detail_executor()
+        future_to_job_data = {executor.submit(self._process_job, job): job for job in jobs_data}
+        for future in as_completed(future_to_job_data):
+            try:
+                job_post = future.result()
+                if job_post:
+                    jobs.append(job_post)
+            except Exception as exc:
+                raise GlassdoorException(GlassdoorException.JOB_PROCESSING_FAILED) from exc
 
         return jobs, self.get_cursor_for_page(res_json["data"]["jobListings"]["paginationCursors"], page_num + 1)
 
@@ -157,7 +175,11 @@ class GlassdoorScraper(Scraper):
         """
         if not self.session or not self.base_url:
             return None
-        res = self.session.get(f"{self.base_url}/Job/computer-science-jobs.htm")
+        try:
+            res = self.session.get(f"{self.base_url}/Job/computer-science-jobs.htm", timeout=self.request_timeout())
+        except CircuitOpenError as e:
+            self.circuit_open(e)
+            return None
         pattern = r'"token":\s*"([^"]+)"'
         matches = re.findall(pattern, res.text)
         token = None
@@ -165,6 +187,7 @@ class GlassdoorScraper(Scraper):
             token = matches[0]
         return token
 
+    @timed("parse")
     def _process_job(self, job_data: dict[str, Any]) -> JobPost | None:
         """
         Processes a single job and fetches its description.
@@ -195,14 +218,19 @@ class GlassdoorScraper(Scraper):
         compensation = self.parse_compensation(job["header"])
         description = None
         try:
-            description = self._fetch_job_description(job_id)
+            if (
+                self.wants("description", "emails")
+                and not self.out_of_time()
+                and not self.known_elsewhere(title, company_name, location)
+            ):
+                description = self._fetch_job_description(job_id)
         except Exception:
             self.logger.exception("Failed to fetch job description")
 
         company_url = f"{self.base_url}Overview/W-EI_IE{company_id}.htm"
         company_logo = job_data["jobview"].get("overview", {}).get("squareLogoUrl", None)
         listing_type = job_data["jobview"].get("header", {}).get("adOrderSponsorshipLevel", "").lower()
-        return JobPost(
+        return create_job_post(
             id=f"gd-{job_id}",
             title=title,
             company_url=company_url if company_id else None,
@@ -213,7 +241,7 @@ class GlassdoorScraper(Scraper):
             compensation=compensation,
             is_remote=is_remote,
             description=description,
-            emails=extract_emails_from_text(description) if description else None,
+            emails=extract_emails_from_text(description) if description and self.wants("emails") else None,
             company_logo=company_logo,
             listing_type=listing_type,
         )
@@ -222,8 +250,9 @@ class GlassdoorScraper(Scraper):
         """
         Fetches the job description for a single job ID.
         """
-        if not self.base_url or not self.scraper_input:
+        if not self.base_url or not self.scraper_input or not self.detail_session:
             return None
+        count("detail_requests")
         url = f"{self.base_url}/graph"
         body = [
             {
@@ -249,18 +278,23 @@ class GlassdoorScraper(Scraper):
                 """,
             }
         ]
-        res = requests.post(url, json=body, headers=headers, timeout=10)
+        try:
+            res = self.detail_session.post(url, json=body, headers=headers, timeout=self.request_timeout(10))
+        except CircuitOpenError as e:
+            self.circuit_open(e)
+            return None
         if res.status_code != 200:
             return None
         data = res.json()[0]
         desc = data["data"]["jobview"]["job"]["description"]
-        if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
+        if self.scraper_input.description_format == DescriptionFormat.MARKDOWN and self.wants("description"):
             desc = markdown_converter(desc)
         return desc
 
-    def _get_location(self, location: str | None, is_remote: bool) -> tuple[int, str]:
+    def _get_location(self, location: str | None, is_remote: bool) -> tuple[int, str | None]:
         """
         Gets the location ID and type from Glassdoor.
+        :return: location ID and type, type None if the host's circuit is open
         """
         if not self.base_url or not self.session:
             raise GlassdoorException("Session not initialized")
@@ -276,6 +310,7 @@ class GlassdoorScraper(Scraper):
             response = self.session.get(
                 f'{self.base_url}findPopularLocationAjax.htm?',
                 params=params,
+                timeout=self.request_timeout(),
             )
             if response.status_code != 200:
                 raise GlassdoorException(f'{response.status_code} {response.text}')
@@ -283,6 +318,9 @@ class GlassdoorScraper(Scraper):
             if not locations:
                 raise GlassdoorLocationError(location)
             return locations[0]["locationId"], locations[0]["locationType"]
+        except CircuitOpenError as e:
+            self.circuit_open(e)
+            return 0, None
         except Exception as e:
             raise GlassdoorException() from e
 
@@ -11,6 +11,8 @@ import json
 import logging
 import math
 import re
+from collections.abc import Iterator
+from contextlib import closing
 from datetime import datetime, timedelta
 from typing import Any
 from urllib.parse import urlencode
@@ -19,12 +21,14 @@ import requests
 
 from ...jobs import (
     JobPost,
-    JobResponse,
     JobType,
     Location,
 )
-from .. import Scraper, ScraperInput, Site
+from ...metrics import timed
+from .. import PageWindow, Scraper, ScraperInput, Site
+from ..exceptions import CircuitOpenError
 from ..utils import (
+    create_job_post,
     create_logger,
     create_session,
     extract_emails_from_text,
@@ -50,36 +54,51 @@ class GoogleJobsScraper(Scraper):
         self.url: str = "https://www.google.com/search"
         self.jobs_url: str = "https://www.google.com/async/callback:550"
 
-    def scrape(self, scraper_input: ScraperInput) -> JobResponse:
+    def iter_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobPost]]:
         """
-        Scrapes Google for jobs with scraper_input criteria.
+        Scrapes Google for jobs with scraper_input criteria, one search page at a time.
         :param scraper_input: Information about job search criteria.
-        :return: JobResponse containing a list of jobs.
+        :return: Iterator of job lists, one per page.
         """
         self.scraper_input = scraper_input
         self.scraper_input.results_wanted = min(900, scraper_input.results_wanted)
-
-        self.session = create_session(proxies=self.proxies, ca_cert=self.ca_cert, is_tls=False, has_retry=True)
-        forward_cursor, job_list = self._get_initial_cursor_and_jobs()
-        if forward_cursor is None:
-            self.logger.warning("initial cursor not found, try changing your query or there was at most 10 results")
-            return JobResponse(jobs=job_list)
-
-        page = 1
-
-        while len(self.seen_urls) < scraper_input.results_wanted + scraper_input.offset and forward_cursor:
-            self.logger.info(f"search page: {page} / {math.ceil(scraper_input.results_wanted / self.jobs_per_page)}")
-            try:
-                jobs, forward_cursor = self._get_jobs_next_page(forward_cursor)
-            except Exception:
-                self.logger.exception(f"failed to get jobs on page: {page}")
-                break
-            if not jobs:
-                self.logger.info(f"found no jobs on page: {page}")
-                break
-            job_list += jobs
-            page += 1
-        return JobResponse(jobs=job_list[scraper_input.offset : scraper_input.offset + scraper_input.results_wanted])
+        window = PageWindow(scraper_input.results_wanted, scraper_input.offset)
+
+        self.seen_urls = set()
+        if self.session is None:
+            self.session = create_session(proxies=self.proxies, ca_cert=self.ca_cert, is_tls=False, has_retry=True)
+        wanted = scraper_input.results_wanted + scraper_input.offset
+        forward_cursor, jobs_raw = self._get_initial_cursor_and_jobs()
+        with closing(self.paginate(self._get_jobs_next_page, forward_cursor, wanted=wanted - len(jobs_raw))) as pages:
+            if forward_cursor:
+                pages.start()
+            page_jobs = window.take(self._parse_job_infos(jobs_raw))
+            if page_jobs:
+                yield page_jobs
+            if forward_cursor is None:
+                return
+
+            page = 1
+            page_iter = iter(pages)
+            while len(self.seen_urls) < wanted:
+                if self.out_of_time():
+                    break
+                self.logger.info(
+                    f"search page: {page} / {math.ceil(scraper_input.results_wanted / self.jobs_per_page)}"
+                )
+                try:
+                    job_infos = next(page_iter, None)
+                except Exception:
+                    self.logger.exception(f"failed to get jobs on page: {page}")
+                    break
+                jobs = self._parse_job_infos(job_infos or [])
+                if not jobs:
+                    self.logger.info(f"found no jobs on page: {page}")
+                    break
+                page_jobs = window.take(jobs)
+                if page_jobs:
+                    yield page_jobs
+                page += 1
 
     def _build_search_query(self) -> str:
         """Builds the search query string based on scraper input parameters"""
@@ -122,8 +141,8 @@ class GoogleJobsScraper(Scraper):
             return "in the last week"
         return "in the last month"
 
-    def _get_initial_cursor_and_jobs(self) -> tuple[str | None, list[JobPost]]:
-        """Gets initial cursor and jobs to paginate through job listings"""
+    def _get_initial_cursor_and_jobs(self) -> tuple[str | None, list[Any]]:
+        """Gets initial cursor and raw job infos to paginate through job listings"""
         if not self.session:
             return None, []
         query = self._build_search_query()
@@ -133,21 +152,23 @@ class GoogleJobsScraper(Scraper):
         full_url = f"{self.url}?{urlencode(params)}"
         self.logger.debug(f"Visiting initial search URL: {full_url}")
         
-        response = self.session.get(self.url, headers=headers_initial, params=params)
+        try:
+            response = self.session.get(
+                self.url, headers=headers_initial, params=params, timeout=self.request_timeout()
+            )
+        except CircuitOpenError as e:
+            self.circuit_open(e)
+            return None, []
 
         pattern_fc = r'<div jsname="Yust4d"[^>]+data-async-fc="([^"]+)"'
         match_fc = re.search(pattern_fc, response.text)
         data_async_fc = match_fc.group(1) if match_fc else None
+        if data_async_fc is None:
+            self.logger.warning("initial cursor not found, try changing your query or there was at most 10 results")
 
-        jobs_raw = self._find_job_info_initial_page(response.text, self.logger)
-        jobs: list[JobPost] = []
-        for job_raw in jobs_raw:
-            job_post = self._parse_job(job_raw)
-            if job_post:
-                jobs.append(job_post)
-        return data_async_fc, jobs
+        return data_async_fc, self._find_job_info_initial_page(response.text, self.logger)
 
-    def _get_jobs_next_page(self, forward_cursor: str) -> tuple[list[JobPost], str | None]:
+    def _get_jobs_next_page(self, forward_cursor: str) -> tuple[list[list[Any]], str | None]:
         if not self.session:
             return [], None
         params = {"fc": [forward_cursor], "fcv": ["3"], "async": [async_param]}
@@ -156,12 +177,19 @@ class GoogleJobsScraper(Scraper):
         full_url = f"{self.jobs_url}?{urlencode(params, doseq=True)}"
         self.logger.debug(f"Visiting next page URL: {full_url}")
         
-        response = self.session.get(self.jobs_url, headers=headers_jobs, params=params)
-        return self._parse_jobs(response.text)
+        try:
+            response = self.session.get(
+                self.jobs_url, headers=headers_jobs, params=params, timeout=self.request_timeout()
+            )
+        except CircuitOpenError as e:
+            self.circuit_open(e)
+            return [], None
+        return self._find_jobs(response.text)
 
-    def _parse_jobs(self, job_data: str) -> tuple[list[JobPost], str | None]:
+    @timed("parse")
+    def _find_jobs(self, job_data: str) -> tuple[list[list[Any]], str | None]:
         """
-        Parses jobs on a page with next page cursor
+        Finds the raw job infos on a page with next page cursor
         """
         start_idx = job_data.find("[[[")
         end_idx = job_data.rindex("]]]") + 3
@@ -171,7 +199,7 @@ class GoogleJobsScraper(Scraper):
         pattern_fc = r'data-async-fc="([^"]+)"'
         match_fc = re.search(pattern_fc, job_data)
         data_async_fc = match_fc.group(1) if match_fc else None
-        jobs_on_page: list[JobPost] = []
+        job_infos: list[list[Any]] = []
         for array in parsed:
             _, job_data = array
             if not job_data.startswith("[[["):
@@ -179,13 +207,19 @@ class GoogleJobsScraper(Scraper):
             job_d = json.loads(job_data)
 
             job_info = self._find_job_info(job_d)
-            if not job_info:
-                continue
+            if job_info:
+                job_infos.append(job_info)
+        return job_infos, data_async_fc
+
+    def _parse_job_infos(self, job_infos: list[Any]) -> list[JobPost]:
+        jobs: list[JobPost] = []
+        for job_info in job_infos:
             job_post = self._parse_job(job_info)
             if job_post:
-                jobs_on_page.append(job_post)
-        return jobs_on_page, data_async_fc
+                jobs.append(job_post)
+        return jobs
 
+    @timed("parse")
     def _parse_job(self, job_info: list[Any]) -> JobPost | None:
         job_url = job_info[3][0][0] if job_info[3] and job_info[3][0] else None
         if not job_url or job_url in self.seen_urls:
@@ -207,7 +241,7 @@ class GoogleJobsScraper(Scraper):
 
         description = job_info[19]
 
-        return JobPost(
+        return create_job_post(
             id=f"go-{job_info[28]}",
             title=title,
             company_name=company_name,
@@ -216,7 +250,7 @@ class GoogleJobsScraper(Scraper):
             date_posted=date_posted,
             is_remote="remote" in description.lower() or "wfh" in description.lower(),
             description=description,
-            emails=extract_emails_from_text(description),
+            emails=extract_emails_from_text(description) if self.wants("emails") else None,
             job_type=extract_job_type(description),
         )
 
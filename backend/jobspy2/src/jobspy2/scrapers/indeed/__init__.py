@@ -9,6 +9,8 @@ from __future__ import annotations
 
 import logging
 import math
+from collections.abc import Iterator
+from contextlib import closing
 from datetime import datetime
 from typing import Any
 
@@ -17,12 +19,14 @@ from ...jobs import (
     CompensationInterval,
     DescriptionFormat,
     JobPost,
-    JobResponse,
     JobType,
     Location,
 )
-from .. import Scraper, ScraperInput, Site
+from ...metrics import timed
+from .. import PageWindow, Scraper, ScraperInput, Site
+from ..exceptions import CircuitOpenError
 from ..utils import (
+    create_job_post,
     create_logger,
     create_session,
     extract_emails_from_text,
@@ -49,7 +53,7 @@ class IndeedScraper(Scraper):
         """
         super().__init__(Site.INDEED, logger=logger, proxies=proxies, ca_cert=ca_cert)
 
-        self.session = create_session(proxies=self.proxies, ca_cert=ca_cert, is_tls=False)
+        self.session = create_session(proxies=self.proxies, ca_cert=ca_cert, is_tls=False, has_retry=True)
         self.scraper_input: ScraperInput | None = None
         self.jobs_per_page: int = 100
         self.num_workers: int = 10
@@ -59,42 +63,48 @@ class IndeedScraper(Scraper):
         self.base_url: str | None = None
         self.api_url: str = "https://apis.indeed.com/graphql"
 
-    def scrape(self, scraper_input: ScraperInput) -> JobResponse:
+    def iter_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobPost]]:
         """
-        Scrapes Indeed for jobs with scraper_input criteria
+        Scrapes Indeed for jobs with scraper_input criteria, one search page at a time
         :param scraper_input:
-        :return: job_response
+        :return: iterator of jobs per page
         """
         self.scraper_input = scraper_input
+        self.seen_urls = set()
         domain, self.api_country_code = self.scraper_input.country.indeed_domain_value
         self.base_url = f"https://{domain}.indeed.com"
         self.headers = api_headers.copy()
         self.headers["indeed-co"] = self.api_country_code
-        job_list: list[JobPost] = []
+        window = PageWindow(scraper_input.results_wanted, scraper_input.offset)
+        wanted = scraper_input.results_wanted + scraper_input.offset
         page = 1
 
-        cursor = None
+        with closing(self.paginate(self._fetch_page, wanted=wanted)) as pages:
+            page_iter = iter(pages)
+            while len(self.seen_urls) < wanted:
+                if self.out_of_time():
+                    break
+                self.logger.info(
+                    f"search page: {page} / {math.ceil(scraper_input.results_wanted / self.jobs_per_page)}"
+                )
+                jobs_data = next(page_iter, None)
+                jobs = [job for job in (self._process_job(data["job"]) for data in jobs_data or []) if job]
+                if not jobs:
+                    self.logger.info(f"found no jobs on page: {page}")
+                    break
+                page_jobs = window.take(jobs)
+                if page_jobs:
+                    yield page_jobs
+                page += 1
 
-        while len(self.seen_urls) < scraper_input.results_wanted + scraper_input.offset:
-            self.logger.info(f"search page: {page} / {math.ceil(scraper_input.results_wanted / self.jobs_per_page)}")
-            jobs, cursor = self._scrape_page(cursor)
-            if not jobs:
-                self.logger.info(f"found no jobs on page: {page}")
-                break
-            job_list += jobs
-            page += 1
-        return JobResponse(jobs=job_list[scraper_input.offset : scraper_input.offset + scraper_input.results_wanted])
-
-    def _scrape_page(self, cursor: str | None) -> tuple[list[JobPost], str | None]:
+    def _fetch_page(self, cursor: str | None) -> tuple[list[dict[str, Any]], str | None]:
         """
-        Scrapes a page of Indeed for jobs with scraper_input criteria
+        Requests a page of Indeed results with scraper_input criteria
         :param cursor:
-        :return: jobs found on page, next page cursor
+        :return: raw results of the page, next page cursor
         """
         if not self.scraper_input or not self.api_country_code:
             return [], None
-        jobs: list[JobPost] = []
-        new_cursor = None
         filters = self._build_filters()
         search_term = self.scraper_input.search_term.replace('"', '\\"') if self.scraper_input.search_term else ""
         query = job_search_query.format(
@@ -123,28 +133,23 @@ class IndeedScraper(Scraper):
         self.logger.debug("Payload:")
         self.logger.debug(f"  {payload}")
         
-        response = self.session.post(
-            self.api_url,
-            headers=api_headers_temp,
-            json=payload,
-            timeout=10,
-        )
+        try:
+            response = self.session.post(
+                self.api_url,
+                headers=api_headers_temp,
+                json=payload,
+                timeout=self.request_timeout(10),
+            )
+        except CircuitOpenError as e:
+            self.circuit_open(e)
+            return [], None
         if not response.ok:
             self.logger.info(
                 f"responded with status code: {response.status_code} (submit GitHub issue if this appears to be a bug)"
             )
-            return jobs, new_cursor
+            return [], None
         data = response.json()
-        jobs_data = data["data"]["jobSearch"]["results"]
-        new_cursor = data["data"]["jobSearch"]["pageInfo"]["nextCursor"]
-
-        job_list: list[JobPost] = []
-        for job in jobs_data:
-            processed_job = self._process_job(job["job"])
-            if processed_job:
-                job_list.append(processed_job)
-
-        return job_list, new_cursor
+        return data["data"]["jobSearch"]["results"], data["data"]["jobSearch"]["pageInfo"]["nextCursor"]
 
     def _build_filters(self) -> str:
         """
@@ -204,6 +209,7 @@ class IndeedScraper(Scraper):
                 """
         return filters_str
 
+    @timed("parse")
     def _process_job(self, job: dict[str, Any]) -> JobPost | None:
         """
         Parses the job dict into JobPost model
@@ -217,7 +223,7 @@ class IndeedScraper(Scraper):
             return None
         self.seen_urls.add(job_url)
         description = job["description"]["html"]
-        if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
+        if self.scraper_input.description_format == DescriptionFormat.MARKDOWN and self.wants("description"):
             description = markdown_converter(description)
 
         job_type = self._get_job_type(job["attributes"])
@@ -226,7 +232,7 @@ class IndeedScraper(Scraper):
         employer = job["employer"].get("dossier") if job["employer"] else None
         employer_details = employer.get("employerDetails", {}) if employer else {}
         rel_url = job["employer"]["relativeCompanyPageUrl"] if job["employer"] else None
-        return JobPost(
+        return create_job_post(
             id=f"in-{job['key']}",
             title=job["title"],
             description=description,
@@ -243,7 +249,7 @@ class IndeedScraper(Scraper):
             date_posted=date_posted,
             job_url=job_url,
             job_url_direct=(job["recruit"].get("viewJobUrl") if job.get("recruit") else None),
-            emails=extract_emails_from_text(description) if description else None,
+            emails=extract_emails_from_text(description) if description and self.wants("emails") else None,
             is_remote=self._is_job_remote(job, description),
             company_addresses=(employer_details["addresses"][0] if employer_details.get("addresses") else None),
             company_industry=(
@@ -8,9 +8,8 @@ This module contains routines to scrape LinkedIn.
 from __future__ import annotations
 
 import math
-import random
-import time
-from datetime import datetime
+from collections.abc import Iterator
+from datetime import date, datetime
 from typing import Any
 from urllib.parse import unquote, urlparse, urlunparse, urlencode
 import logging
@@ -25,13 +24,14 @@ from ...jobs import (
     Country,
     DescriptionFormat,
     JobPost,
-    JobResponse,
     JobType,
     Location,
 )
+from ...metrics import count, timed
 from .. import LinkedInExperienceLevel, Scraper, ScraperInput, Site
-from ..exceptions import LinkedInException
+from ..exceptions import CircuitOpenError, LinkedInException
 from ..utils import (
+    create_job_post,
     create_logger,
     create_session,
     currency_parser,
@@ -53,11 +53,12 @@ experience_level_map: dict[LinkedInExperienceLevel, str] = {
     LinkedInExperienceLevel.EXECUTIVE: "6",
 }
 
+# output columns filled from a job's detail page
+DETAIL_FIELDS = ("description", "emails", "job_type", "job_level", "company_industry", "job_url_direct")
+
 
 class LinkedInScraper(Scraper):
     base_url = "https://www.linkedin.com"
-    delay = 3
-    band_delay = 4
     jobs_per_page = 25
 
     def __init__(self, logger: logging.Logger, proxies: list[str] | str | None = None, ca_cert: str | None = None) -> None:
@@ -79,9 +80,9 @@ class LinkedInScraper(Scraper):
         self.country: str = "worldwide"
         self.job_url_direct_regex = re.compile(r'(?<=\?url=)[^"]+')
 
-    def scrape(self, scraper_input: ScraperInput) -> JobResponse:
+    def iter_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobPost]]:
         """
-        Scrapes LinkedIn for jobs with scraper_input criteria
+        Scrapes LinkedIn for jobs with scraper_input criteria, one search page at a time
         """
         self.scraper_input = scraper_input
         job_list: list[JobPost] = []
@@ -91,27 +92,30 @@ class LinkedInScraper(Scraper):
         seconds_old = scraper_input.hours_old * 3600 if scraper_input.hours_old else None
 
         while self._should_continue_search(job_list, start):
+            if self.out_of_time():
+                break
             request_count += 1
             self.logger.info(f"search page: {request_count} / {math.ceil(scraper_input.results_wanted / 10)}")
 
             response = self._make_search_request(start, seconds_old)
             if not response:
-                return JobResponse(jobs=job_list)
+                return
 
             job_cards = self._get_job_cards(response)
             if not job_cards:
-                return JobResponse(jobs=job_list)
+                return
 
-            if not self._process_job_cards(job_cards, job_list, seen_ids):
+            page_start = len(job_list)
+            should_continue = self._process_job_cards(job_cards, job_list, seen_ids)
+            if len(job_list) > page_start:
+                yield job_list[page_start : scraper_input.results_wanted]
+            if not should_continue:
                 break
 
             if self._should_continue_search(job_list, start):
-                time.sleep(random.uniform(self.delay, self.delay + self.band_delay))  # noqa: S311
+                # pages are paced by the www.linkedin.com rate of host_rate_limiter
                 start += len(job_list)
 
-        job_list = job_list[: self.scraper_input.results_wanted]
-        return JobResponse(jobs=job_list)
-
     def _should_continue_search(self, job_list: list[JobPost], start: int) -> bool:
         if not self.scraper_input:
             return False
@@ -129,7 +133,7 @@ class LinkedInScraper(Scraper):
             response = self.session.get(
                 f"{self.base_url}/jobs-guest/jobs/api/seeMoreJobPostings/search",
                 params=params,
-                timeout=10,
+                timeout=self.request_timeout(10),
             )
             if response.status_code not in range(200, 400):
                 err = (
@@ -141,6 +145,9 @@ class LinkedInScraper(Scraper):
                 return None
             else:
                 return response
+        except CircuitOpenError as e:
+            self.circuit_open(e)
+            return None
         except Exception as e:
             if "Proxy responded with" in str(e):
                 self.logger.exception("LinkedIn: Bad proxy")
@@ -175,6 +182,7 @@ class LinkedInScraper(Scraper):
             params["f_TPR"] = f"r{seconds_old}"
         return {k: v for k, v in params.items() if v is not None}
 
+    @timed("parse")
     def _get_job_cards(self, response: requests.Response) -> list[Tag]:
         soup = BeautifulSoup(response.text, "html.parser")
         return soup.find_all("div", class_="base-search-card")
@@ -207,6 +215,7 @@ class LinkedInScraper(Scraper):
                 raise LinkedInException() from err
         return True
 
+    @timed("parse")
     def _process_job(self, job_card: Tag, job_id: str, full_descr: bool) -> JobPost | None:
         salary_tag = job_card.find("span", class_="job-search-card__salary-info")
 
@@ -246,10 +255,15 @@ class LinkedInScraper(Scraper):
             except ValueError as e:
                 self.logger.warning(f"Failed to parse date {datetime_str}: {e}")
         job_details: dict[str, Any] = {}
-        if full_descr:
+        if (
+            full_descr
+            and self.wants(*DETAIL_FIELDS)
+            and not self.out_of_time()
+            and not self.known_elsewhere(title, company, location)
+        ):
             job_details = self._get_job_details(job_id)
 
-        return JobPost(
+        return create_job_post(
             id=f"li-{job_id}",
             title=title,
             company_name=company,
@@ -263,7 +277,7 @@ class LinkedInScraper(Scraper):
             company_industry=job_details.get("company_industry"),
             description=job_details.get("description"),
             job_url_direct=job_details.get("job_url_direct"),
-            emails=extract_emails_from_text(job_details.get("description")),
+            emails=extract_emails_from_text(job_details.get("description")) if self.wants("emails") else None,
         )
 
     def _get_job_details(self, job_id: str) -> dict[str, Any]:
@@ -274,9 +288,13 @@ class LinkedInScraper(Scraper):
         """
         if not self.scraper_input:
             return {}
+        count("detail_requests")
         try:
-            response = self.session.get(f"{self.base_url}/jobs/view/{job_id}", timeout=5)
+            response = self.session.get(f"{self.base_url}/jobs/view/{job_id}", timeout=self.request_timeout(5))
             response.raise_for_status()
+        except CircuitOpenError as e:
+            self.circuit_open(e)
+            return {}
         except (requests.RequestException, TimeoutError) as e:
             self.logger.warning(f"Failed to get job details: {e}")
             return {}
@@ -289,7 +307,7 @@ class LinkedInScraper(Scraper):
         if div_content is not None:
             div_content = remove_attributes(div_content)
             description = div_content.prettify(formatter="html")
-            if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
+            if self.scraper_input.description_format == DescriptionFormat.MARKDOWN and self.wants("description"):
                 description = markdown_converter(description)
 
         h3_tag = soup.find("h3", text=lambda text: text and "Job function" in text.strip())
@@ -435,9 +453,9 @@ class LinkedInScraper(Scraper):
             JobType.TEMPORARY: "T",
         }.get(job_type_enum, "")
 
-    def _parse_date(self, datetime_str: str) -> datetime | None:
+    def _parse_date(self, datetime_str: str) -> date | None:
         try:
-            return datetime.strptime(datetime_str, "%Y-%m-%d")
+            return datetime.strptime(datetime_str, "%Y-%m-%d").date()
         except ValueError as e:
             self.logger.warning(f"Failed to parse date {datetime_str}: {e}")
             return None
@@ -0,0 +1,411 @@
+"""
+jobspy2.scrapers.markdown
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the conversion of job descriptions from HTML to Markdown behind
+markdown_converter.
+
+html_to_markdown gives the Markdown of markdownify with its default options. For the markup job
+boards use, paragraphs, divs and sections, headings, lists, links, images, line breaks, rules, bold,
+italic and struck-through text, and inline tags like span or font that are passed through, it
+tokenizes the HTML with one regular expression and converts a tree of plain elements, with the
+rules of markdownify, instead of having BeautifulSoup build its tree and markdownify walk it through
+sibling and parent lookups. Descriptions with any other markup, like tables, code, comments or
+scripts, or with markup the strict tokenizer could read differently than html.parser, are converted
+by markdownify.
+
+Conversions are memoized in a bounded LRU keyed by a hash of the HTML, since boilerplate
+descriptions recur across the postings of a company and across sites.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from html import unescape
+
+from ..metrics import count
+
+CACHE_SIZE = 1024
+
+# markdownify drops the whitespace around and at the edges of these
+_BLOCKS = frozenset({"p", "div", "article", "section", "ul", "ol", "li", "h1", "h2", "h3", "h4", "h5", "h6"})
+_HEADINGS = {"h1": 1, "h2": 2, "h3": 3, "h4": 4, "h5": 5, "h6": 6}
+_MARKUP = {"b": "**", "strong": "**", "i": "*", "em": "*", "del": "~~", "s": "~~", "sub": "", "sup": ""}
+# tags without a conversion in markdownify, their text is kept as is
+_PLAIN = frozenset({
+    "span",
+    "u",
+    "font",
+    "small",
+    "big",
+    "center",
+    "mark",
+    "ins",
+    "abbr",
+    "cite",
+    "strike",
+    "html",
+    "body",
+})
+# empty elements of html.parser, only these three are supported
+_VOID = frozenset({"br", "hr", "img"})
+_SUPPORTED = _BLOCKS | frozenset(_MARKUP) | _PLAIN | _VOID | {"a"}
+
+# a tag html.parser reads the same way, other "<" are left in the text and fall back to markdownify;
+# an unquoted value keeps a trailing "/" like html.parser, so <a href=/jobs/> is not self-closing
+_TAG = re.compile(
+    r"<(?:/([a-zA-Z][-.a-zA-Z0-9:_]*)\s*"
+    r"|([a-zA-Z][a-zA-Z0-9]*)((?:\s+[a-zA-Z_:][-a-zA-Z0-9_:.]*(?:\s*=\s*(?:\"[^\"]*\"|'[^']*'|[^\s\"'=<>`]+(?=[\s>])))?)*)"
+    r"\s*(/?))>"
+)
+_ATTRIBUTE = re.compile(r"([^\s=]+)(?:\s*=\s*(\"[^\"]*\"|'[^']*'|\S+))?")
+# the references html.parser reads with their ";", a "&" it reads as text, or another "&"
+_REFERENCE = re.compile(r"&(?:([a-zA-Z][a-zA-Z0-9]*);|#([0-9]+);|#[xX]([0-9a-fA-F]+);|(?=[a-zA-Z#])()|)")
+_ASCII_SPACES = " \n\t\x0c\r"
+
+# markdownify's whitespace normalization of text
+_NEWLINE_WHITESPACE = re.compile(r"[\t \r\n]*[\r\n][\t \r\n]*")
+_WHITESPACE = re.compile(r"[\t ]+")
+_ALL_WHITESPACE = re.compile(r"[\t \r\n]+")
+
+
+class _UnsupportedError(Exception):
+    pass
+
+
+class _Element:
+    __slots__ = ("attributes", "children", "name", "parent")
+
+    def __init__(self, name: str | None, attributes: str, parent: _Element | None) -> None:
+        self.name = name
+        self.attributes = attributes
+        self.children: list[_Element | str] = []
+        self.parent = parent
+
+    def get(self, name: str) -> str | None:
+        """
+        :return: value of the attribute as BeautifulSoup reads it, None if it is not set
+        """
+        value = None
+        for match in _ATTRIBUTE.finditer(self.attributes):
+            if match[1].lower() == name:
+                value = match[2] or ""
+                if value[:1] in "\"'" and value[:1] == value[-1:] and len(value) > 1:
+                    value = value[1:-1]
+                value = unescape(value)
+        return value
+
+
+_cache: OrderedDict[bytes, str] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def html_to_markdown(html: str) -> str:
+    """
+    Converts HTML to Markdown like markdownify, memoized in an LRU of CACHE_SIZE conversions
+    """
+    key = hashlib.blake2b(html.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    with _cache_lock:
+        markdown = _cache.get(key)
+        if markdown is not None:
+            _cache.move_to_end(key)
+    if markdown is not None:
+        count("markdown_cache_hits")
+        return markdown
+    try:
+        markdown = _convert(_parse(html), inline=False, in_list=False)
+    except _UnsupportedError:
+        from markdownify import markdownify as md
+
+        markdown = md(html)
+    with _cache_lock:
+        _cache[key] = markdown
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return markdown
+
+
+def _parse(html: str) -> _Element:
+    """
+    Builds the tree BeautifulSoup builds with html.parser
+    :raises _UnsupportedError: for a tag without a conversion here or text html.parser would not read as text
+    """
+    root = current = _Element(None, "", None)
+    closed_voids: list[str] = []
+    data: list[str] = []
+    position = 0
+    for match in _TAG.finditer(html):
+        if match.start() > position:
+            data.append(_resolve(html[position : match.start()]))
+        position = match.end()
+        end_name, name, attributes, self_closing = match.groups()
+        if end_name is not None:
+            end_name = end_name.lower()
+            if end_name in closed_voids:
+                # the end tag of "<br>...</br>", which BeautifulSoup ignores without ending the text
+                closed_voids.remove(end_name)
+                continue
+            _flush(current, data)
+            current = _close(current, end_name)
+            continue
+        name = name.lower()
+        if name not in _SUPPORTED:
+            raise _UnsupportedError(name)
+        _flush(current, data)
+        element = _Element(name, attributes, current)
+        current.children.append(element)
+        if not self_closing:
+            if name in _VOID:
+                closed_voids.append(name)
+            else:
+                current = element
+    if position < len(html):
+        data.append(_resolve(html[position:]))
+    _flush(current, data)
+    return root
+
+
+def _close(current: _Element, name: str) -> _Element:
+    """
+    :return: the parent of the innermost open element named name, current if there is none
+    """
+    element: _Element | None = current
+    while element is not None and element.parent is not None:
+        if element.name == name:
+            return element.parent
+        element = element.parent
+    return current
+
+
+def _resolve(text: str) -> str:
+    if "<" in text:
+        raise _UnsupportedError(text)
+    if "&" not in text:
+        return text
+    return _REFERENCE.sub(_reference, text)
+
+
+def _reference(match: re.Match[str]) -> str:
+    from bs4.dammit import EntitySubstitution
+
+    name, decimal, hexadecimal, other = match.groups()
+    if name is not None:
+        # BeautifulSoup keeps an unknown entity without its ";"
+        return EntitySubstitution.HTML_ENTITY_TO_CHARACTER.get(name, f"&{name}")
+    if other is not None:
+        # "&nbsp" without ";" and the like, which html.parser reads in several ways
+        raise _UnsupportedError(match.group())
+    if decimal is None and hexadecimal is None:
+        return "&"
+    codepoint = int(decimal, 10) if decimal is not None else int(hexadecimal, 16)
+    if codepoint in (9, 10, 13) or 32 <= codepoint < 127 or 160 <= codepoint < 0xD800:
+        return chr(codepoint)
+    if 0xE000 <= codepoint <= 0x10FFFF and not 0xFDD0 <= codepoint <= 0xFDEF and codepoint & 0xFFFE != 0xFFFE:
+        return chr(codepoint)
+    # controls, surrogates and noncharacters are replaced differently across BeautifulSoup versions
+    raise _UnsupportedError(match.group())
+
+
+def _flush(parent: _Element, data: list[str]) -> None:
+    if not data:
+        return
+    text = "".join(data)
+    data.clear()
+    if not text.strip(_ASCII_SPACES):
+        text = "\n" if "\n" in text else " "
+    parent.children.append(text)
+
+
+def _is_block(node: _Element | str | None) -> bool:
+    return isinstance(node, _Element) and node.name in _BLOCKS
+
+
+def _convert(element: _Element, inline: bool, in_list: bool) -> str:
+    """
+    Converts an element like MarkdownConverter.process_tag
+    :param inline: inside a heading, where blocks are converted to inline text
+    :param in_list: inside a list item, where lists are nested
+    """
+    name = element.name
+    children = element.children
+    inside = name in _BLOCKS
+    child_inline = inline or name in _HEADINGS
+    child_in_list = in_list or name == "li"
+    strings = []
+    last = len(children) - 1
+    for i, child in enumerate(children):
+        before = children[i - 1] if i else None
+        after = children[i + 1] if i < last else None
+        if isinstance(child, _Element):
+            text = _convert(child, child_inline, child_in_list)
+        else:
+            if not child.strip():
+                if inside and (before is None or after is None):
+                    continue
+                if _is_block(before) or _is_block(after):
+                    continue
+            text = _text(child, before, after, inside)
+        if text:
+            strings.append(text)
+    return _convert_tag(element, _join(strings), inline, in_list)
+
+
+def _text(text: str, before: _Element | str | None, after: _Element | str | None, inside: bool) -> str:
+    """
+    Converts text like MarkdownConverter.process_text
+    """
+    if "\n" in text or "\r" in text:
+        text = _NEWLINE_WHITESPACE.sub("\n", text)
+    if "\t" in text or "  " in text:
+        text = _WHITESPACE.sub(" ", text)
+    if "*" in text:
+        text = text.replace("*", r"\*")
+    if "_" in text:
+        text = text.replace("_", r"\_")
+    if _is_block(before) or (inside and before is None):
+        text = text.lstrip(" \t\r\n")
+    if _is_block(after) or (inside and after is None):
+        text = text.rstrip()
+    return text
+
+
+def _join(strings: list[str]) -> str:
+    """
+    Joins the conversions of children, keeping at most two of the newlines where they meet
+    """
+    if len(strings) == 1:
+        return strings[0]
+    parts = []
+    trailing = 0
+    for string in strings:
+        content = string.lstrip("\n") if string[0] == "\n" else string
+        leading = len(string) - len(content)
+        if leading and trailing:
+            leading = min(2, max(trailing, leading))
+        parts.append("\n" * (leading or trailing))
+        if content[-1:] == "\n":
+            stripped = content.rstrip("\n")
+            trailing = len(content) - len(stripped)
+            content = stripped
+        else:
+            trailing = 0
+        parts.append(content)
+    parts.append("\n" * trailing)
+    return "".join(parts)
+
+
+def _convert_tag(element: _Element, text: str, inline: bool, in_list: bool) -> str:  # noqa: C901
+    name = element.name
+    if name is None:
+        return text.strip("\n")
+    if name in _PLAIN:
+        return text
+    if name in _MARKUP:
+        return _wrap(text, _MARKUP[name])
+    if name == "p":
+        text = text.strip(" \t\r\n")
+        if inline:
+            return f" {text} "
+        return f"\n\n{text}\n\n" if text else ""
+    if name in ("div", "article", "section"):
+        text = text.strip()
+        if inline:
+            return f" {text} "
+        return f"\n\n{text}\n\n" if text else ""
+    if name in _HEADINGS:
+        return text if inline else _heading(_HEADINGS[name], text.strip())
+    if name in ("ul", "ol"):
+        if in_list:
+            return "\n" + text.rstrip()
+        after = _next_content(element)
+        before_paragraph = after is not None and (isinstance(after, str) or after.name not in ("ul", "ol"))
+        return "\n\n" + text + ("\n" if before_paragraph else "")
+    if name == "li":
+        return _list_item(element, text.strip())
+    if name == "a":
+        return _link(element, text)
+    if name == "br":
+        if inline:
+            return text + " " if text else " "
+        return "  \n" + text
+    if name == "hr":
+        return "\n\n---\n\n"
+    # img
+    alt = element.get("alt") or ""
+    if inline:
+        return alt
+    title = element.get("title") or ""
+    title_part = ' "{}"'.format(title.replace('"', r"\"")) if title else ""
+    return f"![{alt}]({element.get('src') or ''}{title_part})"
+
+
+def _wrap(text: str, markup: str) -> str:
+    prefix = " " if text[:1] == " " else ""
+    suffix = " " if text[-1:] == " " else ""
+    text = text.strip()
+    return f"{prefix}{markup}{text}{markup}{suffix}" if text else ""
+
+
+def _heading(level: int, text: str) -> str:
+    if level <= 2:
+        text = text.rstrip()
+        return f"\n\n{text}\n{('=' if level == 1 else '-') * len(text)}\n\n" if text else ""
+    return f"\n\n{'#' * level} {_ALL_WHITESPACE.sub(' ', text)}\n\n"
+
+
+def _next_content(element: _Element) -> _Element | str | None:
+    siblings = _siblings(element)
+    for sibling in siblings[_index(siblings, element) + 1 :]:
+        if isinstance(sibling, _Element) or sibling.strip():
+            return sibling
+    return None
+
+
+def _siblings(element: _Element) -> list[_Element | str]:
+    return element.parent.children if element.parent is not None else [element]
+
+
+def _index(siblings: list[_Element | str], element: _Element) -> int:
+    return next(i for i, sibling in enumerate(siblings) if sibling is element)
+
+
+def _list_item(element: _Element, text: str) -> str:
+    if not text:
+        return "\n"
+    parent = element.parent
+    if parent is not None and parent.name == "ol":
+        start = parent.get("start")
+        siblings = parent.children
+        before = sum(
+            1
+            for sibling in siblings[: _index(siblings, element)]
+            if isinstance(sibling, _Element) and sibling.name == "li"
+        )
+        bullet = f"{(int(start) if start and start.isnumeric() else 1) + before}. "
+    else:
+        depth = -1
+        ancestor: _Element | None = element
+        while ancestor is not None:
+            depth += ancestor.name == "ul"
+            ancestor = ancestor.parent
+        bullet = "*+-"[depth % 3] + " "
+    indent = " " * len(bullet)
+    text = "\n".join(indent + line if line else "" for line in text.split("\n"))
+    return f"{bullet}{text[len(bullet) :]}\n"
+
+
+def _link(element: _Element, text: str) -> str:
+    prefix = " " if text[:1] == " " else ""
+    suffix = " " if text[-1:] == " " else ""
+    text = text.strip()
+    if not text:
+        return ""
+    href = element.get("href")
+    title = element.get("title")
+    if text.replace(r"\_", "_") == href and not title:
+        return f"<{href}>"
+    title_part = ' "{}"'.format(title.replace('"', r"\"")) if title else ""
+    return f"{prefix}[{text}]({href}{title_part}){suffix}" if href else text
@@ -0,0 +1,55 @@
+"""
+jobspy2.scrapers.tls
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the tls_client session with rotating proxies. create_session imports it on
+first use, so scrapes that only use plain requests sessions never load tls_client.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import requests
+import tls_client
+from tls_client.response import Response
+from tls_client.structures import CaseInsensitiveDict
+
+from .cassette import entry_content
+from .utils import NO_RETRY, RetryPolicy, RotatingProxySession
+
+
+class TLSRotating(RotatingProxySession, tls_client.Session):
+    def __init__(self, proxies: list[str] | str | None = None, has_retry: bool = False, delay: int = 1) -> None:
+        RotatingProxySession.__init__(self, proxies=proxies)
+        tls_client.Session.__init__(self, random_tls_extension_order=True)
+        self.retry = RetryPolicy(backoff=delay) if has_retry else NO_RETRY
+
+    def execute_request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        response = self.send_through_cassette(
+            method,
+            url,
+            kwargs,
+            lambda: self.send_with_policy(
+                url,
+                lambda: tls_client.Session.execute_request(self, method, url, **kwargs),
+                self.retry,
+                timeout=kwargs.get("timeout_seconds") or kwargs.get("timeout"),
+            ),
+            tls_response,
+        )
+        response.ok = response.status_code in range(200, 400)
+        return response
+
+
+def tls_response(entry: dict[str, Any]) -> Response:
+    """
+    Builds a tls_client response from a recorded cassette entry
+    """
+    response = Response()
+    response.url = entry["url"]
+    response.status_code = entry["status_code"]
+    response.headers = CaseInsensitiveDict(entry["headers"])
+    response.encoding = entry["encoding"]
+    response._content = entry_content(entry)
+    return response
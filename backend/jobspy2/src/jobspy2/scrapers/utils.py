@@ -1,19 +1,31 @@
 from __future__ import annotations
 
+import contextvars
+import functools
 import logging
+import random
 import re
-from collections.abc import Iterator
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from itertools import cycle
-from typing import Any
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
 
-import numpy as np
 import requests
-import tls_client
-from bs4.element import Tag
-from markdownify import markdownify as md
-from requests.adapters import HTTPAdapter, Retry
 
-from ..jobs import CompensationInterval, JobType
+from ..jobs import CompensationInterval, JobPost, JobType
+from ..metrics import count, current_metrics, stage, timed
+from ..salary import MIN_MAX_PATTERN
+from .cassette import Cassette, current_cassette, request_key, requests_response
+from .coordination import FileTokenBucket, proxy_cooldowns, proxy_key, state_dir
+from .exceptions import CircuitOpenError
+from .markdown import html_to_markdown
+
+if TYPE_CHECKING:
+    from bs4.element import Tag
 
 
 def create_logger(name: str) -> logging.Logger:
@@ -29,14 +41,347 @@ def create_logger(name: str) -> logging.Logger:
     return logger
 
 
+class HostConcurrencyLimiter:
+    """
+    Caps the number of in-flight requests per host, shared by every session of the process.
+    """
+
+    def __init__(self, default_limit: int = 10, limits: dict[str, int] | None = None) -> None:
+        self.default_limit = default_limit
+        self.limits: dict[str, int] = dict(limits or {})
+        self._semaphores: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _semaphore(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            semaphore = self._semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.limits.get(host, self.default_limit))
+                self._semaphores[host] = semaphore
+            return semaphore
+
+    @contextmanager
+    def acquire(self, url: str) -> Iterator[None]:
+        """
+        Holds a request slot for the host of url for the duration of the block
+        :param url: request url
+        """
+        with self._semaphore(urlsplit(url).hostname or ""):
+            yield
+
+
+host_limiter = HostConcurrencyLimiter(
+    limits={
+        "www.linkedin.com": 4,
+        "www.google.com": 4,
+        "www.ziprecruiter.com": 10,
+        "api.ziprecruiter.com": 4,
+        "apis.indeed.com": 6,
+    }
+)
+
+
+class TokenBucket:
+    """
+    Allows rate requests per second on average and bursts of up to burst requests. Callers reserve a
+    token and sleep until it is due, so waiting threads are served in arrival order.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Takes a token, possibly one that is only available in the future
+        :return: seconds to wait before using it
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate) - 1
+            self.updated = now
+            return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+    def acquire(self) -> None:
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+
+class HostRateLimiter:
+    """
+    Paces requests per host with a token bucket, shared by every session of the process and, when
+    shared, by every process of the machine through coordination.state_dir(). A rate keyed by host
+    and path prefix, like "www.linkedin.com/jobs/view", gives the requests under that path a bucket
+    of their own. Hosts without a configured rate are not limited.
+    """
+
+    def __init__(self, rates: dict[str, tuple[float, int]] | None = None, shared: bool = False) -> None:
+        """
+        :param rates: requests per second and burst size by host or host and path prefix
+        :param shared: share the buckets with other processes
+        """
+        self.rates: dict[str, tuple[float, int]] = dict(rates or {})
+        self.shared = shared
+        self._buckets: dict[str, TokenBucket | FileTokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, host: str, rate: float, burst: int = 1) -> None:
+        """
+        Sets the rate of a host, replacing its current bucket
+        """
+        with self._lock:
+            self.rates[host] = (rate, burst)
+            self._buckets.pop(host, None)
+
+    def share_rate(self, host: str, like: str) -> None:
+        """
+        Gives a host the rate of another host of the same site, unless it has a rate of its own
+        """
+        with self._lock:
+            if host not in self.rates and like in self.rates:
+                self.rates[host] = self.rates[like]
+
+    def key(self, url: str) -> str:
+        """
+        :return: the longest configured host and path prefix of url, or its host
+        """
+        parts = urlsplit(url)
+        host = parts.hostname or ""
+        key = host + parts.path.rstrip("/")
+        while key != host and key not in self.rates:
+            key = key.rpartition("/")[0]
+        return key
+
+    def _bucket(self, key: str) -> TokenBucket | FileTokenBucket | None:
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None and key in self.rates:
+                directory = state_dir() if self.shared else None
+                if directory is not None:
+                    bucket = FileTokenBucket(directory / f"{key.replace('/', '_')}.bucket", *self.rates[key])
+                else:
+                    bucket = TokenBucket(*self.rates[key])
+                self._buckets[key] = bucket
+            return bucket
+
+    def acquire(self, url: str) -> None:
+        """
+        Waits until a request to the host of url is allowed
+        :param url: request url
+        """
+        bucket = self._bucket(self.key(url))
+        if bucket is not None:
+            bucket.acquire()
+
+
+# search pages and detail fetches of a site share its host's rate, across all processes of the machine,
+# unless the detail path has a rate of its own
+host_rate_limiter = HostRateLimiter(
+    rates={
+        # one search page every 5 s, like the 3-7 s pause LinkedIn pages used to take
+        "www.linkedin.com": (0.2, 1),
+        # job pages were never paused between, pace them like one client fetching them back to back
+        "www.linkedin.com/jobs/view": (2.0, 4),
+        "www.google.com": (2.0, 4),
+        "www.ziprecruiter.com": (4.0, 8),
+        "api.ziprecruiter.com": (0.5, 2),
+        "www.glassdoor.com": (4.0, 8),
+        "apis.indeed.com": (5.0, 10),
+    },
+    shared=True,
+)
+
+
+class ContextThreadPoolExecutor(ThreadPoolExecutor):
+    """
+    Thread pool running every task in a copy of the submitter's context, so the metrics of the site
+    being scraped follow its page and detail fetches.
+    """
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        return super().submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
+DETAIL_WORKERS = 32
+_detail_executor: ContextThreadPoolExecutor | None = None
+_detail_executor_lock = threading.Lock()
+
+
+def detail_executor() -> ContextThreadPoolExecutor:
+    """
+    Returns the process-wide thread pool used for per-job detail fetches, so concurrent scrapes
+    share DETAIL_WORKERS threads instead of opening a pool per search page.
+    """
+    global _detail_executor
+    with _detail_executor_lock:
+        if _detail_executor is None:
+            _detail_executor = ContextThreadPoolExecutor(max_workers=DETAIL_WORKERS, thread_name_prefix="jobspy-detail")
+        return _detail_executor
+
+
+PREFETCH_WORKERS = 16
+_prefetch_executor: ContextThreadPoolExecutor | None = None
+
+
+def prefetch_executor() -> ContextThreadPoolExecutor:
+    """
+    Returns the process-wide thread pool running the search page requests of PagePrefetcher. Each
+    scrape has at most one page request in flight, so PREFETCH_WORKERS bounds the concurrent scrapes
+    that overlap paging with processing; the others wait for a free thread.
+    """
+    global _prefetch_executor
+    with _detail_executor_lock:
+        if _prefetch_executor is None:
+            _prefetch_executor = ContextThreadPoolExecutor(
+                max_workers=PREFETCH_WORKERS, thread_name_prefix="jobspy-prefetch"
+            )
+        return _prefetch_executor
+
+
+class RetryPolicy:
+    """
+    Retries rate limited and failed requests with jittered exponential backoff, waiting for the
+    server's Retry-After instead when it sends one.
+    """
+
+    def __init__(
+        self,
+        total: int = 3,
+        backoff: float = 1.0,
+        max_backoff: float = 30.0,
+        statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504}),
+    ) -> None:
+        """
+        :param total: retries after the first attempt
+        :param backoff: base delay in seconds, doubled on every retry
+        :param max_backoff: longest delay, Retry-After included
+        :param statuses: response status codes that are retried
+        """
+        self.total = total
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.statuses = statuses
+
+    def delay(self, attempt: int, retry_after: float | None = None) -> float:
+        """
+        :param attempt: number of the failed attempt, starting at 0
+        :param retry_after: seconds requested by the server
+        :return: seconds to wait before the next attempt, full jitter over the exponential backoff
+        """
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+        return random.uniform(0, min(self.backoff * 2**attempt, self.max_backoff))  # noqa: S311
+
+
+NO_RETRY = RetryPolicy(total=0)
+
+
+class CircuitBreaker:
+    """
+    Opens after threshold consecutive failed requests to a host, then fails every request fast for
+    cooldown seconds. After the cooldown one trial request is let through: its success closes the
+    circuit, its failure opens it again.
+    """
+
+    def __init__(self, threshold: int = 5, cooldown: float = 60.0) -> None:
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: float | None = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    def retry_in(self) -> float:
+        """
+        :return: seconds until a trial request is allowed, 0 if requests are allowed now
+        """
+        with self._lock:
+            if self.opened_at is None:
+                return 0.0
+            return max(self.opened_at + self.cooldown - time.monotonic(), 0.0)
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at < self.cooldown or self._trial:
+                return False
+            self._trial = True
+            return True
+
+    def record(self, success: bool) -> None:
+        with self._lock:
+            self._trial = False
+            if success:
+                self.failures = 0
+                self.opened_at = None
+                return
+            self.failures += 1
+            if self.failures >= self.threshold or self.opened_at is not None:
+                self.opened_at = time.monotonic()
+
+
+class HostCircuitBreakers:
+    """
+    One circuit breaker per host, shared by every session of the process, so a blocked site stops
+    costing time and proxies on every request of every scrape.
+    """
+
+    def __init__(self, threshold: int = 5, cooldown: float = 60.0) -> None:
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, host: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = CircuitBreaker(self.threshold, self.cooldown)
+                self._breakers[host] = breaker
+            return breaker
+
+
+host_breakers = HostCircuitBreakers()
+
+# seconds a proxy stays out of rotation after a 429 without Retry-After, or a proxy error
+PROXY_COOLDOWN = 60.0
+
+
+def retry_after_seconds(headers: Any) -> float | None:
+    """
+    Parses a Retry-After header given as seconds or as an HTTP date
+    :param headers: response headers
+    :return: seconds to wait, None if the header is missing or invalid
+    """
+    value = headers.get("Retry-After") if headers else None
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    from email.utils import parsedate_to_datetime
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
 class RotatingProxySession:
     def __init__(self, proxies: list[str] | str | None = None) -> None:
         if isinstance(proxies, str):
-            self.proxy_cycle: Iterator[dict[str, str]] | None = cycle([self.format_proxy(proxies)])
-        elif isinstance(proxies, list):
-            self.proxy_cycle = cycle([self.format_proxy(proxy) for proxy in proxies]) if proxies else None
-        else:
-            self.proxy_cycle = None
+            proxies = [proxies]
+        formatted = [self.format_proxy(proxy) for proxy in proxies or []]
+        self.proxy_count = len(formatted)
+        self.proxy_cycle: Iterator[dict[str, str]] | None = cycle(formatted) if formatted else None
+        self.cassette: Cassette | None = None
 
     @staticmethod
     def format_proxy(proxy: str) -> dict[str, str]:
@@ -45,6 +390,140 @@ class RotatingProxySession:
             return {"http": proxy, "https": proxy}
         return {"http": f"http://{proxy}", "https": f"http://{proxy}"}
 
+    def next_proxy(self) -> dict[str, str] | None:
+        """
+        Takes the next proxy of the rotation that no process has put in cooldown, or the one recovering
+        first if all of them are cooling down
+        :return: proxy dict, None without proxies
+        """
+        if not self.proxy_cycle:
+            return None
+        cooling = proxy_cooldowns().cooling() if self.proxy_count > 1 else {}
+        best = best_expiry = None
+        for _ in range(self.proxy_count):
+            proxy = next(self.proxy_cycle)
+            expiry = cooling.get(proxy_key(proxy["http"])) if cooling else None
+            if expiry is None:
+                return proxy
+            if best_expiry is None or expiry < best_expiry:
+                best, best_expiry = proxy, expiry
+        return best
+
+    def rotate_proxy(self) -> dict[str, str] | None:
+        """
+        Points the session at the next proxy
+        :return: proxy in use, None without proxies
+        """
+        proxy = self.next_proxy()
+        if proxy is not None:
+            self.proxies = proxy if proxy["http"] != "http://localhost" else {}
+        return proxy
+
+    @staticmethod
+    def cool_down_proxy(proxy: dict[str, str] | None, seconds: float | None = None) -> None:
+        """
+        Takes a rate limited or failing proxy out of the rotation of every session and process
+        :param seconds: cooldown, PROXY_COOLDOWN if None
+        """
+        if proxy is not None:
+            proxy_cooldowns().cool_down(proxy["http"], PROXY_COOLDOWN if seconds is None else seconds)
+
+    @staticmethod
+    def _should_retry(
+        attempt: int, delay: float, retry: RetryPolicy, breaker: CircuitBreaker, timeout: float | None
+    ) -> bool:
+        # no retry once the circuit opened, nor one that would wait past the request's timeout
+        if attempt >= retry.total or breaker.retry_in() > 0:
+            return False
+        return timeout is None or delay <= timeout
+
+    def send_through_cassette(
+        self,
+        method: str,
+        url: str,
+        kwargs: dict[str, Any],
+        send: Callable[[], Any],
+        build: Callable[[dict[str, Any]], Any],
+    ) -> Any:
+        """
+        Sends a request, recording its response to the session's cassette or replaying it from there
+        :param kwargs: arguments of the request, its params, data and json identify it in the cassette
+        :param send: sends the request with send_with_policy
+        :param build: turns a recorded entry into a response of the session's type
+        """
+        if self.cassette is None:
+            return send()
+        key = request_key(method, url, kwargs.get("params"), kwargs.get("data"), kwargs.get("json"))
+        return self.cassette.exchange(key, url, send, build)
+
+    def send_with_policy(
+        self,
+        url: str,
+        send: Callable[[], Any],
+        retry: RetryPolicy,
+        timeout: float | None = None,
+        retry_errors: tuple[type[Exception], ...] = (),
+    ) -> Any:
+        """
+        Sends a request through the host's circuit breaker, rate limit and concurrency limit, rotating
+        proxies and retrying per retry. Retries stop when the circuit opens or when their delay is
+        longer than the request's timeout, which scrapers clamp to their deadline.
+        :param send: performs the request once with the current proxy
+        :param retry_errors: exceptions of send that are retried like failed responses
+        :return: response of the last attempt
+        """
+        with stage("request", url=url):
+            return self._send_with_policy(url, send, retry, timeout, retry_errors)
+
+    def _send_with_policy(
+        self,
+        url: str,
+        send: Callable[[], Any],
+        retry: RetryPolicy,
+        timeout: float | None,
+        retry_errors: tuple[type[Exception], ...],
+    ) -> Any:
+        host = urlsplit(url).hostname or ""
+        breaker = host_breakers.breaker(host)
+        for attempt in range(retry.total + 1):
+            if not breaker.allow():
+                raise CircuitOpenError(host, breaker.retry_in())
+            proxy = self.rotate_proxy()
+            host_rate_limiter.acquire(url)
+            try:
+                with host_limiter.acquire(url):
+                    sent = time.perf_counter()
+                    response = send()
+            except retry_errors:
+                breaker.record(success=False)
+                self.cool_down_proxy(proxy)
+                delay = retry.delay(attempt)
+                if not self._should_retry(attempt, delay, retry, breaker, timeout):
+                    raise
+                count("retries")
+                time.sleep(delay)
+                continue
+            except BaseException:
+                # any other error ends a half-open trial as a failure instead of leaving it pending
+                breaker.record(success=False)
+                raise
+            site_metrics = current_metrics()
+            if site_metrics is not None:
+                site_metrics.observe_response(time.perf_counter() - sent, len(response.content or b""))
+            if response.status_code not in retry.statuses:
+                breaker.record(success=True)
+                return response
+            breaker.record(success=False)
+            retry_after = retry_after_seconds(response.headers)
+            if response.status_code == 429:
+                self.cool_down_proxy(proxy, retry_after)
+            delay = retry.delay(attempt, retry_after)
+            if not self._should_retry(attempt, delay, retry, breaker, timeout):
+                return response
+            count("retries")
+            time.sleep(delay)
+        return response
+
 
 class RequestsRotating(RotatingProxySession, requests.Session):
     def __init__(
@@ -58,49 +537,24 @@ class RequestsRotating(RotatingProxySession, requests.Session):
         requests.Session.__init__(self)
         self.clear_cookies = clear_cookies
         self.allow_redirects = True
-        self.setup_session(has_retry, delay)
-
-    def setup_session(self, has_retry: bool, delay: int) -> None:
-        if has_retry:
-            retries = Retry(
-                total=3,
-                connect=3,
-                status=3,
-                status_forcelist=[500, 502, 503, 504, 429],
-                backoff_factor=delay,
-            )
-            adapter = HTTPAdapter(max_retries=retries)
-            self.mount("http://", adapter)
-            self.mount("https://", adapter)
+        self.retry = RetryPolicy(backoff=delay) if has_retry else NO_RETRY
 
     def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
         if self.clear_cookies:
             self.cookies.clear()
-
-        if self.proxy_cycle:
-            next_proxy = next(self.proxy_cycle)
-            if next_proxy["http"] != "http://localhost":
-                self.proxies = next_proxy
-            else:
-                self.proxies = {}
-        return requests.Session.request(self, method, url, **kwargs)
-
-
-class TLSRotating(RotatingProxySession, tls_client.Session):
-    def __init__(self, proxies: list[str] | str | None = None) -> None:
-        RotatingProxySession.__init__(self, proxies=proxies)
-        tls_client.Session.__init__(self, random_tls_extension_order=True)
-
-    def execute_request(self, *args: Any, **kwargs: Any) -> requests.Response:
-        if self.proxy_cycle:
-            next_proxy = next(self.proxy_cycle)
-            if next_proxy["http"] != "http://localhost":
-                self.proxies = next_proxy
-            else:
-                self.proxies = {}
-        response = tls_client.Session.execute_request(self, *args, **kwargs)
-        response.ok = response.status_code in range(200, 400)
-        return response
+        return self.send_through_cassette(
+            method,
+            url,
+            kwargs,
+            lambda: self.send_with_policy(
+                url,
+                lambda: requests.Session.request(self, method, url, **kwargs),
+                self.retry,
+                timeout=kwargs.get("timeout"),
+                retry_errors=(requests.exceptions.ConnectionError,),
+            ),
+            requests_response,
+        )
 
 
 def create_session(
@@ -111,13 +565,18 @@ def create_session(
     has_retry: bool = False,
     delay: int = 1,
     clear_cookies: bool = False,
+    cassette: Cassette | None = None,
 ) -> requests.Session:
     """
     Creates a requests session with optional tls, proxy, and retry settings.
+    :param has_retry: retry 429 and 5xx responses and connection errors with backoff starting at delay seconds
+    :param cassette: records or replays the session's requests, the cassette entered in the current context if None
     :return: A session object
     """
     if is_tls:
-        session = TLSRotating(proxies=proxies)
+        from .tls import TLSRotating
+
+        session = TLSRotating(proxies=proxies, has_retry=has_retry, delay=delay)
     else:
         session = RequestsRotating(
             proxies=proxies,
@@ -128,14 +587,29 @@ def create_session(
 
     if ca_cert:
         session.verify = ca_cert
+    session.cassette = cassette if cassette is not None else current_cassette()
 
     return session
 
 
+def create_job_post(**fields: Any) -> JobPost:
+    """
+    Builds a JobPost from a scraper's typed fields without validating them, see JobPost.from_trusted,
+    timed as the "construct" stage of the scrape's metrics. Scrapes validate their pages in one batch
+    when $JOBSPY2_VALIDATE_JOBS is set.
+    """
+    with stage("construct"):
+        return JobPost.from_trusted(fields)
+
+
+@timed("markdown")
 def markdown_converter(description_html: str | None) -> str | None:
+    """
+    Converts a description to Markdown like markdownify, see jobspy2.scrapers.markdown
+    """
     if description_html is None:
         return None
-    markdown = md(description_html)
+    markdown = html_to_markdown(description_html)
     return markdown.strip() if markdown else None
 
 
@@ -150,13 +624,7 @@ def get_enum_from_job_type(job_type_str: str | None) -> JobType | None:
     """
     Given a string, returns the corresponding JobType enum member if a match is found.
     """
-    if not job_type_str:
-        return None
-    res = None
-    for job_type in JobType:
-        if job_type_str in job_type.value:
-            res = job_type
-    return res
+    return JobType.from_alias(job_type_str)
 
 
 def currency_parser(cur_str: str) -> float:
@@ -173,6 +641,8 @@ def currency_parser(cur_str: str) -> float:
     else:
         num = float(cur_str)
 
+    import numpy as np
+
     return np.round(num, 2)
 
 
@@ -214,8 +684,9 @@ def extract_salary(
 
 
 def parse_salary_string(salary_str: str) -> tuple[int, int] | None:
-    min_max_pattern = r"\$(\d+(?:,\d+)?(?:\.\d+)?)([kK]?)\s*[-—–]\s*(?:\$)?(\d+(?:,\d+)?(?:\.\d+)?)([kK]?)"  # noqa: RUF001
-    match = re.search(min_max_pattern, salary_str)
+    # str.find skips ahead to the first "$" much faster than the regex scans for it
+    start = salary_str.find("$")
+    match = MIN_MAX_PATTERN.search(salary_str, start) if start >= 0 else None
     if not match:
         return None
 
@@ -291,19 +762,59 @@ def is_valid_salary_range(annual_min: float, annual_max: float, lower_limit: int
     return lower_limit <= annual_min <= upper_limit and lower_limit <= annual_max <= upper_limit
 
 
+class JobTypeMatcher:
+    """
+    Finds the job types named in a text, built once from the JobType keywords.
+
+    The text is lowercased once and each lowercased keyword is searched for in it; an ASCII text
+    skips the keywords that cannot occur in it, those with accented or non-Latin letters.
+    """
+
+    def __init__(self, job_types: Iterable[JobType] = JobType) -> None:
+        self.keywords: list[tuple[JobType, tuple[str, ...]]] = [
+            (job_type, tuple(dict.fromkeys(keyword.lower() for keyword in job_type.value))) for job_type in job_types
+        ]
+        self.ascii_keywords = [
+            (job_type, ascii_only)
+            for job_type, keywords in self.keywords
+            if (ascii_only := tuple(keyword for keyword in keywords if keyword.isascii()))
+        ]
+
+    def match(self, text: str | None) -> list[JobType]:
+        """
+        :return: job types named in the text, in JobType order
+        """
+        if not text:
+            return []
+        lowered = text.lower()
+        keywords = self.ascii_keywords if lowered.isascii() else self.keywords
+        return [job_type for job_type, words in keywords if any(word in lowered for word in words)]
+
+    def match_many(self, texts: Iterable[str | None]) -> list[list[JobType]]:
+        """
+        :return: job types named in each text
+        """
+        match = self.match
+        return [match(text) for text in texts]
+
+
+@functools.cache
+def job_type_matcher() -> JobTypeMatcher:
+    return JobTypeMatcher()
+
+
 def extract_job_type(description: str | None) -> list[JobType]:
     """
     Extracts job type from job description.
     """
-    if not description:
-        return []
+    return job_type_matcher().match(description)
 
-    job_types: list[JobType] = []
-    for job_type in JobType:
-        if any(keyword.lower() in description.lower() for keyword in job_type.value):
-            job_types.append(job_type)
 
-    return job_types
+def extract_job_types(descriptions: Iterable[str | None]) -> list[list[JobType]]:
+    """
+    Extracts the job types of a column of job descriptions.
+    """
+    return job_type_matcher().match_many(descriptions)
 
 
 def setup_logger(logger_name: str) -> logging.Logger:
@@ -10,8 +10,8 @@ from __future__ import annotations
 import json
 import math
 import re
-import time
-from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Iterator
+from contextlib import closing
 from datetime import datetime
 from typing import Any
 import logging
@@ -25,14 +25,17 @@ from ...jobs import (
     Country,
     DescriptionFormat,
     JobPost,
-    JobResponse,
     JobType,
     Location,
 )
-from .. import Scraper, ScraperInput, Site
+from ...metrics import count, timed
+from .. import PageWindow, Scraper, ScraperInput, Site
+from ..exceptions import CircuitOpenError
 from ..utils import (
+    create_job_post,
     create_logger,
     create_session,
+    detail_executor,
     extract_emails_from_text,
     markdown_converter,
     remove_attributes,
@@ -52,58 +55,54 @@ class ZipRecruiterScraper(Scraper):
         super().__init__(Site.ZIP_RECRUITER, logger=logger, proxies=proxies, ca_cert=ca_cert)
 
         self.scraper_input: ScraperInput | None = None
-        self.session: requests.Session = create_session(proxies=proxies, ca_cert=ca_cert)
+        self.session: requests.Session = create_session(proxies=proxies, ca_cert=ca_cert, has_retry=True)
         self.session.headers.update(headers)
         self._get_cookies()
 
-        self.delay: int = 5
         self.jobs_per_page: int = 20
         self.seen_urls: set[str] = set()
 
-    def scrape(self, scraper_input: ScraperInput) -> JobResponse:
+    def iter_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobPost]]:
         """
-        Scrapes ZipRecruiter for jobs with scraper_input criteria.
+        Scrapes ZipRecruiter for jobs with scraper_input criteria, one search page at a time.
         :param scraper_input: Information about job search criteria.
-        :return: JobResponse containing a list of jobs.
+        :return: Iterator of job lists, one per page.
         """
         self.scraper_input = scraper_input
-        job_list: list[JobPost] = []
-        continue_token = None
+        self.seen_urls = set()
+        window = PageWindow(scraper_input.results_wanted)
 
         max_pages = math.ceil(scraper_input.results_wanted / self.jobs_per_page)
-        for page in range(1, max_pages + 1):
-            if len(job_list) >= scraper_input.results_wanted:
-                break
-            if page > 1:
-                time.sleep(self.delay)
-            self.logger.info(f"search page: {page} / {max_pages}")
-            jobs_on_page, continue_token = self._find_jobs_in_page(scraper_input, continue_token)
-            if jobs_on_page:
-                job_list.extend(jobs_on_page)
-            else:
-                break
-            if not continue_token:
-                break
-        return JobResponse(jobs=job_list[: scraper_input.results_wanted])
+        with closing(self.paginate(self._fetch_jobs_page, wanted=scraper_input.results_wanted)) as pages:
+            page_iter = iter(pages)
+            for page in range(1, max_pages + 1):
+                if window.full:
+                    break
+                if self.out_of_time():
+                    break
+                self.logger.info(f"search page: {page} / {max_pages}")
+                jobs_on_page = self._process_jobs(next(page_iter, []))
+                if not jobs_on_page:
+                    break
+                yield self.take_page(window, jobs_on_page)
 
-    def _find_jobs_in_page(
-        self, scraper_input: ScraperInput, continue_token: str | None = None
-    ) -> tuple[list[JobPost], str | None]:
+    def _fetch_jobs_page(self, continue_token: str | None = None) -> tuple[list[dict[str, Any]], str | None]:
         """
-        Scrapes a page of ZipRecruiter for jobs with scraper_input criteria
-        :param scraper_input:
+        Requests a page of ZipRecruiter results with scraper_input criteria, paced by the
+        api.ziprecruiter.com rate of host_rate_limiter
         :param continue_token:
-        :return: jobs found on page
+        :return: raw jobs of the page, next page token
         """
-        jobs_list: list[JobPost] = []
-        params = self._add_params(scraper_input)
+        if not self.scraper_input:
+            return [], None
+        params = self._add_params(self.scraper_input)
         if continue_token:
             params["continue_from"] = continue_token
         try:
             query_string = urlencode(params)
             full_url = f"{self.api_url}/jobs-app/jobs?{query_string}"	
             self.logger.debug(f"Getting ZipRecruiter URL: {full_url}")
-            res = self.session.get(f"{self.api_url}/jobs-app/jobs", params=params)
+            res = self.session.get(f"{self.api_url}/jobs-app/jobs", params=params, timeout=self.request_timeout())
             if res.status_code not in range(200, 400):
                 if res.status_code == 429:
                     self.logger.error("429 Response - Blocked by ZipRecruiter for too many requests")
@@ -112,23 +111,29 @@ class ZipRecruiterScraper(Scraper):
                     err = f"ZipRecruiter response status code {res.status_code}"
                     err += f" with response: {res.text}"  # ZipRecruiter likely not available in EU
                     self.logger.error(err)
-                return jobs_list, ""
+                return [], ""
+        except CircuitOpenError as e:
+            self.circuit_open(e)
+            return [], ""
         except Exception as e:
             if "Proxy responded with" in str(e):
                 self.logger.exception("ZipRecruiter: Bad proxy")
             else:
                 self.logger.exception("ZipRecruiter error")
-            return jobs_list, ""
+            return [], ""
 
         res_data = res.json()
-        jobs_data = res_data.get("jobs", [])
-        next_continue_token = res_data.get("continue", None)
-        with ThreadPoolExecutor(max_workers=self.jobs_per_page) as executor:
-            job_results = [executor.submit(self._process_job, job) for job in jobs_data]
+        return res_data.get("jobs", []), res_data.get("continue", None)
 
-        job_list = list(filter(None, (result.result() for result in job_results)))
-        return job_list, next_continue_token
+    def _process_jobs(self, jobs_data: list[dict[str, Any]]) -> list[JobPost]:
+        """
+        Processes the raw jobs of a page, fetching their details on the shared detail pool
+        """
+        executor = detail_executor()
+        job_results = [executor.submit(self._process_job, job) for job in jobs_data]
+        return list(filter(None, (result.result() for result in job_results)))
 
+    @timed("parse")
     def _process_job(self, job: dict[str, Any]) -> JobPost | None:
         """
         Processes an individual job dict from the response
@@ -145,7 +150,7 @@ class ZipRecruiterScraper(Scraper):
         listing_type = job.get("buyer_type", "")
         description = (
             markdown_converter(description)
-            if self.scraper_input.description_format == DescriptionFormat.MARKDOWN
+            if self.scraper_input.description_format == DescriptionFormat.MARKDOWN and self.wants("description")
             else description
         )
         company = job.get("hiring_company", {}).get("name")
@@ -160,9 +165,15 @@ class ZipRecruiterScraper(Scraper):
         comp_min = int(job["compensation_min"]) if "compensation_min" in job else None
         comp_max = int(job["compensation_max"]) if "compensation_max" in job else None
         comp_currency = job.get("compensation_currency")
-        description_full, job_url_direct = self._get_descr(job_url)
+        description_full = job_url_direct = None
+        if (
+            self.wants("description", "emails", "job_url_direct")
+            and not self.out_of_time()
+            and not self.known_elsewhere(title, company, location)
+        ):
+            description_full, job_url_direct = self._get_descr(job_url)
 
-        return JobPost(
+        return create_job_post(
             id=f"zr-{job['listing_key']}",
             title=title,
             company_name=company,
@@ -177,7 +188,7 @@ class ZipRecruiterScraper(Scraper):
             date_posted=date_posted,
             job_url=job_url,
             description=description_full if description_full else description,
-            emails=extract_emails_from_text(description) if description else None,
+            emails=extract_emails_from_text(description) if description and self.wants("emails") else None,
             job_url_direct=job_url_direct,
             listing_type=listing_type,
         )
@@ -190,7 +201,12 @@ class ZipRecruiterScraper(Scraper):
         """
         if not self.scraper_input:
             return None, None
-        res = self.session.get(job_url, allow_redirects=True)
+        count("detail_requests")
+        try:
+            res = self.session.get(job_url, allow_redirects=True, timeout=self.request_timeout())
+        except CircuitOpenError as e:
+            self.circuit_open(e)
+            return None, None
         description_full = job_url_direct = None
         if res.ok:
             soup = BeautifulSoup(res.text, "html.parser")
@@ -209,7 +225,7 @@ class ZipRecruiterScraper(Scraper):
                 if m:
                     job_url_direct = m.group(1)
 
-            if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
+            if self.scraper_input.description_format == DescriptionFormat.MARKDOWN and self.wants("description"):
                 description_full = markdown_converter(description_full)
 
         return description_full, job_url_direct
@@ -220,7 +236,10 @@ class ZipRecruiterScraper(Scraper):
         """
         data = "event_type=session&logged_in=false&number_of_retry=1&property=model%3AiPhone&property=os%3AiOS&property=locale%3Aen_us&property=app_build_number%3A4734&property=app_version%3A91.0&property=manufacturer%3AApple&property=timestamp%3A2024-01-12T12%3A04%3A42-06%3A00&property=screen_height%3A852&property=os_version%3A16.6.1&property=source%3Ainstall&property=screen_width%3A393&property=device_model%3AiPhone%2014%20Pro&property=brand%3AApple"
         url = f"{self.api_url}/jobs-app/event"
-        self.session.post(url, data=data)
+        try:
+            self.session.post(url, data=data)
+        except CircuitOpenError as e:
+            self.circuit_open(e)
 
     @staticmethod
     def _get_job_type_enum(job_type_str: str) -> list[JobType] | None:
@@ -229,10 +248,8 @@ class ZipRecruiterScraper(Scraper):
         :param job_type_str: The job type string
         :return: List of JobType enums or None
         """
-        for job_type in JobType:
-            if job_type_str in job_type.value:
-                return [job_type]
-        return None
+        job_type = JobType.from_alias(job_type_str)
+        return [job_type] if job_type else None
 
     @staticmethod
     def _add_params(scraper_input: ScraperInput) -> dict[str, str | Any]:
@@ -0,0 +1,381 @@
+"""
+jobspy2.server
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the long-running scrape server, which keeps scrapers, sessions and worker
+threads warm between requests instead of paying interpreter startup, imports and TLS handshakes
+for every scrape.
+
+Clients connect over a Unix socket or localhost TCP and exchange JSON lines. Every request is an
+object with an optional "id", a "method" and "params"; every response echoes the id with either a
+"result" or an "error". Responses to scrapes arrive in completion order, so one connection can have
+several scrapes in flight.
+
+    {"id": 1, "method": "scrape", "params": {"site_name": ["indeed"], "search_term": "python"}}
+    {"id": 1, "result": {"jobs": [...], "site_status": {"indeed": "completed"}}}
+
+Methods:
+    scrape: params are scrape_jobs arguments, or {"queries": [...], ...} for several searches
+        merged over the shared arguments, like scrape_jobs_batch. With --cache, single searches are
+        answered from the result cache and report its "cache" state
+    stats: queue depth and counters of the server
+    ping: liveness check
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, wait
+from functools import partial
+from typing import Any
+
+from . import ScraperPool, _build_queries, run_queries
+from .cache import ResultCache, cache_key
+from .scrapers import SiteStatus
+from .scrapers.utils import create_logger
+
+logger = create_logger("server")
+
+DEFAULT_PORT = 8765
+
+
+class ServerError(Exception):
+    """Raised when a request cannot be served."""
+
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(self.message)
+
+
+class InvalidRequestError(ServerError):
+    """Raised when a request line is not a JSON object."""
+
+    def __init__(self) -> None:
+        super().__init__("request must be a JSON object")
+
+
+class InvalidParamsError(ServerError):
+    """Raised when the params of a scrape request do not describe valid searches."""
+
+    def __init__(self, reason: object) -> None:
+        super().__init__(f"invalid scrape params: {reason}")
+
+
+class QueriesNotListError(InvalidParamsError):
+    """Raised when the queries of a batch scrape request are not a list."""
+
+    def __init__(self) -> None:
+        super().__init__("queries must be a list")
+
+
+class UnixSocketError(ServerError):
+    """Raised when a Unix socket is requested on a platform without them."""
+
+    def __init__(self) -> None:
+        super().__init__("Unix sockets are not supported on this platform")
+
+
+class TrackedExecutor(Executor):
+    """
+    Wraps a ThreadPoolExecutor to count queued, running and completed tasks, so the server can
+    report its queue depth.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str = "") -> None:
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+        self._lock = threading.Lock()
+        self.queued = self.running = self.completed = 0
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        def run() -> Any:
+            with self._lock:
+                self.queued -= 1
+                self.running += 1
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self.running -= 1
+                    self.completed += 1
+
+        with self._lock:
+            self.queued += 1
+        future = self._executor.submit(run)
+        future.add_done_callback(self._on_done)
+        return future
+
+    def _on_done(self, future: Future) -> None:
+        if future.cancelled():  # never started, so still counted as queued
+            with self._lock:
+                self.queued -= 1
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"queued": self.queued, "running": self.running, "completed": self.completed}
+
+
+class ScrapeService:
+    """
+    State shared by every connection of a server: warm scrapers per site, one pool of site workers
+    bounding the concurrent site scrapes of all requests, and a pool of request coordinators bounding
+    the concurrent scrapes.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        max_requests: int = 16,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        cache: ResultCache | None = None,
+    ) -> None:
+        """
+        :param cache: answers repeated single-search scrapes, batches are always scraped
+        """
+        self.cache = cache
+        self.pool = ScraperPool(proxies=proxies, ca_cert=ca_cert)
+        self.workers = TrackedExecutor(max_workers, thread_name_prefix="jobspy-worker")
+        self.requests = TrackedExecutor(max_requests, thread_name_prefix="jobspy-request")
+        self.failed = 0
+        self.started = time.monotonic()
+        self._lock = threading.Lock()
+
+    def submit(self, params: dict[str, Any]) -> Future:
+        """
+        Queues a scrape
+        :param params: scrape params of the request
+        :return: future of the scrape's result
+        """
+        return self.requests.submit(self._scrape_counting_failures, params)
+
+    def _scrape_counting_failures(self, params: dict[str, Any]) -> dict[str, Any]:
+        try:
+            return self.scrape(params)
+        except Exception:
+            with self._lock:
+                self.failed += 1
+            raise
+
+    def scrape(self, params: dict[str, Any]) -> dict[str, Any]:
+        """
+        Runs a scrape on the shared workers
+        :param params: scrape_jobs arguments, optionally with "queries" for a batch of searches
+        :return: {"jobs": [...], "site_status": {...}}; batches tag jobs with their "query_id" and key
+            site_status by query id
+        """
+        params = dict(params)
+        queries = params.pop("queries", None)
+        enforce_annual_salary = bool(params.pop("enforce_annual_salary", False))
+        if queries is not None and not isinstance(queries, list):
+            raise QueriesNotListError
+        try:
+            query_ids, scraper_inputs = _build_queries(queries if queries is not None else [params], **params)
+        except (KeyError, ValueError, TypeError) as e:
+            raise InvalidParamsError(e) from e
+        if queries is not None:
+            jobs, site_status = run_queries(
+                query_ids, scraper_inputs, self.pool, self.workers, enforce_annual_salary=enforce_annual_salary
+            )
+            return {"jobs": jobs, "site_status": site_status}
+
+        def scrape_one() -> dict[str, Any]:
+            jobs, site_status = run_queries(
+                query_ids, scraper_inputs, self.pool, self.workers, enforce_annual_salary=enforce_annual_salary
+            )
+            for job_data in jobs:
+                del job_data["query_id"]
+            return {"jobs": jobs, "site_status": site_status[query_ids[0]]}
+
+        if self.cache is None:
+            return scrape_one()
+        key = cache_key(scraper_inputs[0], enforce_annual_salary=enforce_annual_salary)
+        result, state = self.cache.fetch(
+            key,
+            scrape_one,
+            store=lambda result: all(status == SiteStatus.COMPLETED.value for status in result["site_status"].values()),
+        )
+        return {**result, "cache": state.value}
+
+    def stats(self) -> dict[str, Any]:
+        requests = self.requests.stats()
+        with self._lock:
+            requests["failed"] = self.failed
+        return {
+            "requests": requests,
+            "tasks": self.workers.stats(),
+            "workers": self.workers.max_workers,
+            "max_requests": self.requests.max_workers,
+            "idle_scrapers": self.pool.idle_counts(),
+            "uptime": round(time.monotonic() - self.started, 3),
+        }
+
+    def close(self) -> None:
+        self.requests.shutdown(wait=False, cancel_futures=True)
+        self.workers.shutdown(wait=False, cancel_futures=True)
+
+
+def _encode(response: dict[str, Any]) -> bytes:
+    # dates and enums of the job dicts are sent as strings
+    return json.dumps(response, default=str).encode() + b"\n"
+
+
+def _parse_request(line: bytes) -> dict[str, Any]:
+    request = json.loads(line)
+    if not isinstance(request, dict):
+        raise InvalidRequestError
+    return request
+
+
+class JobRequestHandler(socketserver.StreamRequestHandler):
+    """
+    Serves the JSON-lines requests of one connection. Scrapes run on the service's pools and their
+    responses are written when they complete; stats and ping are answered immediately.
+    """
+
+    server: UnixJobServer | TCPJobServer
+
+    def handle(self) -> None:
+        self._write_lock = threading.Lock()
+        pending: list[Future] = []
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = _parse_request(line)
+            except (ValueError, ServerError) as e:
+                self._send({"id": None, "error": f"invalid request: {e}"})
+                continue
+            request_id = request.get("id")
+            method = request.get("method", "scrape")
+            if method == "scrape":
+                # done callbacks run after waiters are woken, so the handler waits for the sends instead
+                sent: Future = Future()
+                future = self.server.service.submit(request.get("params") or {})
+                future.add_done_callback(partial(self._send_result, request_id, sent))
+                pending.append(sent)
+            elif method == "stats":
+                self._send({"id": request_id, "result": self.server.service.stats()})
+            elif method == "ping":
+                self._send({"id": request_id, "result": "pong"})
+            else:
+                self._send({"id": request_id, "error": f"unknown method: {method}"})
+        wait(pending)
+
+    def _send_result(self, request_id: Any, sent: Future, future: Future) -> None:
+        try:
+            if future.cancelled():
+                self._send({"id": request_id, "error": "server shutting down"})
+                return
+            error = future.exception()
+            if error is None:
+                self._send({"id": request_id, "result": future.result()})
+                return
+            if not isinstance(error, ServerError):
+                logger.error(f"Scrape failed: {error!r}")
+            self._send({"id": request_id, "error": str(error)})
+        finally:
+            sent.set_result(None)
+
+    def _send(self, response: dict[str, Any]) -> None:
+        with self._write_lock:
+            try:
+                self.wfile.write(_encode(response))
+                self.wfile.flush()
+            except OSError:  # client went away, later responses of the connection are dropped too
+                pass
+
+
+class TCPJobServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address: tuple[str, int], service: ScrapeService) -> None:
+        self.service = service
+        super().__init__(address, JobRequestHandler)
+
+
+if hasattr(socket, "AF_UNIX"):
+
+    class UnixJobServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+        def __init__(self, path: str, service: ScrapeService) -> None:
+            self.service = service
+            self.socket_path = path
+            if os.path.exists(path):  # left behind by a server that did not shut down cleanly
+                os.unlink(path)
+            super().__init__(path, JobRequestHandler)
+
+        def server_close(self) -> None:
+            super().server_close()
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+
+def create_server(
+    socket_path: str | None = None,
+    host: str = "127.0.0.1",
+    port: int = DEFAULT_PORT,
+    service: ScrapeService | None = None,
+) -> UnixJobServer | TCPJobServer:
+    """
+    Creates a server listening on a Unix socket if socket_path is given, else on host:port
+    :param service: shared state of the server, a default ScrapeService if None
+    :return: server, started with serve_forever()
+    """
+    service = service if service is not None else ScrapeService()
+    if socket_path:
+        if not hasattr(socket, "AF_UNIX"):
+            raise UnixSocketError
+        return UnixJobServer(socket_path, service)
+    return TCPJobServer((host, port), service)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Serve jobspy2 scrapes over JSON lines")
+    parser.add_argument("--socket", help="Unix socket path, instead of TCP")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, default=8, help="concurrent site scrapes of all requests")
+    parser.add_argument("--max-requests", type=int, default=16, help="concurrent scrape requests")
+    parser.add_argument("--proxy", action="append", dest="proxies", help="proxy, may be repeated")
+    parser.add_argument("--ca-cert")
+    parser.add_argument("--cache", metavar="PATH", help="SQLite file caching the results of single searches")
+    parser.add_argument("--cache-ttl", type=float, default=15 * 60, help="seconds a cached result is fresh")
+    parser.add_argument(
+        "--cache-stale-ttl", type=float, default=60 * 60, help="seconds a cached result is served while refreshed"
+    )
+    args = parser.parse_args(argv)
+
+    cache = ResultCache(args.cache, ttl=args.cache_ttl, stale_ttl=args.cache_stale_ttl) if args.cache else None
+    service = ScrapeService(
+        max_workers=args.workers,
+        max_requests=args.max_requests,
+        proxies=args.proxies,
+        ca_cert=args.ca_cert,
+        cache=cache,
+    )
+    server = create_server(socket_path=args.socket, host=args.host, port=args.port, service=service)
+    logger.info(f"Serving on {server.server_address}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+jobspy2.tracing
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the tracing mode of a scrape, which records nested spans with their thread and
+timestamps and writes them as a Chrome trace-event JSON file, to be opened in Perfetto or
+chrome://tracing.
+
+A scrape records a scrape_jobs span, a site span per site, a page span per search page and the spans
+of the metrics stages (jobspy2.metrics): parse for every job, request for every search and detail
+request, markdown and construct. Like the metrics, the tracer is bound to a context variable that the
+scrapers' thread pools copy into their threads.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import json
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from typing import Any
+
+_current: contextvars.ContextVar[Tracer | None] = contextvars.ContextVar("jobspy2_tracer", default=None)
+_untraced = nullcontext()
+
+
+class Tracer:
+    """
+    Collects the spans of a scrape as Chrome trace "complete" events.
+    """
+
+    def __init__(self) -> None:
+        self.events: list[dict[str, Any]] = []
+        self.pid = os.getpid()
+        self._threads: dict[int, str] = {}
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, **args: Any) -> Iterator[None]:
+        """
+        Records the block as a span of the current thread
+        :param args: shown with the span in the trace viewer
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, started, time.perf_counter(), args)
+
+    def add(self, name: str, started: float, ended: float, args: dict[str, Any] | None = None) -> None:
+        """
+        Records a span of the current thread
+        :param started: time.perf_counter() at the start of the span
+        :param ended: time.perf_counter() at its end
+        """
+        thread = threading.current_thread()
+        tid = threading.get_native_id()
+        event = {
+            "name": name,
+            "cat": "jobspy2",
+            "ph": "X",
+            "ts": (started - self._origin) * 1e6,
+            "dur": (ended - started) * 1e6,
+            "pid": self.pid,
+            "tid": tid,
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            self.events.append(event)
+            self._threads.setdefault(tid, thread.name)
+
+    def trace(self) -> dict[str, Any]:
+        """
+        :return: the trace-event JSON object, spans sorted by start with thread names as metadata
+        """
+        with self._lock:
+            events = sorted(self.events, key=lambda event: event["ts"])
+            threads = dict(self._threads)
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": self.pid, "tid": tid, "args": {"name": name}}
+            for tid, name in threads.items()
+        ]
+        return {"traceEvents": metadata + events, "displayTimeUnit": "ms"}
+
+    def write(self, path: str | os.PathLike[str]) -> None:
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.trace(), file, default=str)
+
+
+def current_tracer() -> Tracer | None:
+    return _current.get()
+
+
+def use_tracer(tracer: Tracer | None) -> contextvars.Token:
+    """
+    Binds a tracer to the current context
+    :return: token to reset the binding with
+    """
+    return _current.set(tracer)
+
+
+def span(name: str, **args: Any) -> AbstractContextManager[None]:
+    """
+    Records the block as a span of the current context's tracer, if tracing
+    """
+    tracer = _current.get()
+    return _untraced if tracer is None else tracer.span(name, **args)
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections.abc import Iterator
+from datetime import date
+
+import jobspy2
+from jobspy2 import scrape_jobs
+from jobspy2.cache import CacheState, ResultCache, cache_key
+from jobspy2.jobs import JobPost
+from jobspy2.scrapers import ScraperInput, Site
+
+from .test_iter_jobs import FakeScraper
+
+
+class CountingScraper(FakeScraper):
+    calls = 0
+
+    def iter_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobPost]]:
+        CountingScraper.calls += 1
+        yield from super().iter_pages(scraper_input)
+
+
+def test_cache_key_normalizes_search():
+    key = cache_key(ScraperInput(site_type=[Site.INDEED, Site.LINKEDIN], search_term="Python  Developer"))
+    assert key == cache_key(ScraperInput(site_type=[Site.LINKEDIN, Site.INDEED], search_term="python developer"))
+    assert key != cache_key(ScraperInput(site_type=[Site.INDEED], search_term="python developer"))
+    assert key != cache_key(
+        ScraperInput(site_type=[Site.INDEED, Site.LINKEDIN], search_term="python developer"), enforce_annual_salary=True
+    )
+
+
+def test_cache_round_trips_dates(tmp_path):
+    cache = ResultCache(tmp_path / "results.sqlite")
+    cache.put("key", {"jobs": [{"date_posted": date(2024, 5, 1)}]})
+    value, age = cache.get("key")
+    assert value == {"jobs": [{"date_posted": date(2024, 5, 1)}]}
+    assert age >= 0
+    assert cache.get("other") is None
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = ResultCache(tmp_path / "results.sqlite", max_bytes=2_000)
+    for i in range(3):
+        cache.put(f"key{i}", [os.urandom(16).hex() for _ in range(40)])
+        cache.get("key0")
+    assert cache.get("key0") is not None
+    assert cache.get("key1") is None
+
+
+def test_fetch_serves_stale_and_refreshes_once(tmp_path):
+    cache = ResultCache(tmp_path / "results.sqlite", ttl=0, stale_ttl=60)
+    cache.put("key", "old")
+    release = threading.Event()
+    calls: list[int] = []
+
+    def compute() -> str:
+        calls.append(1)
+        release.wait(5)
+        return "new"
+
+    assert cache.fetch("key", compute) == ("old", CacheState.STALE)
+    assert cache.fetch("key", compute) == ("old", CacheState.STALE)
+    release.set()
+    for _ in range(100):
+        if cache.get("key")[0] == "new":
+            break
+        time.sleep(0.01)
+    assert cache.get("key")[0] == "new"
+    assert len(calls) == 1
+
+
+def test_scrape_jobs_uses_cache(monkeypatch, tmp_path):
+    monkeypatch.setitem(jobspy2.SCRAPER_MAPPING, Site.INDEED, CountingScraper)
+    CountingScraper.calls = 0
+    cache = ResultCache(tmp_path / "results.sqlite")
+    first = scrape_jobs(site_name="indeed", search_term="Engineer", cache=cache)
+    second = scrape_jobs(site_name="indeed", search_term="engineer", cache=cache, hyperlinks=True)
+    assert (first.attrs["cache"], second.attrs["cache"]) == ("miss", "fresh")
+    assert CountingScraper.calls == 1
+    assert second.attrs["site_status"] == {"indeed": "completed"}
+    assert list(second["title"]) == list(first["title"])
+    assert second["job_url_hyper"][0].startswith("<a href=")
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import json
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import jobspy2
+from jobspy2 import scrape_jobs
+from jobspy2.jobs import JobPost
+from jobspy2.scrapers import ScraperInput, Site
+from jobspy2.scrapers import cassette as cassette_module
+from jobspy2.scrapers.cassette import Cassette
+from jobspy2.scrapers.exceptions import CassetteMissError
+from jobspy2.scrapers.utils import create_session
+
+from .test_iter_jobs import FakeScraper
+
+
+class EchoHandler(BaseHTTPRequestHandler):
+    def _reply(self, body: bytes) -> None:
+        payload = json.dumps({"method": self.command, "path": self.path, "body": body.decode()}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+        self.server.requests += 1  # type: ignore[attr-defined]
+
+    def do_GET(self) -> None:
+        self._reply(b"")
+
+    def do_POST(self) -> None:
+        self._reply(self.rfile.read(int(self.headers["Content-Length"])))
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+class FetchingScraper(FakeScraper):
+    url = ""
+
+    def iter_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobPost]]:
+        session = create_session(is_tls=False)
+        path = session.get(self.url, params={"q": scraper_input.search_term}).json()["path"]
+        yield [JobPost(title=path, company_name="Acme", job_url=f"{self.url}/1", location=None)]
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), EchoHandler)
+    server.requests = 0  # type: ignore[attr-defined]
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_replays_recorded_scrape_without_network(server, tmp_path):
+    url = f"http://127.0.0.1:{server.server_port}/jobs"
+    path = tmp_path / "scrape.jsonl.gz"
+    with Cassette(path, "record"):
+        session = create_session(is_tls=False)
+        recorded = [
+            session.get(url, params={"start": 0}),
+            session.get(url, params={"start": 10}),
+            session.post(url, json={"id": 1}),
+        ]
+    server.shutdown()
+
+    with Cassette(path, "replay"):
+        session = create_session(is_tls=False)
+        replayed = [
+            session.get(url, params={"start": 10}),
+            session.get(url, params={"start": 0}),
+            session.post(url, json={"id": 1}),
+        ]
+        with pytest.raises(CassetteMissError):
+            session.post(url, json={"id": 2})
+    assert server.requests == 3
+    assert [response.json() for response in replayed] == [recorded[i].json() for i in (1, 0, 2)]
+    assert replayed[0].headers["content-type"] == "application/json"
+
+    # the same cassette answers tls sessions
+    tls_session = create_session(cassette=Cassette(path, "replay"))
+    response = tls_session.get(url, params={"start": 10})
+    assert response.ok and response.json() == recorded[1].json()
+
+
+def test_scrape_jobs_replays_without_network(server, tmp_path, monkeypatch):
+    monkeypatch.setattr(FetchingScraper, "url", f"http://127.0.0.1:{server.server_port}/jobs")
+    monkeypatch.setitem(jobspy2.SCRAPER_MAPPING, Site.INDEED, FetchingScraper)
+    path = tmp_path / "scrape.jsonl.gz"
+    with Cassette(path, "record"):
+        recorded = scrape_jobs(site_name="indeed", search_term="engineer")
+    assert server.requests == 1
+
+    with Cassette(path, "replay"):
+        replayed = scrape_jobs(site_name="indeed", search_term="engineer")
+    assert server.requests == 1
+    assert list(replayed["title"]) == list(recorded["title"]) == ["/jobs?q=engineer"]
+
+
+def test_replay_timing(server, tmp_path, monkeypatch):
+    url = f"http://127.0.0.1:{server.server_port}/"
+    path = tmp_path / "timing.jsonl.gz"
+    with Cassette(path, "record") as cassette:
+        create_session(is_tls=False, cassette=cassette).get(url)
+    with pytest.raises(ValueError):
+        Cassette(path, "replay", speed=0)
+
+    sleeps: list[float] = []
+    monkeypatch.setattr(cassette_module.time, "sleep", sleeps.append)
+    for speed in (None, 1, 4):
+        session = create_session(is_tls=False, cassette=Cassette(path, "replay", speed=speed))
+        # repeated requests replay the last recorded response
+        session.get(url)
+        session.get(url)
+    assert len(sleeps) == 4
+    assert sleeps[0] == sleeps[1] > 0
+    assert sleeps[2] == pytest.approx(sleeps[0] / 4)
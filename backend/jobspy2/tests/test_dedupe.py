@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import random
+from collections.abc import Iterator
+
+import jobspy2
+from jobspy2 import scrape_jobs
+from jobspy2.dedupe import DuplicateDetector, DuplicateIndex, dedupe_jobs, job_key
+from jobspy2.jobs import JobPost, Location
+from jobspy2.minhash import description_signature, description_signatures, signature_similarity
+from jobspy2.scrapers import PageWindow, Scraper, ScraperInput, Site
+
+WORDS = [f"word{i}" for i in range(1_000)]
+
+
+def make_description(seed: int, length: int = 200) -> str:
+    return " ".join(random.Random(seed).choices(WORDS, k=length))
+
+
+def make_job_data(site: str, title: str, description: str, company: str = "Acme Inc.") -> dict:
+    return {"site": site, "title": title, "company": company, "location": "Nairobi, Kenya", "description": description}
+
+
+def test_job_key_normalizes_fields():
+    assert job_key("Senior  Engineer!", "Acme, Inc.", "Nairobi, Kenya") == "senior engineer|acme|nairobi"
+    assert job_key("senior engineer", "ACME", Location(city="Nairobi")) == "senior engineer|acme|nairobi"
+
+
+def test_duplicate_index_first_site_wins():
+    index = DuplicateIndex()
+    assert index.claim("key", "linkedin")
+    assert index.claim("key", "linkedin")
+    assert not index.claim("key", "indeed")
+    assert index.owner("key") == "linkedin"
+    index.release("key", "indeed")
+    assert index.owner("key") == "linkedin"
+    index.release("key", "linkedin")
+    assert index.claim("key", "indeed")
+
+
+def test_signatures_match_single_description():
+    descriptions = [make_description(1), None, "too short", make_description(2)]
+    signatures = description_signatures(descriptions)
+    assert (signatures[0] == description_signature(descriptions[0])).all()
+    assert description_signature(descriptions[1]) is None
+    assert description_signature(descriptions[2]) is None
+    assert signature_similarity(signatures[0], signatures[3]) < 0.2
+
+
+def test_signature_ignores_case_and_punctuation():
+    description = make_description(3, length=100)
+    edited = description.upper().replace(" ", ", ")
+    assert signature_similarity(description_signature(description), description_signature(edited)) == 1.0
+
+
+def test_detector_flags_near_duplicates_from_other_sites():
+    description = make_description(4)
+    words = description.split()
+    words[100] = "edited"
+    near_copy = " ".join(words)
+    detector = DuplicateDetector()
+    assert not detector.is_duplicate(make_job_data("linkedin", "Data Engineer", description))
+    assert detector.is_duplicate(make_job_data("indeed", "Data Engineer", "other"))
+    assert detector.is_duplicate(make_job_data("indeed", "Data Engineer (Remote)", near_copy))
+    assert not detector.is_duplicate(make_job_data("linkedin", "Data Engineer (Hybrid)", near_copy))
+    assert not detector.is_duplicate(make_job_data("indeed", "Data Engineer II", make_description(5)))
+    assert not detector.is_duplicate(make_job_data("glassdoor", "Data Engineer", near_copy, company="Globex"))
+
+
+def test_dedupe_jobs_keeps_first_copy():
+    jobs = [
+        make_job_data("linkedin", "Data Engineer", make_description(6)),
+        make_job_data("indeed", "Data Engineer (Remote)", make_description(6)),
+        make_job_data("indeed", "Data Analyst", make_description(7)),
+    ]
+    assert dedupe_jobs(jobs) == [jobs[0], jobs[2]]
+
+
+def fake_scraper(site: Site, detail_fetches: list[str]) -> type[Scraper]:
+    class SiteScraper(Scraper):
+        def __init__(self, logger, proxies=None, ca_cert=None) -> None:
+            super().__init__(site, logger=logger, proxies=proxies, ca_cert=ca_cert)
+
+        def iter_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobPost]]:
+            self.scraper_input = scraper_input
+            jobs = []
+            for i in range(3):
+                title = f"Engineer {i}" if i < 2 else f"{site.value} only"
+                if not self.known_elsewhere(title, "Acme", None):
+                    detail_fetches.append(title)
+                job_url = f"https://example.com/{site.value}/{i}"
+                jobs.append(
+                    JobPost(id=f"{site.value}-{i}", title=title, company_name="Acme", job_url=job_url, location=None)
+                )
+            yield jobs
+
+    return SiteScraper
+
+
+def test_scrape_jobs_dedupe_skips_details_and_rows(monkeypatch):
+    detail_fetches: list[str] = []
+    monkeypatch.setitem(jobspy2.SCRAPER_MAPPING, Site.INDEED, fake_scraper(Site.INDEED, detail_fetches))
+    monkeypatch.setitem(jobspy2.SCRAPER_MAPPING, Site.LINKEDIN, fake_scraper(Site.LINKEDIN, detail_fetches))
+    result = scrape_jobs(site_name=["indeed", "linkedin"], dedupe=True)
+    assert sorted(result["title"]) == ["Engineer 0", "Engineer 1", "indeed only", "linkedin only"]
+    assert sorted(detail_fetches) == sorted(result["title"])
+    assert len(scrape_jobs(site_name=["indeed", "linkedin"])) == 6
+
+
+def test_take_page_releases_claims_of_jobs_left_out():
+    scraper = fake_scraper(Site.ZIP_RECRUITER, [])(logger=None)
+    index = DuplicateIndex()
+    scraper.scraper_input = ScraperInput(site_type=[Site.ZIP_RECRUITER], duplicate_index=index)
+    window = PageWindow(limit=2, offset=1)
+    taken = []
+    for titles in (["Engineer 0", "Engineer 1"], ["Engineer 2", "Engineer 1", "Engineer 3"]):
+        jobs = []
+        for i, title in enumerate(titles):
+            assert not scraper.known_elsewhere(title, "Acme", None)
+            job_url = f"https://example.com/{i}"
+            jobs.append(JobPost(id=str(i), title=title, company_name="Acme", job_url=job_url, location=None))
+        taken += [job.title for job in scraper.take_page(window, jobs)]
+    # Engineer 1 left out of the last page keeps the claim of its copy taken from the first page
+    assert taken == ["Engineer 1", "Engineer 2"]
+    owners = [index.owner(job_key(f"Engineer {i}", "Acme", None)) for i in range(4)]
+    assert owners == [None, "zip_recruiter", "zip_recruiter", None]
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import logging
+
+import pytest
+
+import jobspy2
+from jobspy2 import FieldsError, scrape_jobs, scrape_jobs_batch
+from jobspy2.scrapers import Site
+from jobspy2.scrapers.glassdoor import GlassdoorScraper
+
+from .test_iter_jobs import FakeScraper
+
+
+def glassdoor_job(listing_id: int) -> dict:
+    return {
+        "jobview": {
+            "job": {"listingId": listing_id, "jobTitleText": "Engineer"},
+            "header": {
+                "employerNameFromSearch": "Acme",
+                "employer": {"id": 1},
+                "locationName": "Austin, TX",
+                "locationType": "C",
+                "ageInDays": 1,
+            },
+        }
+    }
+
+
+def test_scrape_jobs_returns_requested_fields(monkeypatch):
+    monkeypatch.setitem(jobspy2.SCRAPER_MAPPING, Site.INDEED, FakeScraper)
+    jobs_df = scrape_jobs(site_name="indeed", results_wanted=6, fields=["title", "company", "job_url", "min_amount"])
+    assert list(jobs_df.columns) == ["job_url", "title", "company", "min_amount"]
+    assert len(jobs_df) == 6
+    with pytest.raises(FieldsError, match="descr"):
+        scrape_jobs(site_name="indeed", fields=["title", "descr"])
+
+
+def test_scrape_jobs_batch_returns_the_queries_fields(monkeypatch):
+    monkeypatch.setitem(jobspy2.SCRAPER_MAPPING, Site.INDEED, FakeScraper)
+    queries = [{"search_term": "python", "fields": ["title"]}, {"search_term": "react", "fields": ["company"]}]
+    jobs_df = scrape_jobs_batch(queries, site_name="indeed", dedupe=False)
+    assert list(jobs_df.columns) == ["title", "company", "query_id"]
+    queries.append({"search_term": "go"})
+    assert len(scrape_jobs_batch(queries, site_name="indeed", dedupe=False).columns) > 3
+
+
+@pytest.mark.parametrize(
+    ("fields", "fetches"), [(["title", "company", "location", "min_amount"], 0), (["title", "emails"], 1), (None, 1)]
+)
+def test_glassdoor_fetches_descriptions_only_when_needed(monkeypatch, fields, fetches):
+    fetched: list[str] = []
+    monkeypatch.setattr(GlassdoorScraper, "_fetch_job_description", lambda self, job_id: fetched.append(job_id))
+    scraper = GlassdoorScraper(logger=logging.getLogger("test"))
+    scraper.base_url = "https://www.glassdoor.com/"
+    scraper.scraper_input = jobspy2._build_scraper_input(site_name="glassdoor", fields=fields)
+    job = scraper._process_job(glassdoor_job(1))
+    assert job is not None and job.title == "Engineer"
+    assert len(fetched) == fetches
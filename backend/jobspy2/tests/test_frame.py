@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import date
+
+import jobspy2
+from jobspy2 import scrape_jobs
+from jobspy2.frame import JobFrameBuilder, job_columns
+from jobspy2.jobs import JobPost
+from jobspy2.scrapers import ScraperInput, Site
+from jobspy2.scrapers.linkedin import LinkedInScraper
+from jobspy2.scrapers.utils import create_job_post
+
+from .test_iter_jobs import FakeScraper
+
+
+class DatedScraper(FakeScraper):
+    def posted(self, i: int) -> date | None:
+        return date(2024, 1, 1 + i)
+
+    def iter_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobPost]]:
+        yield [
+            create_job_post(
+                id=f"{self.site.value}-{i}",
+                title=f"Engineer {i}",
+                company_name="Acme",
+                job_url=f"https://example.com/{self.site.value}/{i}",
+                location=None,
+                date_posted=self.posted(i),
+            )
+            for i in range(2)
+        ]
+
+
+class LinkedInDatedScraper(DatedScraper):
+    def __init__(self, logger, proxies=None, ca_cert=None) -> None:
+        super().__init__(logger, proxies=proxies, ca_cert=ca_cert)
+        self.site = Site.LINKEDIN
+
+    def posted(self, i: int) -> date | None:
+        return LinkedInScraper._parse_date(self, f"2024-01-0{3 + i}")
+
+
+def test_builder_column_order_and_sort():
+    builder = JobFrameBuilder()
+    builder.append({"id": "in-1", "site": "indeed", "title": "a", "date_posted": date(2024, 1, 1)})
+    builder.append({"id": "li-1", "site": "linkedin", "title": "b", "date_posted": date(2024, 1, 3)})
+    builder.append({"id": "in-2", "site": "indeed", "title": "c", "date_posted": date(2024, 1, 2), "extra": 1})
+    jobs_df = builder.build()
+
+    assert list(jobs_df.columns) == job_columns()
+    assert list(jobs_df["id"]) == ["in-2", "in-1", "li-1"]
+    assert jobs_df["company"].isna().all()
+
+
+def test_builder_empty():
+    assert JobFrameBuilder(hyperlinks=True).build().empty
+    assert "job_url_hyper" in job_columns(hyperlinks=True)
+
+
+def test_builder_projects_fields():
+    builder = JobFrameBuilder(hyperlinks=True, fields=["title", "job_url", "site"])
+    builder.append({"site": "indeed", "title": "a", "job_url_hyper": "<a>", "description": "..."})
+    jobs_df = builder.build()
+    assert list(jobs_df.columns) == ["site", "job_url_hyper", "title"]
+    assert list(JobFrameBuilder(fields=["title"]).columns) == ["title"]
+
+
+def test_builder_sorts_dates_of_mixed_sites(monkeypatch):
+    monkeypatch.setitem(jobspy2.SCRAPER_MAPPING, Site.INDEED, DatedScraper)
+    monkeypatch.setitem(jobspy2.SCRAPER_MAPPING, Site.LINKEDIN, LinkedInDatedScraper)
+    jobs = scrape_jobs(site_name=["indeed", "linkedin"], search_term="engineer", results_wanted=2)
+    assert list(jobs["id"]) == ["indeed-1", "indeed-0", "linkedin-1", "linkedin-0"]
+    assert {type(posted) for posted in jobs["date_posted"]} == {date}
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+
+import jobspy2
+from jobspy2 import iter_jobs, scrape_jobs
+from jobspy2.incremental import HOURS_OLD_MARGIN, WatermarkStore
+from jobspy2.jobs import JobPost
+from jobspy2.scrapers import ScraperInput, Site
+
+from .test_iter_jobs import FakeScraper, make_job
+
+
+class GrowingScraper(FakeScraper):
+    """Lists the newest jobs first, with `posted` new jobs on top of the previous run's."""
+
+    posted = 0
+    pages_fetched = 0
+    hours_old: int | None = None
+
+    def iter_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobPost]]:
+        GrowingScraper.hours_old = scraper_input.hours_old
+        newest = 100 + GrowingScraper.posted
+        for page in range(self.pages_per_site):
+            GrowingScraper.pages_fetched += 1
+            yield [make_job(self.site, newest - page * 2 - i) for i in range(2)]
+
+
+def test_incremental_runs_return_only_new_jobs(monkeypatch, tmp_path):
+    monkeypatch.setitem(jobspy2.SCRAPER_MAPPING, Site.INDEED, GrowingScraper)
+    store = WatermarkStore(tmp_path / "watermarks.sqlite")
+
+    first = scrape_jobs(site_name="indeed", search_term="engineer", watermarks=store)
+    assert len(first) == 6
+    assert GrowingScraper.hours_old is None
+
+    GrowingScraper.posted = 1
+    GrowingScraper.pages_fetched = 0
+    second = scrape_jobs(site_name="indeed", search_term="Engineer", results_wanted=50, watermarks=store)
+    assert list(second["id"]) == ["indeed-101"]
+    # the second page only lists known jobs, so the third is never fetched
+    assert GrowingScraper.pages_fetched == 2
+    assert GrowingScraper.hours_old == 1 + HOURS_OLD_MARGIN
+
+    assert scrape_jobs(site_name="indeed", search_term="engineer", watermarks=store).empty
+
+
+def test_truncated_run_keeps_last_run(monkeypatch, tmp_path):
+    monkeypatch.setitem(jobspy2.SCRAPER_MAPPING, Site.INDEED, GrowingScraper)
+    store = WatermarkStore(tmp_path / "watermarks.sqlite")
+    key = store.query_key(ScraperInput(site_type=[Site.INDEED], search_term="engineer", country=jobspy2.Country.USA))
+    started = time.time()
+
+    jobs = iter_jobs(site_name="indeed", search_term="engineer", distance=None, watermarks=store)
+    first = next(jobs)
+    jobs.close()
+    assert store.last_run(key) is None
+    assert store.known_ids(key) == {first["id"]}
+
+    list(iter_jobs(site_name="indeed", search_term="engineer", distance=None, watermarks=store))
+    assert store.last_run(key) >= started
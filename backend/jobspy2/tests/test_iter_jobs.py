@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Iterator
+
+import pytest
+
+import jobspy2
+from jobspy2 import QueryError, ascrape_jobs, iter_jobs, scrape_jobs, scrape_jobs_batch
+from jobspy2.jobs import JobPost
+from jobspy2.scrapers import PagePrefetcher, PageWindow, Scraper, ScraperInput, Site
+
+
+def make_job(site: Site, i: int) -> JobPost:
+    return JobPost(
+        id=f"{site.value}-{i}",
+        title=f"Engineer {i}",
+        company_name="Acme",
+        job_url=f"https://example.com/{site.value}/{i}",
+        location=None,
+    )
+
+
+class FakeScraper(Scraper):
+    pages_per_site = 3
+
+    def __init__(self, logger, proxies=None, ca_cert=None) -> None:
+        super().__init__(Site.INDEED, logger=logger, proxies=proxies, ca_cert=ca_cert)
+
+    def iter_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobPost]]:
+        for page in range(self.pages_per_site):
+            yield [make_job(self.site, page * 2 + i) for i in range(2)]
+
+
+def test_page_window():
+    window = PageWindow(limit=3, offset=2)
+    assert window.take([1, 2]) == []
+    assert window.take([3, 4]) == [3, 4]
+    assert not window.full
+    assert window.take([5, 6]) == [5]
+    assert window.full
+
+
+def test_page_prefetcher_overlaps_next_request():
+    requested: list[int] = []
+    fetched = threading.Event()
+
+    def fetch(cursor: int) -> tuple[list[int], int | None]:
+        requested.append(cursor)
+        if cursor == 1:
+            fetched.set()
+        return [cursor], cursor + 1 if cursor < 3 else None
+
+    pages = PagePrefetcher(fetch, cursor=0)
+    page_iter = iter(pages)
+    assert next(page_iter) == [0]
+    # page 1 is requested while page 0 is being processed
+    assert fetched.wait(5)
+    assert list(page_iter) == [[1], [2], [3]]
+    assert requested == [0, 1, 2, 3]
+
+
+def test_page_prefetcher_stops_prefetching_when_enough():
+    requested: list[int] = []
+
+    def fetch(cursor: int) -> tuple[list[int], int]:
+        requested.append(cursor)
+        return [cursor, cursor], cursor + 1
+
+    pages = PagePrefetcher(fetch, cursor=0, depth=3, more=lambda fetched: fetched < 4)
+    page_iter = iter(pages)
+    assert next(page_iter) == [0, 0]
+    assert next(page_iter) == [1, 1]
+    assert requested == [0, 1]
+    # pages past the prefetch limit are still fetched on demand
+    assert next(page_iter) == [2, 2]
+    pages.close()
+
+
+def test_iter_jobs_streams_processed_jobs(monkeypatch):
+    monkeypatch.setitem(jobspy2.SCRAPER_MAPPING, Site.INDEED, FakeScraper)
+    jobs = list(iter_jobs(site_name="indeed"))
+    assert len(jobs) == 6
+    assert jobs[0]["site"] == "indeed"
+    assert jobs[0]["company"] == "Acme"
+
+
+def test_iter_jobs_early_close(monkeypatch):
+    monkeypatch.setitem(jobspy2.SCRAPER_MAPPING, Site.INDEED, FakeScraper)
+    jobs = iter_jobs(site_name="indeed")
+    next(jobs)
+    jobs.close()
+
+
+def test_scrape_jobs_uses_stream(monkeypatch):
+    monkeypatch.setitem(jobspy2.SCRAPER_MAPPING, Site.INDEED, FakeScraper)
+    result = scrape_jobs(site_name="indeed")
+    assert len(result) == 6
+
+
+def test_ascrape_jobs(monkeypatch):
+    monkeypatch.setitem(jobspy2.SCRAPER_MAPPING, Site.INDEED, FakeScraper)
+    monkeypatch.setitem(jobspy2.SCRAPER_MAPPING, Site.LINKEDIN, FakeScraper)
+    result = asyncio.run(ascrape_jobs(site_name=["indeed", "linkedin"]))
+    assert len(result) == 12
+
+
+def test_scrape_jobs_batch_dedupes_across_queries(monkeypatch):
+    monkeypatch.setitem(jobspy2.SCRAPER_MAPPING, Site.INDEED, FakeScraper)
+    result = scrape_jobs_batch(
+        [{"search_term": "python"}, {"search_term": "react", "query_id": "react"}],
+        site_name="indeed",
+        max_workers=2,
+    )
+    assert len(result) == 6
+    assert set(result["query_id"]) == {0}
+    assert list(result.columns)[-1] == "query_id"
+
+    result = scrape_jobs_batch([{"search_term": "python"}, {"search_term": "react"}], site_name="indeed", dedupe=False)
+    assert len(result) == 12
+
+
+@pytest.mark.parametrize("query", [{"search_term": "python", "enforce_annual_salary": True}, {"serch_term": "python"}])
+def test_scrape_jobs_batch_rejects_unknown_query_keys(monkeypatch, query):
+    monkeypatch.setitem(jobspy2.SCRAPER_MAPPING, Site.INDEED, FakeScraper)
+    with pytest.raises(QueryError, match=next(key for key in query if key != "search_term")):
+        scrape_jobs_batch([{"search_term": "react"}, query], site_name="indeed")
+
+
+class BrokenQueryScraper(FakeScraper):
+    def iter_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobPost]]:
+        if scraper_input.search_term == "broken":
+            raise ValueError
+        yield from super().iter_pages(scraper_input)
+
+
+def test_scrape_jobs_batch_contains_failing_queries(monkeypatch):
+    monkeypatch.setitem(jobspy2.SCRAPER_MAPPING, Site.INDEED, BrokenQueryScraper)
+    result = scrape_jobs_batch(
+        [{"search_term": "broken"}, {"search_term": "python"}], site_name="indeed", fields=["title", "company"]
+    )
+    assert result.attrs["site_status"] == {0: {"indeed": "failed"}, 1: {"indeed": "completed"}}
+    assert len(result) == 6
+    assert set(result["query_id"]) == {1}
+    assert list(result.columns) == ["title", "company", "query_id"]
+
+
+class SlowScraper(FakeScraper):
+    def iter_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobPost]]:
+        self.scraper_input = scraper_input
+        for page in range(50):
+            if self.out_of_time():
+                return
+            self.sleep(0.05)
+            yield [make_job(self.site, page)]
+
+
+def test_time_budget_returns_partial_results(monkeypatch):
+    monkeypatch.setitem(jobspy2.SCRAPER_MAPPING, Site.INDEED, FakeScraper)
+    monkeypatch.setitem(jobspy2.SCRAPER_MAPPING, Site.LINKEDIN, SlowScraper)
+    result = scrape_jobs(site_name=["indeed", "linkedin"], time_budget_seconds=0.5)
+    assert result.attrs["site_status"] == {"indeed": "completed", "linkedin": "truncated"}
+    assert 6 < len(result) < 56
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+from pydantic import ValidationError
+
+import jobspy2
+from jobspy2 import scrape_jobs
+from jobspy2.jobs import Compensation, Country, CountryError, JobPost, JobType, Location, validate_jobs
+from jobspy2.scrapers import ScraperInput, Site
+from jobspy2.scrapers.utils import create_job_post, extract_job_type, extract_job_types
+
+from .test_iter_jobs import FakeScraper
+
+
+class UntypedScraper(FakeScraper):
+    def iter_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobPost]]:
+        yield [create_job_post(title=None, company_name="Acme", job_url="https://example.com/1", location=None)]
+
+
+def test_from_trusted_matches_validation():
+    fields = {
+        "id": "in-1",
+        "title": "Engineer",
+        "company_name": "Acme",
+        "job_url": "https://example.com/1",
+        "location": Location(city="Austin", state="TX"),
+        "compensation": Compensation(min_amount=1, max_amount=2),
+    }
+    job = JobPost.from_trusted(fields)
+    assert job == JobPost(**fields)
+    assert list(job.model_dump()) == list(JobPost.model_fields)
+    assert job.model_fields_set == set(fields)
+    # validated when a required field is missing
+    with pytest.raises(ValidationError):
+        JobPost.from_trusted({"title": "Engineer"})
+
+
+def test_pages_are_validated_in_batch_on_request(monkeypatch):
+    monkeypatch.setitem(jobspy2.SCRAPER_MAPPING, Site.INDEED, UntypedScraper)
+    assert len(scrape_jobs(site_name="indeed")) == 1
+    monkeypatch.setenv(jobspy2.VALIDATE_JOBS_ENV, "1")
+    with pytest.raises(ValidationError, match="title"):
+        scrape_jobs(site_name="indeed")
+    assert validate_jobs([JobPost.from_trusted({"title": "a", "company_name": None, "job_url": "u", "location": None})])
+
+
+def test_country_and_job_type_lookups():
+    assert Country.from_string(" United Kingdom ") is Country.from_string("uk") is Country.UK
+    assert Country.from_string("czechia") is Country.from_string("Czech-Republic") is Country.CZECHREPUBLIC
+    with pytest.raises(CountryError):
+        Country.from_string("atlantis")
+    assert JobType.from_alias("vollzeit") is JobType.from_alias("Full-Time") is JobType.FULL_TIME
+    assert JobType.from_alias("per_diem") is JobType.PER_DIEM
+    assert JobType.from_alias("nope") is None
+    assert jobspy2._get_enum_from_value("part time") is JobType.PART_TIME
+    with pytest.raises(jobspy2.JobTypeError):
+        jobspy2._get_enum_from_value("nope")
+
+
+def test_extract_job_type():
+    descriptions = [
+        "A FULLTIME contract role, no INTERNSHIP",
+        "Fuldtid eller Teilzeit",
+        "Poste en 全职, volunteer welcome",
+        "Kelvin \u212a sensors, temporary",
+        "",
+        None,
+    ]
+    expected = [
+        [JobType.FULL_TIME, JobType.CONTRACT, JobType.INTERNSHIP],
+        [JobType.FULL_TIME, JobType.PART_TIME],
+        [JobType.FULL_TIME, JobType.VOLUNTEER],
+        [JobType.TEMPORARY],
+        [],
+        [],
+    ]
+    assert [extract_job_type(description) for description in descriptions] == expected
+    assert extract_job_types(descriptions) == expected
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import contextvars
+from collections import OrderedDict
+
+import pytest
+from markdownify import markdownify
+
+from jobspy2.metrics import SiteMetrics, use_metrics
+from jobspy2.scrapers import markdown
+from jobspy2.scrapers.markdown import html_to_markdown
+from jobspy2.scrapers.utils import markdown_converter
+
+SUPPORTED = [
+    "<div><h2>About the role</h2><p>Build <b>reliable</b> services with <i>Python</i>.</p></div>",
+    "<p><strong>Responsibilities:</strong><br>Ship features<br/>Review code</p>\n<p>&nbsp;</p>",
+    "<ul>\n  <li>5+ years of <em>backend</em> work</li>\n  <li>SQL &amp; NoSQL</li>\n</ul>\n<p>Then this.</p>",
+    "<ol start=3><li>First<ul><li>nested <span>item</span></li></ul></li><li>Second</li></ol>",
+    "<h3>Benefits</h3><ul><li>401(k)</li><li></li><li>snake_case *stars*</li></ul>Trailing text",
+    '<p>Apply at <a href="https://example.com/a_b">https://example.com/a_b</a> or <a href=/jobs/ title="T">here</a></p>',
+    "<h1>Title <p>inside</p> heading</h1><hr><img src=logo.png alt=Logo><h4> spaced\n out </h4>",
+    "Salary&#58; $90,000 &#x2013; $140,000 &foo; <u>per year</u> & more<p>a</P></br>b<s> struck </s>",
+    "<section>\r\n<article>\t<div>  deep  </div>\t</article>\r\n</section><sub> x</sub><sup></sup>",
+]
+
+UNSUPPORTED = [
+    "<table><tr><th>Pay</th></tr><tr><td>$40/h</td></tr></table>",
+    "<p>Hi<!-- comment --> there</p>",
+    "<p>x < y</p>",
+    "<pre><code>print(1)</code></pre>",
+    "<p>R&D</p>",
+]
+
+
+@pytest.mark.parametrize("html", SUPPORTED)
+def test_converts_like_markdownify(html):
+    assert markdown._convert(markdown._parse(html), inline=False, in_list=False) == markdownify(html)
+    assert html_to_markdown(html) == markdownify(html)
+
+
+@pytest.mark.parametrize("html", UNSUPPORTED)
+def test_falls_back_to_markdownify(html):
+    with pytest.raises(markdown._UnsupportedError):
+        markdown._parse(html)
+    assert html_to_markdown(html) == markdownify(html)
+
+
+def test_markdown_converter():
+    assert markdown_converter(None) is None
+    assert markdown_converter("<p> </p>") is None
+    assert markdown_converter("<p>Job <b>1</b></p>") == "Job **1**"
+
+
+def test_conversions_are_memoized(monkeypatch):
+    monkeypatch.setattr(markdown, "CACHE_SIZE", 2)
+    monkeypatch.setattr(markdown, "_cache", OrderedDict())
+    site_metrics = SiteMetrics()
+    context = contextvars.copy_context()
+    context.run(use_metrics, site_metrics)
+    for html in ("<p>a</p>", "<p>b</p>", "<p>a</p>", "<p>c</p>", "<p>b</p>"):
+        context.run(html_to_markdown, html)
+    assert site_metrics.counters["markdown_cache_hits"] == 1
+    assert list(markdown._cache.values()) == ["c", "b"]
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import closing
+from typing import Any, ClassVar
+
+import jobspy2
+from jobspy2 import scrape_jobs
+from jobspy2.jobs import JobPost
+from jobspy2.metrics import SiteMetrics, count, timed
+from jobspy2.scrapers import ScraperInput, Site
+from jobspy2.scrapers.utils import (
+    RetryPolicy,
+    RotatingProxySession,
+    create_job_post,
+    detail_executor,
+    markdown_converter,
+)
+
+from .test_iter_jobs import FakeScraper
+
+
+class FakeResponse:
+    status_code = 200
+    headers: ClassVar[dict[str, str]] = {}
+    content = b"x" * 100
+
+
+class InstrumentedScraper(FakeScraper):
+    def iter_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobPost]]:
+        self.scraper_input = scraper_input
+        session = RotatingProxySession()
+
+        def fetch(cursor: int) -> tuple[list[int], int | None]:
+            session.send_with_policy("https://metrics.example.com/", FakeResponse, RetryPolicy())
+            return [cursor * 2, cursor * 2 + 1], cursor + 1 if cursor < 2 else None
+
+        with closing(self.paginate(fetch, cursor=0)) as pages:
+            for items in pages:
+                yield list(detail_executor().map(self._process_job, items))
+
+    @timed("parse")
+    def _process_job(self, i: int) -> JobPost:
+        count("detail_requests")
+        return create_job_post(
+            id=f"indeed-{i}",
+            title=f"Engineer {i}",
+            company_name="Acme",
+            description=markdown_converter(f"<p>Job <b>{i}</b></p>"),
+            job_url=f"https://example.com/indeed/{i}",
+            location=None,
+        )
+
+
+def test_stage_time_excludes_nested_stages():
+    site_metrics = SiteMetrics()
+    with site_metrics.stage("parse"):
+        time.sleep(0.02)
+        with site_metrics.stage("markdown"):
+            time.sleep(0.05)
+    assert 0.05 <= site_metrics.seconds["markdown"] < 0.07
+    assert 0.02 <= site_metrics.seconds["parse"] < 0.04
+
+
+def test_scrape_jobs_collects_metrics(monkeypatch):
+    monkeypatch.setitem(jobspy2.SCRAPER_MAPPING, Site.INDEED, InstrumentedScraper)
+    jobs = scrape_jobs(site_name="indeed", search_term="engineer", results_wanted=6, metrics=True)
+    assert len(jobs) == 6
+    indeed: dict[str, Any] = jobs.attrs["metrics"]["indeed"]
+    assert (indeed["pages"], indeed["requests"], indeed["detail_requests"], indeed["retries"]) == (3, 3, 6, 0)
+    assert indeed["bytes"] == 300
+    assert indeed["latency"]["count"] == 3
+    assert sum(indeed["latency"]["buckets"].values()) == 3
+    assert all(indeed["seconds"][stage] > 0 for stage in ("request", "parse", "markdown", "construct", "postprocess"))
+
+    assert "metrics" not in scrape_jobs(site_name="indeed", search_term="engineer").attrs
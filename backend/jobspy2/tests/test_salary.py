@@ -0,0 +1,90 @@
+import pandas as pd
+import pytest
+
+from jobspy2 import _process_job_data, extract_salaries, extract_salary
+from jobspy2.jobs import CompensationInterval, Country
+from jobspy2.salary import extract_local_salary, salary_country
+
+DESCRIPTIONS = [
+    "Pay: $25 - $40 per hour",
+    "Salary $120k-150K plus equity, or $90 - $100 for contractors",
+    "$4,500.50 – $6,000 a month",  # noqa: RUF001
+    "$1.5k - 2k",
+    "Up to $90,000",
+    "$20 - $0",
+    "$5 - $10",
+    "$800,000 - $900,000",
+    "no pay listed",
+    "",
+    None,
+]
+
+
+@pytest.mark.parametrize("enforce_annual_salary", [False, True])
+def test_extract_salaries_matches_extract_salary(enforce_annual_salary):
+    salaries = extract_salaries(
+        pd.Series(DESCRIPTIONS, index=range(10, 21)), enforce_annual_salary=enforce_annual_salary
+    )
+    assert list(salaries.index) == list(range(10, 21))
+    rows = [tuple(None if pd.isna(value) else value for value in row) for row in salaries.itertuples(index=False)]
+    expected = [extract_salary(text, enforce_annual_salary=enforce_annual_salary) for text in DESCRIPTIONS]
+    assert rows == expected
+    assert any(row[0] is not None for row in expected)
+
+
+def test_extract_salaries_values():
+    salaries = extract_salaries(DESCRIPTIONS[:4])
+    assert list(salaries["interval"]) == [
+        CompensationInterval.HOURLY,
+        CompensationInterval.YEARLY,
+        CompensationInterval.MONTHLY,
+        CompensationInterval.MONTHLY,
+    ]
+    assert list(salaries["min_amount"]) == [25, 120000, 4500, 1000]
+    assert extract_salaries([]).empty
+
+
+@pytest.mark.parametrize(
+    ("description", "country", "salary"),
+    [
+        ("Salary: KES 80,000 - 120,000 per month", None, (CompensationInterval.MONTHLY, 80000, 120000, "KES")),
+        ("£30,000 - £40,000 per annum plus bonus", None, (CompensationInterval.YEARLY, 30000, 40000, "GBP")),
+        ("Gehalt 50.000 € - 60.000 € brutto", None, (CompensationInterval.YEARLY, 50000, 60000, "EUR")),
+        ("Stipend 1.500 € pro Monat", None, (CompensationInterval.MONTHLY, 1500, 1500, "EUR")),
+        ("CTC ₹10-15 LPA", None, (CompensationInterval.YEARLY, 1000000, 1500000, "INR")),
+        ("Rs. 5,00,000 - 8,00,000 per annum", None, (CompensationInterval.YEARLY, 500000, 800000, "INR")),
+        ("KSh 150k monthly", None, (CompensationInterval.MONTHLY, 150000, 150000, "KES")),
+        ("€15 - €20 an hour", None, (CompensationInterval.HOURLY, 15, 20, "EUR")),
+        ("$80k - $100k", Country.CANADA, (CompensationInterval.YEARLY, 80000, 100000, "CAD")),
+        ("3 to 5 years of experience, 401k, salary £35,000", None, (None, None, None, None)),
+        ("Team of 10 - 20 RM engineers", None, (None, None, None, None)),
+        ("Looking for 3-5 PHP developers", None, (None, None, None, None)),
+        ("Squads of 5 to 10 € each", None, (None, None, None, None)),
+        ("Pods 4a8 Ft", None, (None, None, None, None)),
+        ("Gaji: RM 3,000 - 5,000", None, (CompensationInterval.MONTHLY, 3000, 5000, "MYR")),
+        ("Salary: 30,000 to 40,000 EUR", None, (CompensationInterval.YEARLY, 30000, 40000, "EUR")),
+    ],
+)
+def test_extract_local_salary(description, country, salary):
+    assert extract_local_salary(description, country) == salary
+
+
+def test_salary_country():
+    assert salary_country(Country.USA, None) is Country.USA
+    assert salary_country(Country.USA, Country.WORLDWIDE) is Country.USA
+    assert salary_country(Country.USA, "GB") is Country.UK
+    assert salary_country(Country.UK, "us") is Country.USA
+    assert salary_country(Country.USA, "Kenya") == "Kenya"
+
+
+def test_description_salary_follows_job_country():
+    description = "Pay: KES 80,000 - 120,000 per month, or $20 - $30 per hour"
+
+    def process(country, location):
+        job = {"job_url": "u", "company_name": "c", "job_type": None, "emails": None}
+        return _process_job_data({**job, "location": location, "description": description}, False, country)
+
+    assert process(Country.USA, None)["currency"] == "USD"
+    nairobi = process(Country.USA, {"city": "Nairobi", "country": "Kenya"})
+    assert (nairobi["min_amount"], nairobi["currency"], nairobi["salary_source"]) == (80000, "KES", "description")
+    assert process(Country.INDIA, None)["currency"] == "KES"
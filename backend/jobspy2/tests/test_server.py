@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import json
+import socket
+import threading
+
+import pytest
+
+import jobspy2
+from jobspy2.scrapers import Site
+from jobspy2.server import ScrapeService, create_server
+
+from .test_iter_jobs import FakeScraper
+
+
+@pytest.fixture
+def server(monkeypatch):
+    monkeypatch.setitem(jobspy2.SCRAPER_MAPPING, Site.INDEED, FakeScraper)
+    server = create_server(port=0, service=ScrapeService(max_workers=2))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    server.service.close()
+
+
+def exchange(address, requests: list[dict | str]) -> list[dict]:
+    with socket.create_connection(address) as connection:
+        for request in requests:
+            line = request if isinstance(request, str) else json.dumps(request)
+            connection.sendall(line.encode() + b"\n")
+        connection.shutdown(socket.SHUT_WR)
+        with connection.makefile("rb") as responses:
+            return [json.loads(line) for line in responses]
+
+
+def test_scrape_over_json_lines(server):
+    responses = exchange(server.server_address, [{"id": 1, "method": "scrape", "params": {"site_name": "indeed"}}])
+    result = responses[0]["result"]
+    assert responses[0]["id"] == 1
+    assert len(result["jobs"]) == 6
+    assert result["site_status"] == {"indeed": "completed"}
+    assert "query_id" not in result["jobs"][0]
+
+
+def test_concurrent_batch_scrapes_reuse_scrapers(server):
+    batch = {"site_name": "indeed", "queries": [{"query_id": "a"}, {"query_id": "b"}]}
+    requests = [{"id": i, "method": "scrape", "params": batch} for i in range(3)]
+    responses = exchange(server.server_address, [*requests, {"id": "s", "method": "stats"}])
+    by_id = {response["id"]: response for response in responses}
+    assert by_id["s"]["result"]["workers"] == 2
+    results = [by_id[i] for i in range(3)]
+    assert [len(response["result"]["jobs"]) for response in results] == [6, 6, 6]
+    assert results[0]["result"]["site_status"] == {"a": {"indeed": "completed"}, "b": {"indeed": "completed"}}
+
+    stats = exchange(server.server_address, [{"method": "stats"}])[0]["result"]
+    assert stats["requests"] == {"queued": 0, "running": 0, "completed": 3, "failed": 0}
+    assert stats["tasks"]["completed"] == 6
+    assert 1 <= stats["idle_scrapers"]["indeed"] <= 2
+
+
+def test_errors_are_reported_per_request(server):
+    responses = exchange(
+        server.server_address,
+        [
+            "not json",
+            {"id": 2, "method": "nope"},
+            {"id": 3, "params": {"site_name": "nowhere"}},
+            {"id": 4, "method": "ping"},
+        ],
+    )
+    by_id = {response["id"]: response for response in responses}
+    assert by_id[None]["error"].startswith("invalid request")
+    assert by_id[2]["error"] == "unknown method: nope"
+    assert by_id[3]["error"].startswith("invalid scrape params")
+    assert by_id[4]["result"] == "pong"
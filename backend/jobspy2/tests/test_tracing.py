@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import json
+from collections import Counter
+
+import jobspy2
+from jobspy2 import scrape_jobs
+from jobspy2.scrapers import Site
+from jobspy2.tracing import Tracer
+
+from .test_metrics import InstrumentedScraper
+
+
+def test_tracer_records_complete_events():
+    tracer = Tracer()
+    with tracer.span("outer"), tracer.span("inner", site="indeed"):
+        pass
+    trace = tracer.trace()
+    metadata, outer, inner = trace["traceEvents"]
+    assert metadata["ph"] == "M"
+    assert (outer["name"], inner["name"], inner["args"]) == ("outer", "inner", {"site": "indeed"})
+    assert outer["ts"] <= inner["ts"] and inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+
+
+def test_scrape_jobs_writes_trace(monkeypatch, tmp_path):
+    monkeypatch.setitem(jobspy2.SCRAPER_MAPPING, Site.INDEED, InstrumentedScraper)
+    path = tmp_path / "trace.json"
+    scrape_jobs(site_name="indeed", search_term="engineer", results_wanted=6, trace=path)
+
+    events = json.loads(path.read_text())["traceEvents"]
+    spans = [event for event in events if event["ph"] == "X"]
+    names = Counter(event["name"] for event in spans)
+    assert names["scrape_jobs"] == names["site"] == 1
+    # the last call finds no further page
+    assert names["page"] == 4
+    assert names["request"] == 3
+    assert names["parse"] == names["markdown"] == names["construct"] == 6
+    assert {event["args"]["url"] for event in spans if event["name"] == "request"} == {"https://metrics.example.com/"}
+    # pages are requested on the prefetch pool and jobs parsed on the detail pool
+    threads = {event["args"]["name"] for event in events if event["ph"] == "M"}
+    assert any(name.startswith("jobspy-prefetch") for name in threads)
+    assert any(name.startswith("jobspy-detail") for name in threads)